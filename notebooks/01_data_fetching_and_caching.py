@@ -67,10 +67,12 @@ print(f"Project root: {project_root}")
 print(f"Cache directory: {project_root / 'data' / 'cache'}")
 
 # %%
+import numpy as np
+
 from src.cache.manager import CacheManager
 from src.config.loader import load_config
 from src.data.price_manager import PriceDataManager
-from src.data.provider_manager import ProviderManager
+from src.data.provider_manager import get_provider_manager
 
 # Initialize configuration
 config = load_config()
@@ -89,7 +91,8 @@ print("✅ CacheManager initialized")
 print(f"  - Cache directory: {cache_dir}")
 
 # Initialize provider manager
-provider_manager = ProviderManager(
+# Shared instance: re-running this cell reuses the initialized providers
+provider_manager = get_provider_manager(
     primary_provider=config.data.primary_provider,
     backup_providers=config.data.backup_providers,
     db_path=str(project_root / config.database.db_path),
@@ -107,16 +110,17 @@ print("  - Primary provider: Yahoo Finance")
 ticker = "AAPL"
 print(f"Fetching price data for {ticker}...")
 
-start_date = datetime.now() - timedelta(days=30)
-end_date = datetime.now()
+now = datetime.now()
+start_date = now - timedelta(days=30)
+end_date = now
 
 price_data = provider_manager.get_stock_prices(ticker=ticker, period="30d")
 
 if price_data:
     print(f"✅ Fetched {len(price_data)} price records for {ticker}")
     print("\nLast 5 records:")
-    for price in price_data[-5:]:
-        print(f"  {price.date}: ${price.close_price:.2f}")
+    for row in price_data.tail(5):
+        print(f"  {row['date'].astype('datetime64[D]')}: ${row['close']:.2f}")
 else:
     print(f"❌ Failed to fetch price data for {ticker}")
 
@@ -144,23 +148,36 @@ price_manager = PriceDataManager(prices_dir=project_root / "data" / "cache" / "p
 print("✅ PriceDataManager initialized (production caching)")
 print(f"  - Cache directory: {price_manager.prices_dir}")
 
-# Check what's in the cache
+# Check what's in the cache (one directory walk, reused by later cells)
 cache_dir_path = project_root / "data" / "cache"
 prices_dir = cache_dir_path / "prices"
+cache_index = cache_manager.index()
 
 print("\nCache directory structure:")
 print(f"{'=' * 60}")
 
 if prices_dir.exists():
-    csv_files = list(prices_dir.glob("*.csv"))
+    csv_files = [
+        path
+        for files in cache_index.values()
+        for path in files
+        if path.parent == prices_dir and path.suffix == ".csv"
+    ]
     if csv_files:
+        csv_files.sort()
+        # Format all modification times in one NumPy pass instead of per-file strftime
+        # One stat() per file supplies both size and mtime
+        stats = [csv_file.stat() for csv_file in csv_files]
+        mtimes = np.array([st.st_mtime for st in stats], dtype="float64")
+        modified_times = np.char.replace(
+            np.datetime_as_string(mtimes.astype("datetime64[s]"), unit="s"), "T", " "
+        )
         print(f"Found {len(csv_files)} cached ticker(s):")
-        for csv_file in sorted(csv_files):
-            file_size = csv_file.stat().st_size / 1024  # KB
-            modified_time = datetime.fromtimestamp(csv_file.stat().st_mtime)
+        for csv_file, st, modified_time in zip(csv_files, stats, modified_times, strict=True):
+            file_size = st.st_size / 1024  # KB
             print(f"\n  📄 {csv_file.name}")
             print(f"     Size: {file_size:.2f} KB")
-            print(f"     Modified: {modified_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"     Modified: {modified_time} UTC")
 
             # Show date range if file has data
             try:
@@ -213,9 +230,9 @@ else:
 import time
 
 # Read from CSV cache (should be very fast)
-start_time = time.time()
+start_time = time.perf_counter()
 cached_df = price_manager.get_prices(ticker)
-cache_read_time = time.time() - start_time
+cache_read_time = time.perf_counter() - start_time
 
 if cached_df is not None and not cached_df.empty:
     print(f"✅ Read {len(cached_df)} records from CSV cache in {cache_read_time:.4f}s")
@@ -234,9 +251,9 @@ else:
 import time
 
 # First fetch (should use cache)
-start_time = time.time()
+start_time = time.perf_counter()
 price_data_cached = provider_manager.get_stock_prices(ticker=ticker, period="30d")
-cached_fetch_time = time.time() - start_time
+cached_fetch_time = time.perf_counter() - start_time
 
 print(f"✅ Cached fetch completed in {cached_fetch_time:.4f} seconds")
 print("  - This should be very fast (< 0.1s) because data is cached")
@@ -259,35 +276,17 @@ if company_info:
     print(f"  - Industry: {company_info.get('industry', 'N/A')}")
 
     print("\nKey Metrics:")
-    market_cap = company_info.get("market_cap")
-    if market_cap:
-        print(f"  - Market Cap: ${market_cap / 1e9:.2f}B")
-    else:
-        print("  - Market Cap: N/A")
-
-    pe_ratio = company_info.get("pe_ratio")
-    if pe_ratio:
-        print(f"  - P/E Ratio: {pe_ratio:.2f}")
-    else:
-        print("  - P/E Ratio: N/A")
-
-    eps = company_info.get("eps")
-    if eps:
-        print(f"  - EPS: ${eps:.2f}")
-    else:
-        print("  - EPS: N/A")
-
-    revenue = company_info.get("revenue")
-    if revenue:
-        print(f"  - Revenue: ${revenue / 1e9:.2f}B")
-    else:
-        print("  - Revenue: N/A")
-
-    profit_margin = company_info.get("profit_margin")
-    if profit_margin:
-        print(f"  - Profit Margin: {profit_margin * 100:.2f}%")
-    else:
-        print("  - Profit Margin: N/A")
+    # (label, key, format, scale) - check against None so a 0.0 metric is still shown
+    key_metrics = (
+        ("Market Cap", "market_cap", "${:.2f}B", 1e-9),
+        ("P/E Ratio", "pe_ratio", "{:.2f}", 1),
+        ("EPS", "eps", "${:.2f}", 1),
+        ("Revenue", "revenue", "${:.2f}B", 1e-9),
+        ("Profit Margin", "profit_margin", "{:.2f}%", 100),
+    )
+    for label, key, fmt, scale in key_metrics:
+        value = company_info.get(key)
+        print(f"  - {label}: {fmt.format(value * scale) if value is not None else 'N/A'}")
 else:
     print(f"❌ Failed to fetch company information for {ticker}")
 
@@ -339,22 +338,28 @@ for data_type, ttl_seconds in cache_ttls.items():
 # %% [markdown]
 # ## Test 6: Multiple Tickers Batch Fetch
 #
-# Let's test fetching data for multiple tickers:
+# Let's test fetching data for multiple tickers in a single batched request:
 
 # %%
 tickers = ["AAPL", "MSFT", "GOOGL"]
 print(f"Fetching price data for {len(tickers)} tickers: {', '.join(tickers)}")
 print(f"{'=' * 60}")
 
-for ticker in tickers:
-    start_time = time.time()
-    price_data = provider_manager.get_stock_prices(ticker=ticker, period="30d")
-    fetch_time = time.time() - start_time
+# Single batched request instead of one round-trip per ticker
+start_time = time.perf_counter()
+results = provider_manager.get_stock_prices_batch(tickers, "30d")
+fetch_time = time.perf_counter() - start_time
 
+# Build the report first and write it in one call
+rows = []
+for ticker in tickers:
+    price_data = results.get(ticker)
     if price_data:
-        print(f"✅ {ticker:6} - {len(price_data):3} records - {fetch_time:.4f}s")
+        rows.append(f"✅ {ticker:6} - {len(price_data):3} records")
     else:
-        print(f"❌ {ticker:6} - Failed - {fetch_time:.4f}s")
+        rows.append(f"❌ {ticker:6} - Failed")
+rows.append(f"\nBatch fetch completed in {fetch_time:.4f}s")
+print("\n".join(rows))
 
 # %% [markdown]
 # ## Summary
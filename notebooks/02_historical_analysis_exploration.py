@@ -45,25 +45,37 @@ sys.path.insert(0, str(project_root))
 print(f"Project root: {project_root}")
 
 # %%
+import numpy as np
+import pandas as pd
+
 from src.analysis.signal_creator import SignalCreator
 from src.cache.manager import CacheManager
 from src.config.loader import load_config
 from src.data.price_manager import PriceDataManager
-from src.data.provider_manager import ProviderManager
+from src.data.provider_manager import get_provider_manager
+from src.data.repository import RecommendationsRepository
 
 # Initialize configuration
 config = load_config()
 cache_dir = str(project_root / "data" / "cache")
 cache_manager = CacheManager(cache_dir)
-provider_manager = ProviderManager(
+# Shared instance: re-running this cell reuses the initialized providers
+provider_manager = get_provider_manager(
     primary_provider=config.data.primary_provider,
     backup_providers=config.data.backup_providers,
     db_path=str(project_root / config.database.db_path),
 )
 price_manager = PriceDataManager(prices_dir=str(project_root / "data" / "cache" / "prices"))
+# Load the window used by the test cases below once; date lookups are then served from memory
+price_manager.prefetch_window(
+    tickers=["NVDA", "AAPL", "MSFT"],
+    start_date=datetime(2025, 6, 1),
+    end_date=datetime(2025, 9, 30),
+)
 from src.data.repository import Repository  # type: ignore[import-not-found]
 
 repository = Repository(str(project_root / config.database.db_path))
+recommendations_repository = RecommendationsRepository(project_root / config.database.db_path)
 
 print("✅ Components initialized")
 
@@ -96,8 +108,8 @@ else:
 # Let's fetch the current price to ensure we're not using future information:
 
 # %%
-# Fetch current/latest price
-latest_prices = provider_manager.get_stock_prices(ticker=ticker, period="5d")
+# Fetch current/latest price (prices only, no company name lookup)
+latest_prices = provider_manager.get_stock_prices(ticker=ticker, period="5d", fetch_metadata=False)
 
 if latest_prices:
     latest_price = latest_prices[-1]
@@ -137,26 +149,24 @@ test_cases = [
 print("Testing multiple historical dates:")
 print(f"{'=' * 60}")
 
-for test_case in test_cases:
-    ticker = test_case["ticker"]
-    date_str = test_case["date"]
-    expected_min, expected_max = test_case["expected_range"]
-
-    target_date = datetime.strptime(date_str, "%Y-%m-%d")
-
-    price = price_manager.get_price_at_date(ticker=ticker, target_date=target_date)
-
-    if price:
-        is_in_range = expected_min <= price["close"] <= expected_max
-        status = "✅" if is_in_range else "⚠️"
-
-        print(f"{status} {ticker:6} on {date_str}: ${price['close']:.2f}")
-        if not is_in_range:
-            print(f"    Expected range: ${expected_min}-${expected_max}")
-    else:
-        print(f"❌ {ticker:6} on {date_str}: No price found")
+# Look up all (ticker, date) pairs in one batch: each ticker's CSV is read once
+lookups = [(tc["ticker"], datetime.strptime(tc["date"], "%Y-%m-%d")) for tc in test_cases]
+prices = price_manager.get_prices_at_dates(lookups)
+
+# Check every case in one vectorized pass
+results = pd.DataFrame(test_cases)
+results[["expected_min", "expected_max"]] = results["expected_range"].tolist()
+results["close"] = [prices[lookup]["close"] if prices[lookup] else None for lookup in lookups]
+results["in_range"] = results["close"].between(results["expected_min"], results["expected_max"])
+results["status"] = np.select(
+    [results["close"].isna(), results["in_range"]], ["❌", "✅"], default="⚠️"
+)
 
-    print()
+print(
+    results[["status", "ticker", "date", "close", "expected_min", "expected_max"]].to_string(
+        index=False, na_rep="No price found", float_format="{:.2f}".format
+    )
+)
 
 # %% [markdown]
 # ## Test Case 3: Inspect SignalCreator with Historical Date
@@ -206,39 +216,75 @@ print(f"  - Combined Score: {mock_analysis['combined_score']}")
 from_date = datetime(2025, 9, 1)
 to_date = datetime(2025, 9, 30)
 
-historical_recs = repository.get_recommendations(from_date=from_date, to_date=to_date)
+# Count in the database and only load the rows that are shown
+total_recs = sum(
+    recommendations_repository.get_signal_counts(from_date.date(), to_date.date()).values()
+)
+shown_recs = recommendations_repository.get_recommendations_by_date_range(
+    from_date.date(), to_date.date(), limit=5
+)
 
-if historical_recs:
+if shown_recs:
     print(
-        f"Found {len(historical_recs)} historical recommendations from {from_date.strftime('%Y-%m-%d')} to {to_date.strftime('%Y-%m-%d')}"
+        f"Found {total_recs} historical recommendations from {from_date.strftime('%Y-%m-%d')} to {to_date.strftime('%Y-%m-%d')}"
     )
     print(f"{'=' * 60}")
 
-    for rec in historical_recs[:5]:  # Show first 5
-        print(f"\n{rec.ticker:6} - {rec.signal.upper():12} (Confidence: {rec.confidence}%)")
-        print(f"  - Analysis Date: {rec.analysis_date.strftime('%Y-%m-%d')}")
-        print(f"  - Current Price: ${rec.current_price:.2f}")
-        print(
-            f"  - Target Price: ${rec.target_price:.2f}"
-            if rec.target_price
-            else "  - Target Price: N/A"
+    # Match each recommendation to the last close on or before its analysis date (same
+    # 5-day tolerance as get_price_at_date) and compare all rows at once
+    recs_df = pd.DataFrame(shown_recs)
+    recs_df["analysis_date"] = pd.to_datetime(recs_df["analysis_date"])
+    recs_df = recs_df.sort_values("analysis_date")
+    tolerance = pd.Timedelta(days=5)
+    prices_df = pd.concat(
+        [
+            price_manager.get_prices(
+                ticker,
+                start_date=recs_df["analysis_date"].min() - tolerance,
+                end_date=recs_df["analysis_date"].max(),
+                fields=("close",),
+            ).assign(ticker=ticker)
+            for ticker in recs_df["ticker"].unique()
+        ],
+        ignore_index=True,
+    )
+    if prices_df.empty:
+        prices_df = pd.DataFrame(
+            {
+                "date": pd.Series(dtype="datetime64[ns]"),
+                "close": pd.Series(dtype=float),
+                "ticker": pd.Series(dtype=object),
+            }
         )
 
-        # Verify price is from the correct date
-        if rec.analysis_date and rec.current_price:
-            # Fetch the actual historical price for comparison
-            actual_price = price_manager.get_price_at_date(
-                ticker=rec.ticker, target_date=rec.analysis_date
-            )
+    merged = pd.merge_asof(
+        recs_df,
+        prices_df.sort_values("date"),
+        left_on="analysis_date",
+        right_on="date",
+        by="ticker",
+        tolerance=tolerance,
+    )
+    merged["diff"] = (merged["current_price"] - merged["close"]).abs()
+    merged["status"] = np.select(
+        [merged["close"].isna(), merged["diff"] < 0.01, merged["diff"] < 1.0],
+        ["❌ no price", "✅ exact", "✅ close"],
+        default="⚠️ differs",
+    )
 
-            if actual_price:
-                diff = abs(rec.current_price - actual_price["close"])
-                if diff < 0.01:
-                    print("  ✅ Price matches historical data exactly")
-                elif diff < 1.0:
-                    print(f"  ✅ Price matches historical data (diff: ${diff:.2f})")
-                else:
-                    print(f"  ⚠️ Price differs from historical data (diff: ${diff:.2f})")
+    print(
+        merged[
+            [
+                "status",
+                "ticker",
+                "recommendation",
+                "analysis_date",
+                "current_price",
+                "close",
+                "diff",
+            ]
+        ].to_string(index=False, na_rep="-", float_format="{:.2f}".format)
+    )
 else:
     print("No historical recommendations found in database")
     print("💡 Run some historical analysis first using:")
@@ -257,11 +303,15 @@ def check_future_leakage(ticker: str, analysis_date: datetime) -> None:
     print(f"Checking for future leakage: {ticker} on {analysis_date.strftime('%Y-%m-%d')}")
     print(f"{'=' * 60}")
 
-    # Get historical price at analysis date
-    hist_price = price_manager.get_price_at_date(ticker=ticker, target_date=analysis_date)
+    # Get historical price at analysis date (only the fields compared below)
+    hist_price = price_manager.get_price_at_date(
+        ticker=ticker, target_date=analysis_date, fields=("date", "close")
+    )
 
     # Get current price
-    current_prices = provider_manager.get_stock_prices(ticker=ticker, period="1d")
+    current_prices = provider_manager.get_stock_prices(
+        ticker=ticker, period="1d", fetch_metadata=False
+    )
     current_price = current_prices[-1] if current_prices else None
 
     if hist_price and current_price:
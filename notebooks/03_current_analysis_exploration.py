@@ -45,17 +45,22 @@ sys.path.insert(0, str(project_root))
 print(f"Project root: {project_root}")
 
 # %%
+import pandas as pd
+
 from src.analysis.signal_creator import SignalCreator
 from src.cache.manager import CacheManager
 from src.config.loader import load_config
+from src.data.models import PriceSeries
 from src.data.price_manager import PriceDataManager
-from src.data.provider_manager import ProviderManager
+from src.data.provider_manager import get_provider_manager
+from src.data.repository import RecommendationsRepository
 
 # Initialize components
 config = load_config()
 cache_dir = str(project_root / "data" / "cache")
 cache_manager = CacheManager(cache_dir)
-provider_manager = ProviderManager(
+# Shared instance: re-running this cell reuses the initialized providers
+provider_manager = get_provider_manager(
     primary_provider=config.data.primary_provider,
     backup_providers=config.data.backup_providers,
     db_path=str(project_root / config.database.db_path),
@@ -64,6 +69,11 @@ price_manager = PriceDataManager(prices_dir=str(project_root / "data" / "cache"
 from src.data.repository import Repository  # type: ignore[import-not-found]
 
 repository = Repository(str(project_root / config.database.db_path))
+recommendations_repository = RecommendationsRepository(project_root / config.database.db_path)
+
+# Reference time shared by all tests below
+NOW = datetime.now()
+TODAY = NOW.date()
 
 print("✅ Components initialized")
 
@@ -78,8 +88,8 @@ ticker = "AAPL"
 print(f"Fetching latest price for {ticker}")
 print(f"{'=' * 60}")
 
-# Fetch latest price data
-latest_prices = provider_manager.get_stock_prices(ticker=ticker, period="5d")
+# Fetch latest price data (prices only, no company name lookup)
+latest_prices = provider_manager.get_stock_prices(ticker=ticker, period="5d", fetch_metadata=False)
 
 if latest_prices:
     # Get the most recent price
@@ -94,7 +104,7 @@ if latest_prices:
     print(f"  - Low: ${latest_price.low_price:.2f}")
 
     # Check how recent this data is
-    days_old = (datetime.now().date() - latest_price.date).days
+    days_old = (TODAY - latest_price.date).days
     print(f"\nData freshness: {days_old} days old")
 
     if days_old == 0:
@@ -123,7 +133,7 @@ print(f"{'=' * 60}")
 
 # Mock analysis results for current date
 ticker = "AAPL"
-current_date = datetime.now()
+current_date = NOW
 
 mock_analysis = {
     "ticker": ticker,
@@ -179,34 +189,33 @@ print("   - Calculates confidence based on factor agreement")
 from datetime import timedelta
 
 # Get recommendations from the last 7 days
-from_date = datetime.now() - timedelta(days=7)
-to_date = datetime.now()
+to_date = NOW
+from_date = NOW - timedelta(days=7)
 
-recent_recs = repository.get_recommendations(from_date=from_date, to_date=to_date)
+# Counting and ranking run in the database; no recommendation rows are loaded
+signal_counts = recommendations_repository.get_signal_counts(from_date.date(), to_date.date())
+total_recs = sum(signal_counts.values())
 
-if recent_recs:
-    print(f"Found {len(recent_recs)} recommendations from last 7 days")
+if total_recs:
+    print(f"Found {total_recs} recommendations from last 7 days")
     print(f"{'=' * 60}")
 
-    # Group by signal type
-    signal_counts = {}
-    for rec in recent_recs:
-        signal_counts[rec.signal] = signal_counts.get(rec.signal, 0) + 1
-
     print("\nSignal distribution:")
     for signal, count in sorted(signal_counts.items()):
-        print(f"  - {signal.upper():12} {count:3} ({count / len(recent_recs) * 100:.1f}%)")
+        print(f"  - {signal.upper():12} {count:3} ({count / total_recs * 100:.1f}%)")
 
     # Show top 5 by confidence
     print("\nTop 5 by confidence:")
-    top_recs = sorted(recent_recs, key=lambda x: x.confidence, reverse=True)[:5]
+    top_recs = recommendations_repository.get_top_by_confidence(
+        from_date.date(), to_date.date(), limit=5
+    )
 
     for i, rec in enumerate(top_recs, 1):
-        print(f"\n{i}. {rec.ticker:6} - {rec.signal.upper():12}")
-        print(f"   Confidence: {rec.confidence}%")
-        print(f"   Analysis Date: {rec.analysis_date.strftime('%Y-%m-%d')}")
-        print(f"   Current Price: ${rec.current_price:.2f}")
-        print(f"   Mode: {rec.analysis_mode}")
+        print(f"\n{i}. {rec['ticker']:6} - {rec['recommendation'].upper():12}")
+        print(f"   Confidence: {rec['confidence']}%")
+        print(f"   Analysis Date: {rec['analysis_date']}")
+        print(f"   Current Price: ${rec['current_price']:.2f}")
+        print(f"   Mode: {rec['analysis_mode']}")
 else:
     print("No recommendations found in database from last 7 days")
     print("💡 Run some analysis first using:")
@@ -225,6 +234,11 @@ if recent_sessions:
     print(f"Found {len(recent_sessions)} recent analysis sessions")
     print(f"{'=' * 60}")
 
+    # Count recommendations for all displayed sessions in one query
+    session_rec_counts = recommendations_repository.get_recommendation_counts_by_session(
+        [session.id for session in recent_sessions[:5]]
+    )
+
     for session in recent_sessions[:5]:
         print(f"\nSession ID: {session.id}")
         print(f"  - Created: {session.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -236,9 +250,7 @@ if recent_sessions:
             duration = (session.completed_at - session.created_at).total_seconds()
             print(f"  - Duration: {duration:.1f} seconds")
 
-        # Count recommendations in this session
-        session_recs = repository.get_recommendations_by_session(session.id)
-        print(f"  - Recommendations: {len(session_recs)}")
+        print(f"  - Recommendations: {session_rec_counts.get(session.id, 0)}")
 else:
     print("No analysis sessions found in database")
     print("💡 Run some analysis first using:")
@@ -281,10 +293,7 @@ comparison = {
 }
 
 # Display comparison table
-for i, aspect in enumerate(comparison["Aspect"]):
-    print(f"{aspect:20} | {comparison['Rule-Based'][i]:30} | {comparison['LLM-Powered'][i]}")
-    if i == 0:
-        print("-" * 80)
+print(pd.DataFrame(comparison).set_index("Aspect").to_string())
 
 # %% [markdown]
 # ## Test 7: Verify Price Data Accuracy
@@ -293,15 +302,12 @@ for i, aspect in enumerate(comparison["Aspect"]):
 
 
 # %%
-def verify_current_price_accuracy(ticker: str) -> None:
-    """Verify that current price data is accurate and recent."""
+def verify_current_price_accuracy(ticker: str, price_data: PriceSeries | None) -> None:
+    """Verify that already fetched current price data is accurate and recent."""
 
     print(f"Verifying current price accuracy for {ticker}")
     print(f"{'=' * 60}")
 
-    # Fetch price data
-    price_data = provider_manager.get_stock_prices(ticker=ticker, period="5d")
-
     if price_data:
         latest = price_data[-1]
 
@@ -310,7 +316,7 @@ def verify_current_price_accuracy(ticker: str) -> None:
         print(f"  - Close: ${latest.close_price:.2f}")
 
         # Check data freshness
-        age_days = (datetime.now().date() - latest.date).days
+        age_days = (TODAY - latest.date).days
         print(f"  - Age: {age_days} days")
 
         # Check if price is reasonable (not zero or negative)
@@ -331,9 +337,11 @@ def verify_current_price_accuracy(ticker: str) -> None:
         return None
 
 
-# Test with multiple tickers
-for ticker in ["AAPL", "MSFT", "GOOGL"]:
-    verify_current_price_accuracy(ticker)
+# Test with multiple tickers, fetched together in one batched request
+tickers = ["AAPL", "MSFT", "GOOGL"]
+batch_prices = provider_manager.get_stock_prices_batch(tickers, period="5d", fetch_metadata=False)
+for ticker in tickers:
+    verify_current_price_accuracy(ticker, batch_prices.get(ticker))
     print()
 
 # %% [markdown]
@@ -46,54 +46,52 @@ sys.path.insert(0, str(project_root))
 print(f"Project root: {project_root}")
 
 # %%
-from src.cache.manager import CacheManager
+import heapq
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.cache.manager import CacheManager, price_ttl_hours
 from src.config.loader import load_config
 from src.data.price_manager import PriceDataManager
-from src.data.provider_manager import ProviderManager
+from src.data.repository import RecommendationsRepository
 
 # Initialize components
 config = load_config()
 cache_dir = str(project_root / "data" / "cache")
 cache_manager = CacheManager(cache_dir)
-provider_manager = ProviderManager(
-    primary_provider=config.data.primary_provider,
-    backup_providers=config.data.backup_providers,
-    db_path=str(project_root / config.database.db_path),
-)
 price_manager = PriceDataManager(prices_dir=str(project_root / "data" / "cache" / "prices"))
 from src.data.repository import Repository  # type: ignore[import-not-found]
 
 repository = Repository(str(project_root / config.database.db_path))
+recommendations_repository = RecommendationsRepository(project_root / config.database.db_path)
+
+# Reference time shared by all cells below
+NOW = datetime.now()
+TODAY = NOW.date()
 
 print("✅ Components initialized")
 
 # %% [markdown]
 # ## Understanding Price Tracking
 #
-# Let's first understand how price tracking works:
-
-# %%
-print("Price Tracking Architecture")
-print(f"{'=' * 80}\n")
-
-print("Components:")
-print("  1. PriceDataManager")
-print("     - Manages unified CSV storage of price data")
-print("     - Location: data/prices/{ticker}.csv")
-print("     - Downloads and caches historical prices")
-print()
-print("  2. Repository (price_tracking table)")
-print("     - Stores daily price snapshots for recommendations")
-print("     - Links to recommendation_id")
-print("     - Enables historical performance analysis")
-print()
-print("  3. Track Performance Command")
-print("     - Runs daily to update prices for active recommendations")
-print("     - Command: uv run python -m src.main track-performance")
-print()
-print("  4. Performance Report Command")
-print("     - Generates performance metrics and reports")
-print("     - Command: uv run python -m src.main performance-report")
+# Price tracking is built from four components:
+#
+# 1. **PriceDataManager**
+#    - Manages unified CSV storage of price data
+#    - Location: `data/prices/{ticker}.csv`
+#    - Downloads and caches historical prices
+# 2. **Repository** (`price_tracking` table)
+#    - Stores daily price snapshots for recommendations
+#    - Links to `recommendation_id`
+#    - Enables historical performance analysis
+# 3. **Track Performance Command**
+#    - Runs daily to update prices for active recommendations
+#    - Command: `uv run python -m src.main track-performance`
+# 4. **Performance Report Command**
+#    - Generates performance metrics and reports
+#    - Command: `uv run python -m src.main performance-report`
 
 # %% [markdown]
 # ## Get Active Recommendations
@@ -104,32 +102,43 @@ print("     - Command: uv run python -m src.main performance-report")
 
 # Get recommendations from last 90 days
 max_age_days = 90
-from_date = datetime.now() - timedelta(days=max_age_days)
+from_date = NOW - timedelta(days=max_age_days)
 
-# Filter for actionable signals (buy, strong_buy)
-active_recs = repository.get_recommendations(from_date=from_date)
-buy_recs = [r for r in active_recs if r.signal in ["buy", "strong_buy"]]
+# Count all signals in SQL, and only load the actionable ones (buy, strong_buy)
+signal_counts = recommendations_repository.get_signal_counts(from_date.date(), TODAY)
+buy_recs = repository.get_recommendations(from_date=from_date, signals=("buy", "strong_buy"))
 
 print(f"Active Recommendations (last {max_age_days} days)")
 print(f"{'=' * 80}")
-print(f"Total recommendations: {len(active_recs)}")
+print(f"Total recommendations: {sum(signal_counts.values())}")
 print(f"Buy/Strong Buy signals: {len(buy_recs)}")
 print()
 
 if buy_recs:
     # Show top 10 by confidence
-    top_recs = sorted(buy_recs, key=lambda x: x.confidence, reverse=True)[:10]
+    top_recs = heapq.nlargest(10, buy_recs, key=lambda x: x.confidence)
 
     print("Top 10 BUY recommendations by confidence:")
     print("-" * 80)
-    print(f"{'Ticker':8} {'Signal':12} {'Confidence':>11} {'Date':12} {'Price':>10}")
-    print("-" * 80)
-
-    for rec in top_recs:
-        print(
-            f"{rec.ticker:8} {rec.signal.upper():12} {rec.confidence:>10.1f}% "
-            f"{rec.analysis_date.strftime('%Y-%m-%d'):12} ${rec.current_price:>9.2f}"
+    top_df = pd.DataFrame(
+        {
+            "Ticker": [rec.ticker for rec in top_recs],
+            "Signal": [rec.signal.upper() for rec in top_recs],
+            "Confidence": [rec.confidence for rec in top_recs],
+            "Date": [rec.analysis_date for rec in top_recs],
+            "Price": [rec.current_price for rec in top_recs],
+        }
+    )
+    print(
+        top_df.to_string(
+            index=False,
+            formatters={
+                "Confidence": "{:.1f}%".format,
+                "Date": "{:%Y-%m-%d}".format,
+                "Price": "${:.2f}".format,
+            },
         )
+    )
 else:
     print("⚠️ No BUY recommendations found in last 90 days")
     print("💡 Run some analysis first:")
@@ -146,16 +155,18 @@ if buy_recs:
     print(f"{'=' * 80}\n")
 
     # Get unique tickers
-    tickers = list(set(r.ticker for r in buy_recs))
+    tickers = sorted({r.ticker for r in buy_recs})
     print(f"Unique tickers: {len(tickers)}")
-    print(f"Tickers: {', '.join(sorted(tickers)[:10])}{'...' if len(tickers) > 10 else ''}")
+    print(f"Tickers: {', '.join(tickers[:10])}{'...' if len(tickers) > 10 else ''}")
     print()
 
-    # Fetch latest prices for each ticker
+    # Fetch latest prices for all tickers at once; the cells below reuse them
+    latest_prices = price_manager.get_latest_prices(tickers)
     price_updates = []
+    lines = []
 
     for ticker in tickers[:5]:  # Show first 5 as example
-        latest_price = price_manager.get_latest_price(ticker)
+        latest_price = latest_prices[ticker]
 
         if latest_price:
             price_updates.append(
@@ -165,10 +176,11 @@ if buy_recs:
                     "price": latest_price["close"],
                 }
             )
-            print(f"✅ {ticker:6} ${latest_price['close']:>8.2f} ({latest_price['date']})")
+            lines.append(f"✅ {ticker:6} ${latest_price['close']:>8.2f} ({latest_price['date']})")
         else:
-            print(f"❌ {ticker:6} - Failed to fetch price")
+            lines.append(f"❌ {ticker:6} - Failed to fetch price")
 
+    print("\n".join(lines))
     print()
     print(f"Successfully fetched prices for {len(price_updates)}/{len(tickers[:5])} tickers")
 
@@ -177,70 +189,92 @@ if buy_recs:
 #
 # Let's calculate returns for tracked recommendations:
 
+
 # %%
-returns_data = []
-if buy_recs:
-    print("Return Calculation")
-    print(f"{'=' * 80}\n")
+@dataclass
+class ReturnsTable:
+    """Returns of tracked recommendations, one NumPy array per field."""
 
-    for rec in buy_recs[:10]:  # Analyze first 10
-        # Get latest price
-        latest_price = price_manager.get_latest_price(rec.ticker)
+    ticker: np.ndarray
+    entry: np.ndarray
+    current: np.ndarray
+    days: np.ndarray
+    confidence: np.ndarray
 
-        if latest_price and rec.current_price > 0:
-            # Calculate return
-            price_change = latest_price["close"] - rec.current_price
-            return_pct = (price_change / rec.current_price) * 100
+    def __len__(self) -> int:
+        return len(self.ticker)
 
-            # Calculate days held
-            days_held = (latest_price["date"] - rec.analysis_date.date()).days
+    @property
+    def return_pct(self) -> np.ndarray:
+        return (self.current - self.entry) / self.entry * 100.0
 
-            returns_data.append(
-                {
-                    "ticker": rec.ticker,
-                    "entry_price": rec.current_price,
-                    "current_price": latest_price["close"],
-                    "return_pct": return_pct,
-                    "days_held": days_held,
-                    "signal": rec.signal,
-                    "confidence": rec.confidence,
-                }
-            )
 
-    if returns_data:
-        # Sort by return percentage
-        returns_data.sort(key=lambda x: x["return_pct"], reverse=True)
+returns_table: ReturnsTable | None = None
+if buy_recs:
+    print("Return Calculation")
+    print(f"{'=' * 80}\n")
+
+    # Analyze first 10, using the latest prices fetched above
+    tracked = [
+        (rec, latest_prices[rec.ticker])
+        for rec in buy_recs[:10]
+        if latest_prices[rec.ticker] and rec.current_price > 0
+    ]
+
+    if tracked:
+        returns_table = ReturnsTable(
+            ticker=np.array([rec.ticker for rec, _ in tracked]),
+            entry=np.fromiter((rec.current_price for rec, _ in tracked), float, len(tracked)),
+            current=np.fromiter((price["close"] for _, price in tracked), float, len(tracked)),
+            days=(
+                np.array([price["date"] for _, price in tracked], dtype="datetime64[D]")
+                - np.array([rec.analysis_date for rec, _ in tracked], dtype="datetime64[D]")
+            ).astype(int),
+            confidence=np.fromiter((rec.confidence for rec, _ in tracked), float, len(tracked)),
+        )
+
+        # Sort by return percentage, highest first
+        order = np.argsort(-returns_table.return_pct, kind="stable")
+        return_pct = returns_table.return_pct[order]
 
         print("Returns Analysis (Top 10):")
         print("-" * 80)
-        print(
-            f"{'Ticker':8} {'Entry':>8} {'Current':>8} {'Return':>8} {'Days':>5} {'Confidence':>11}"
+        returns_df = pd.DataFrame(
+            {
+                "Ticker": returns_table.ticker[order],
+                "Entry": returns_table.entry[order],
+                "Current": returns_table.current[order],
+                "Return": return_pct,
+                "Days": returns_table.days[order],
+                "Confidence": returns_table.confidence[order],
+            }
         )
-        print("-" * 80)
-
-        for item in returns_data:
-            print(
-                f"{item['ticker']:8} "
-                f"${item['entry_price']:>7.2f} "
-                f"${item['current_price']:>7.2f} "
-                f"{item['return_pct']:>7.2f}% "
-                f"{item['days_held']:>5} "
-                f"{item['confidence']:>10.1f}%"
+        print(
+            returns_df.to_string(
+                index=False,
+                formatters={
+                    "Entry": "${:.2f}".format,
+                    "Current": "${:.2f}".format,
+                    "Return": "{:.2f}%".format,
+                    "Confidence": "{:.1f}%".format,
+                },
             )
-
+        )
         print()
 
 # Calculate aggregate metrics
 avg_return: float = 0.0
-if returns_data:
-    avg_return = sum(x["return_pct"] for x in returns_data) / len(returns_data)
-    win_rate = sum(1 for x in returns_data if x["return_pct"] > 0) / len(returns_data) * 100
+if returns_table:
+    return_pct = returns_table.return_pct
+    winners = return_pct > 0
+    avg_return = float(return_pct.mean())
+    win_rate = winners.mean() * 100
 
     print("Aggregate Metrics:")
     print(f"  - Average Return: {avg_return:+.2f}%")
     print(f"  - Win Rate: {win_rate:.1f}%")
-    print(f"  - Winners: {sum(1 for x in returns_data if x['return_pct'] > 0)}")
-    print(f"  - Losers: {sum(1 for x in returns_data if x['return_pct'] <= 0)}")
+    print(f"  - Winners: {winners.sum()}")
+    print(f"  - Losers: {(~winners).sum()}")
 
 # %% [markdown]
 # ## Benchmark Comparison
@@ -248,22 +282,40 @@ if returns_data:
 # Let's compare returns against a benchmark (SPY):
 
 # %%
-if buy_recs and returns_data:
+if buy_recs and returns_table:
     print("Benchmark Comparison (SPY)")
     print(f"{'=' * 80}\n")
 
     # Get SPY prices for the same period
     # Find earliest and latest dates from our recommendations
     earliest_date = min(rec.analysis_date for rec in buy_recs)
-    latest_date = datetime.now()
-
-    # Fetch SPY prices (approximate period)
-    days_diff = (latest_date - earliest_date).days
-    spy_prices = provider_manager.get_stock_prices(ticker="SPY", period=f"{days_diff}d")
+    latest_date = NOW
+
+    # Fetch SPY prices for exactly this range; re-runs on the same day hit the disk cache
+    spy_key = f"prices:SPY:{earliest_date:%Y-%m-%d}:{latest_date:%Y-%m-%d}"
+    spy_closes = cache_manager.get(spy_key)
+    if spy_closes is None:
+        # Providers (and yfinance) are only loaded when the benchmark must be fetched
+        from src.data.provider_manager import get_provider_manager
+
+        # Shared instance: re-running this cell reuses the initialized providers
+        provider_manager = get_provider_manager(
+            primary_provider=config.data.primary_provider,
+            backup_providers=config.data.backup_providers,
+            db_path=str(project_root / config.database.db_path),
+        )
+        spy_prices = provider_manager.get_stock_prices(
+            ticker="SPY",
+            start_date=earliest_date,
+            end_date=latest_date,
+            fetch_metadata=False,
+        )
+        spy_closes = spy_prices["close"]
+        cache_manager.set(spy_key, spy_closes, ttl_hours=price_ttl_hours(config.data.cache_ttl))
 
-    if spy_prices:
-        spy_start = spy_prices[0].close_price
-        spy_end = spy_prices[-1].close_price
+    if len(spy_closes):
+        spy_start = float(spy_closes[0])
+        spy_end = float(spy_closes[-1])
         spy_return = ((spy_end - spy_start) / spy_start) * 100
 
         print("SPY Performance:")
@@ -294,39 +346,30 @@ if buy_recs and returns_data:
 # Let's check if confidence levels correlate with returns:
 
 # %%
-if returns_data:
+if returns_table:
     print("Confidence Calibration Analysis")
     print(f"{'=' * 80}\n")
 
-    # Group by confidence buckets
-    buckets = {
-        "60-70%": [],
-        "70-80%": [],
-        "80-90%": [],
-        "90-100%": [],
-    }
-
-    for item in returns_data:
-        conf = item["confidence"]
-        if 60 <= conf < 70:
-            buckets["60-70%"].append(item["return_pct"])
-        elif 70 <= conf < 80:
-            buckets["70-80%"].append(item["return_pct"])
-        elif 80 <= conf < 90:
-            buckets["80-90%"].append(item["return_pct"])
-        elif 90 <= conf <= 100:
-            buckets["90-100%"].append(item["return_pct"])
+    # Group by confidence buckets: bin 0 is below 60%, bins 1-4 are the buckets below
+    bucket_names = ["60-70%", "70-80%", "80-90%", "90-100%"]
+    return_pct = returns_table.return_pct
+    bins = np.digitize(returns_table.confidence, [60, 70, 80, 90])
+    counts = np.bincount(bins, minlength=5)[1:]
+    return_sums = np.bincount(bins, weights=return_pct, minlength=5)[1:]
+    win_counts = np.bincount(bins, weights=return_pct > 0, minlength=5)[1:]
 
     print("Average Return by Confidence Level:")
     print("-" * 60)
     print(f"{'Confidence':15} {'Count':>8} {'Avg Return':>12} {'Win Rate':>10}")
     print("-" * 60)
 
-    for bucket_name, returns in buckets.items():
-        if returns:
-            avg_ret = sum(returns) / len(returns)
-            win_rate = sum(1 for r in returns if r > 0) / len(returns) * 100
-            print(f"{bucket_name:15} {len(returns):>8} {avg_ret:>11.2f}% {win_rate:>9.1f}%")
+    for bucket_name, count, return_sum, win_count in zip(
+        bucket_names, counts, return_sums, win_counts, strict=True
+    ):
+        if count:
+            avg_ret = return_sum / count
+            win_rate = win_count / count * 100
+            print(f"{bucket_name:15} {count:>8} {avg_ret:>11.2f}% {win_rate:>9.1f}%")
         else:
             print(f"{bucket_name:15} {0:>8} {'N/A':>12} {'N/A':>10}")
 
@@ -339,16 +382,14 @@ if returns_data:
 # Let's calculate risk-adjusted metrics (Sharpe ratio):
 
 # %%
-if returns_data:
+if returns_table:
     print("Risk-Adjusted Metrics")
     print(f"{'=' * 80}\n")
 
     # Calculate standard deviation of returns (volatility)
-    returns = [x["return_pct"] for x in returns_data]
-    mean_return = sum(returns) / len(returns)
-
-    variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-    std_dev = variance**0.5
+    return_pct = returns_table.return_pct
+    mean_return = return_pct.mean()
+    std_dev = return_pct.std(ddof=0)
 
     # Calculate Sharpe ratio (assuming 0% risk-free rate for simplicity)
     sharpe_ratio = mean_return / std_dev if std_dev > 0 else 0
@@ -389,16 +430,25 @@ if buy_recs:
 
         print(f"Found {len(tracking_records)} price tracking records:")
         print("-" * 60)
-        print(f"{'Date':12} {'Price':>10} {'Benchmark':>10} {'Days Since':>12}")
-        print("-" * 60)
-
-        for record in tracking_records[:10]:  # Show first 10
-            days_since = (record.tracking_date - sample_rec.analysis_date.date()).days
-            print(
-                f"{record.tracking_date} ${record.price:>9.2f} ${record.benchmark_price:>9.2f} "
-                if record.benchmark_price
-                else " N/A " * 10 + f"{days_since:>12}"
+        shown_records = tracking_records[:10]  # Show first 10
+        entry_date = sample_rec.analysis_date.date()
+        tracking_df = pd.DataFrame(
+            {
+                "Date": [record.tracking_date for record in shown_records],
+                "Price": [record.price for record in shown_records],
+                "Benchmark": [record.benchmark_price for record in shown_records],
+                "Days Since": [
+                    (record.tracking_date - entry_date).days for record in shown_records
+                ],
+            }
+        )
+        print(
+            tracking_df.to_string(
+                index=False,
+                formatters={"Price": "${:.2f}".format, "Benchmark": "${:.2f}".format},
+                na_rep="N/A",
             )
+        )
 
         print()
         print("💡 Price tracking enables historical performance analysis")
@@ -49,13 +49,14 @@ print(f"Project root: {project_root}")
 from src.cache.manager import CacheManager
 from src.config.loader import load_config
 from src.data.price_manager import PriceDataManager
-from src.data.provider_manager import ProviderManager
+from src.data.provider_manager import get_provider_manager
 
 # Initialize components
 config = load_config()
 cache_dir = str(project_root / "data" / "cache")
 cache_manager = CacheManager(cache_dir)
-provider_manager = ProviderManager(
+# Shared instance: re-running this cell reuses the initialized providers
+provider_manager = get_provider_manager(
     primary_provider=config.data.primary_provider,
     backup_providers=config.data.backup_providers,
     db_path=str(project_root / config.database.db_path),
@@ -16,11 +16,18 @@ Usage:
 
     # Update specific tickers
     uv run python scripts/backfill_ticker_metadata.py --ticker AAPL,MSFT,GOOGL
+
+    # Ignore metadata cached by earlier runs and refetch everything
+    uv run python scripts/backfill_ticker_metadata.py --refresh
+
+    # Show per-ticker details (changed fields, dry-run previews)
+    uv run python scripts/backfill_ticker_metadata.py --dry-run --verbose
 """
 
 import argparse
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import yfinance as yf
@@ -31,6 +38,7 @@ from sqlmodel import select
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.cache.manager import CacheManager
 from src.data.db import DatabaseManager
 from src.data.models import Ticker
 
@@ -38,16 +46,40 @@ from src.data.models import Ticker
 logger.remove()  # Remove default handler
 logger.add(sys.stderr, level="INFO", format="<level>{message}</level>")
 
+# Concurrent metadata requests; kept small to stay polite to Yahoo Finance
+FETCH_WORKERS = 4
+
+# Ticker updates written (and committed) per database round trip
+COMMIT_BATCH_SIZE = 500
+
+# Fetched metadata is reused by re-runs for a week
+METADATA_TTL_HOURS = 168
+
+# Tickers between INFO progress lines; per-ticker details are logged at DEBUG
+PROGRESS_INTERVAL = 50
 
-def fetch_ticker_metadata(symbol: str) -> dict | None:
+
+def fetch_ticker_metadata(
+    symbol: str,
+    cache_manager: CacheManager | None = None,
+    refresh: bool = False,
+) -> dict | None:
     """Fetch metadata for a ticker from yfinance.
 
     Args:
         symbol: Ticker symbol.
+        cache_manager: Optional cache for metadata fetched by earlier runs.
+        refresh: If True, ignore cached metadata (fresh results are still cached).
 
     Returns:
         Dict with metadata fields or None if fetch fails.
     """
+    cache_key = f"ticker_metadata:{symbol}"
+    if cache_manager and not refresh:
+        cached = cache_manager.get(cache_key)
+        if cached:
+            return cached
+
     try:
         ticker_obj = yf.Ticker(symbol)
         info = ticker_obj.info
@@ -61,6 +93,8 @@ def fetch_ticker_metadata(symbol: str) -> dict | None:
             "exchange": info.get("exchange"),
         }
 
+        if cache_manager:
+            cache_manager.set(cache_key, metadata, ttl_hours=METADATA_TTL_HOURS)
         return metadata
 
     except Exception as e:
@@ -91,6 +125,8 @@ def backfill_metadata(
     dry_run: bool = False,
     only_missing: bool = False,
     ticker_symbols: list[str] | None = None,
+    cache_dir: str = "data/cache",
+    refresh: bool = False,
 ) -> None:
     """Backfill metadata for existing tickers.
 
@@ -99,22 +135,24 @@ def backfill_metadata(
         dry_run: If True, preview changes without applying.
         only_missing: If True, only update tickers with all metadata missing.
         ticker_symbols: Optional list of specific tickers to update.
+        cache_dir: Directory for cached metadata.
+        refresh: If True, refetch metadata even if it was cached by an earlier run.
     """
     db = DatabaseManager(db_path)
     db.initialize()
+    fetch = partial(fetch_ticker_metadata, cache_manager=CacheManager(cache_dir), refresh=refresh)
 
     session = db.get_session()
 
     try:
         # Get tickers to update
         if ticker_symbols:
-            # Update specific tickers
-            tickers = []
-            for symbol in ticker_symbols:
-                ticker = session.exec(select(Ticker).where(Ticker.symbol == symbol.upper())).first()
-                if ticker:
-                    tickers.append(ticker)
-                else:
+            # Update specific tickers, looked up in one query
+            symbols = [symbol.upper() for symbol in ticker_symbols]
+            tickers = session.exec(select(Ticker).where(Ticker.symbol.in_(symbols))).all()
+            found = {ticker.symbol for ticker in tickers}
+            for symbol in symbols:
+                if symbol not in found:
                     logger.warning(f"Ticker {symbol} not found in database")
         else:
             # Get all tickers
@@ -137,67 +175,67 @@ def backfill_metadata(
         updated = 0
         failed = 0
         skipped = 0
+        pending: list[dict] = []
+
+        # Fetch metadata on a small thread pool; results arrive in ticker order
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, total)) as executor:
+            fetched = executor.map(fetch, [t.symbol for t in tickers_to_update])
+
+            for i, (ticker, metadata) in enumerate(zip(tickers_to_update, fetched, strict=True), 1):
+                if i % PROGRESS_INTERVAL == 0 or i == total:
+                    logger.info(f"[{i}/{total}] Processed up to {ticker.symbol}")
+                logger.debug(f"[{i}/{total}] Processing {ticker.symbol}...")
+
+                if not metadata:
+                    logger.warning(f"  ✗ Failed to fetch metadata for {ticker.symbol}")
+                    failed += 1
+                    continue
+
+                # Check what changed
+                changes = []
+                if metadata["description"] and metadata["description"] != ticker.description:
+                    changes.append("description")
+                if metadata["sector"] and metadata["sector"] != ticker.sector:
+                    changes.append("sector")
+                if metadata["industry"] and metadata["industry"] != ticker.industry:
+                    changes.append("industry")
+                if metadata["currency"] and metadata["currency"] != ticker.currency:
+                    changes.append("currency")
+                if metadata["exchange"] and metadata["exchange"] != ticker.exchange:
+                    changes.append("exchange")
+
+                if not changes:
+                    logger.debug(f"  ⊘ No changes needed for {ticker.symbol}")
+                    skipped += 1
+                    continue
+
+                # Display changes
+                logger.debug(f"  → Changes: {', '.join(changes)}")
+                if "sector" in changes:
+                    logger.debug(f"     sector: {ticker.sector} → {metadata['sector']}")
+                if "industry" in changes:
+                    logger.debug(f"     industry: {ticker.industry} → {metadata['industry']}")
+                if "exchange" in changes:
+                    logger.debug(f"     exchange: {ticker.exchange} → {metadata['exchange']}")
+
+                # Apply changes (unless dry run)
+                if not dry_run:
+                    pending.append({"id": ticker.id, **metadata})
+                    updated += 1
+                    logger.debug(f"  ✓ Updated {ticker.symbol}")
+                    # Commit in batches so an interrupted run keeps earlier work
+                    if len(pending) >= COMMIT_BATCH_SIZE:
+                        session.bulk_update_mappings(Ticker, pending)
+                        session.commit()
+                        pending.clear()
+                else:
+                    logger.debug(f"  [DRY RUN] Would update {ticker.symbol}")
 
-        for i, ticker in enumerate(tickers_to_update, 1):
-            logger.info(f"[{i}/{total}] Processing {ticker.symbol}...")
-
-            # Fetch metadata
-            metadata = fetch_ticker_metadata(ticker.symbol)
-
-            if not metadata:
-                logger.warning(f"  ✗ Failed to fetch metadata for {ticker.symbol}")
-                failed += 1
-                continue
-
-            # Check what changed
-            changes = []
-            if metadata["description"] and metadata["description"] != ticker.description:
-                changes.append("description")
-            if metadata["sector"] and metadata["sector"] != ticker.sector:
-                changes.append("sector")
-            if metadata["industry"] and metadata["industry"] != ticker.industry:
-                changes.append("industry")
-            if metadata["currency"] and metadata["currency"] != ticker.currency:
-                changes.append("currency")
-            if metadata["exchange"] and metadata["exchange"] != ticker.exchange:
-                changes.append("exchange")
-
-            if not changes:
-                logger.info(f"  ⊘ No changes needed for {ticker.symbol}")
-                skipped += 1
-                continue
-
-            # Display changes
-            logger.info(f"  → Changes: {', '.join(changes)}")
-            if "sector" in changes:
-                logger.debug(f"     sector: {ticker.sector} → {metadata['sector']}")
-            if "industry" in changes:
-                logger.debug(f"     industry: {ticker.industry} → {metadata['industry']}")
-            if "exchange" in changes:
-                logger.debug(f"     exchange: {ticker.exchange} → {metadata['exchange']}")
-
-            # Apply changes (unless dry run)
-            if not dry_run:
-                ticker.name = metadata["name"]
-                ticker.description = metadata["description"]
-                ticker.sector = metadata["sector"]
-                ticker.industry = metadata["industry"]
-                ticker.currency = metadata["currency"]
-                ticker.exchange = metadata["exchange"]
-
-                session.add(ticker)
-                updated += 1
-                logger.info(f"  ✓ Updated {ticker.symbol}")
-            else:
-                logger.info(f"  [DRY RUN] Would update {ticker.symbol}")
-
-            # Rate limiting (1 request per second to be respectful)
-            if i < total:
-                time.sleep(1.0)
-
-        # Commit changes
-        if not dry_run and updated > 0:
+        # Commit remaining changes
+        if pending:
+            session.bulk_update_mappings(Ticker, pending)
             session.commit()
+        if not dry_run and updated > 0:
             logger.success(f"✅ Committed {updated} updates to database")
 
         # Summary
@@ -242,6 +280,19 @@ def main():
         help="Comma-separated list of specific tickers to update (e.g., AAPL,MSFT,GOOGL)",
     )
 
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore metadata cached by earlier runs and refetch from Yahoo Finance",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Log per-ticker details instead of periodic progress only",
+    )
+
     parser.add_argument(
         "--db",
         type=str,
@@ -251,6 +302,10 @@ def main():
 
     args = parser.parse_args()
 
+    if args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level="DEBUG", format="<level>{message}</level>")
+
     # Parse ticker list
     ticker_symbols = None
     if args.ticker:
@@ -262,6 +317,7 @@ def main():
         dry_run=args.dry_run,
         only_missing=args.only_missing,
         ticker_symbols=ticker_symbols,
+        refresh=args.refresh,
     )
 
 
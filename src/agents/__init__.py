@@ -1,14 +1,14 @@
 """Agent definitions for financial analysis."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Ensure data providers are registered on import
 import src.data  # noqa: F401
 
 # Base classes
 from src.agents.base import AgentConfig, BaseAgent
 
-# LLM-powered agents
-from src.agents.llm import AITechnicalAnalysisAgent, HybridAnalysisAgent, HybridAnalysisCrew
-
 # Rule-based analysis modules
 from src.agents.rule_based import (
     FundamentalAnalysisModule,
@@ -17,6 +17,20 @@ from src.agents.rule_based import (
     TechnicalAnalysisModule,
 )
 
+if TYPE_CHECKING:
+    from src.agents.llm import AITechnicalAnalysisAgent, HybridAnalysisAgent, HybridAnalysisCrew
+
+# LLM-powered agents pull in CrewAI and the LLM SDKs, so they are loaded on first access
+_LLM_AGENTS = {"AITechnicalAnalysisAgent", "HybridAnalysisAgent", "HybridAnalysisCrew"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import LLM-powered agents lazily (PEP 562)."""
+    if name in _LLM_AGENTS:
+        return getattr(importlib.import_module("src.agents.llm"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Base classes
     "BaseAgent",
@@ -12,6 +12,7 @@ class AgentConfig(BaseModel):
     max_iterations: int = Field(default=5, ge=1, le=20, description="Maximum iterations")
     allow_delegation: bool = Field(default=False, description="Can delegate to other agents")
     memory: bool = Field(default=True, description="Keep memory of interactions")
+    memory_size: int = Field(default=1024, ge=1, description="Maximum remembered entries")
     verbose: bool = Field(default=False, description="Enable verbose output")
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
@@ -1,6 +1,7 @@
 """Base agent interface and abstract class."""
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Optional
 
 from src.agents.base.config import AgentConfig
@@ -21,7 +22,13 @@ class BaseAgent(ABC):
         """
         self.config = config
         self.tools = tools or []
-        self.memory = {} if config.memory else None
+        # Tools indexed by name for lookups in execute(); the first tool with a name wins
+        self._tools_by_name: dict[str, Any] = {}
+        for tool in self.tools:
+            if hasattr(tool, "name"):
+                self._tools_by_name.setdefault(tool.name, tool)
+        # Bounded by config.memory_size; the least recently used entry is evicted first
+        self.memory: OrderedDict[str, Any] | None = OrderedDict() if config.memory else None
         logger.debug(f"Initialized agent: {config.role}")
 
     @property
@@ -58,8 +65,20 @@ class BaseAgent(ABC):
             tool: Tool instance
         """
         self.tools.append(tool)
+        self._tools_by_name.setdefault(tool.name, tool)
         logger.debug(f"Added tool {tool.name} to {self.role}")
 
+    def get_tool(self, name: str) -> Optional[Any]:
+        """Get a tool by name.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Tool instance or None if not found
+        """
+        return self._tools_by_name.get(name)
+
     def remember(self, key: str, value: Any) -> None:
         """Store information in memory.
 
@@ -69,6 +88,9 @@ class BaseAgent(ABC):
         """
         if self.memory is not None:
             self.memory[key] = value
+            self.memory.move_to_end(key)
+            if len(self.memory) > self.config.memory_size:
+                self.memory.popitem(last=False)
 
     def recall(self, key: str) -> Optional[Any]:
         """Retrieve information from memory.
@@ -79,8 +101,9 @@ class BaseAgent(ABC):
         Returns:
             Value or None if not found
         """
-        if self.memory is not None:
-            return self.memory.get(key)
+        if self.memory is not None and key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
         return None
 
     def __str__(self) -> str:
@@ -1,10 +1,30 @@
 """LLM-powered agents and CrewAI components."""
 
-from src.agents.llm.factory import CrewAIAgentFactory, CrewAITaskFactory
-from src.agents.llm.hybrid import HybridAnalysisAgent, HybridAnalysisCrew
-from src.agents.llm.technical import AITechnicalAnalysisAgent
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.agents.llm.factory import CrewAIAgentFactory, CrewAITaskFactory
+    from src.agents.llm.hybrid import HybridAnalysisAgent, HybridAnalysisCrew
+    from src.agents.llm.technical import AITechnicalAnalysisAgent
+
+# output_models are imported directly when needed; importing them (or any other
+# submodule) must not pull in CrewAI, so the CrewAI-backed names load on first access
+_LAZY_IMPORTS = {
+    "CrewAIAgentFactory": "src.agents.llm.factory",
+    "CrewAITaskFactory": "src.agents.llm.factory",
+    "HybridAnalysisAgent": "src.agents.llm.hybrid",
+    "HybridAnalysisCrew": "src.agents.llm.hybrid",
+    "AITechnicalAnalysisAgent": "src.agents.llm.technical",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import CrewAI-backed components lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# output_models are imported directly when needed
 
 __all__ = [
     "CrewAIAgentFactory",
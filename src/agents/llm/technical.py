@@ -195,10 +195,7 @@ class AITechnicalAnalysisAgent(BaseAgent):
             logger.debug(f"AI technical analysis for {ticker}")
 
             # Get price data
-            price_fetcher = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "PriceFetcher"),
-                None,
-            )
+            price_fetcher = self.get_tool("PriceFetcher")
 
             if not price_fetcher:
                 return {
@@ -223,10 +220,7 @@ class AITechnicalAnalysisAgent(BaseAgent):
                 }
 
             # Calculate technical indicators
-            tech_tool = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "TechnicalIndicator"),
-                None,
-            )
+            tech_tool = self.get_tool("TechnicalIndicator")
 
             if not tech_tool:
                 return {
@@ -57,10 +57,7 @@ class FundamentalAnalysisModule(BaseAgent):
             logger.debug(f"Analyzing fundamentals for {ticker}")
 
             # Get financial data fetcher tool
-            fetcher = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "FinancialDataFetcher"),
-                None,
-            )
+            fetcher = self.get_tool("FinancialDataFetcher")
 
             if not fetcher:
                 return {
@@ -56,10 +56,7 @@ class SentimentAnalysisModule(BaseAgent):
             logger.debug(f"Analyzing sentiment for {ticker}")
 
             # Fetch news
-            news_fetcher = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "NewsFetcher"),
-                None,
-            )
+            news_fetcher = self.get_tool("NewsFetcher")
 
             if not news_fetcher:
                 return {
@@ -88,10 +85,7 @@ class SentimentAnalysisModule(BaseAgent):
                 }
 
             # Analyze sentiment with weighted scoring
-            sentiment_tool = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "SentimentAnalyzer"),
-                None,
-            )
+            sentiment_tool = self.get_tool("SentimentAnalyzer")
 
             if not sentiment_tool:
                 return {
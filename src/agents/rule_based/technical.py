@@ -56,10 +56,7 @@ class TechnicalAnalysisModule(BaseAgent):
             logger.debug(f"Analyzing technical indicators for {ticker}")
 
             # Get price data
-            price_fetcher = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "PriceFetcher"),
-                None,
-            )
+            price_fetcher = self.get_tool("PriceFetcher")
 
             if not price_fetcher:
                 return {
@@ -87,10 +84,7 @@ class TechnicalAnalysisModule(BaseAgent):
                 }
 
             # Get technical indicators
-            tech_tool = next(
-                (t for t in self.tools if hasattr(t, "name") and t.name == "TechnicalIndicator"),
-                None,
-            )
+            tech_tool = self.get_tool("TechnicalIndicator")
 
             if not tech_tool:
                 return {
@@ -23,6 +23,20 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# TechnicalAnalysisOutput fields that describe the analysis rather than indicator values
+_TECHNICAL_INTERPRETATION_FIELDS = frozenset(
+    {
+        "trend_direction",
+        "trend_strength",
+        "momentum_status",
+        "support_level",
+        "resistance_level",
+        "technical_score",
+        "key_findings",
+        "reasoning",
+    }
+)
+
 
 class AnalysisResultNormalizer:
     """Normalizes agent outputs to unified structure.
@@ -516,6 +530,65 @@ class AnalysisResultNormalizer:
             confidence=tech_result.get("confidence"),
         )
 
+    @staticmethod
+    def _extract_from_technical_pydantic(
+        tech_output: TechnicalAnalysisOutput | dict[str, Any],
+    ) -> AnalysisComponentResult:
+        """Extract technical analysis component from structured LLM output.
+
+        Plain dicts (e.g. CrewOutput.pydantic payloads) are validated once here. After
+        that the output is known to be valid, so the result models are built with
+        model_construct() instead of being re-validated.
+
+        Args:
+            tech_output: TechnicalAnalysisOutput from the LLM agent, or its dict form
+        """
+        if isinstance(tech_output, dict):
+            tech_output = TechnicalAnalysisOutput.model_validate(tech_output)
+
+        raw_data = tech_output.model_dump()
+        indicator_values = {
+            field: value
+            for field, value in raw_data.items()
+            if field not in _TECHNICAL_INTERPRETATION_FIELDS
+        }
+
+        return AnalysisComponentResult.model_construct(
+            component="technical",
+            score=float(tech_output.technical_score),
+            raw_data=raw_data,
+            technical_indicators=TechnicalIndicators.model_construct(**indicator_values),
+            reasoning=tech_output.reasoning,
+        )
+
+    @staticmethod
+    def _extract_from_fundamental_pydantic(
+        fund_output: FundamentalAnalysisOutput | dict[str, Any],
+    ) -> AnalysisComponentResult:
+        """Extract fundamental analysis component from structured LLM output.
+
+        Args:
+            fund_output: FundamentalAnalysisOutput from the LLM agent, or its dict form
+        """
+        if isinstance(fund_output, dict):
+            fund_output = FundamentalAnalysisOutput.model_validate(fund_output)
+
+        return AnalysisResultNormalizer._fund_model_to_component(fund_output, None)
+
+    @staticmethod
+    def _extract_from_sentiment_pydantic(
+        sent_output: SentimentAnalysisOutput | dict[str, Any],
+    ) -> AnalysisComponentResult:
+        """Extract sentiment analysis component from structured LLM output.
+
+        Args:
+            sent_output: SentimentAnalysisOutput from the LLM agent, or its dict form
+        """
+        if isinstance(sent_output, dict):
+            sent_output = SentimentAnalysisOutput.model_validate(sent_output)
+
+        return AnalysisResultNormalizer._sent_model_to_component(sent_output, None)
+
     @staticmethod
     def _extract_fundamental_llm(fund_result: dict[str, Any]) -> AnalysisComponentResult:
         """Extract fundamental analysis component from LLM output.
@@ -93,6 +93,7 @@ class SignalCreator:
                 risk_assessment = self._assess_risk(result, portfolio_context)
 
             # Create signal
+            now = datetime.now()
             signal = InvestmentSignal(
                 ticker=ticker,
                 name=result.company_name or ticker,
@@ -114,12 +115,8 @@ class SignalCreator:
                 key_reasons=result.key_reasons,
                 risk=risk_assessment,
                 allocation=None,  # Will be calculated later by allocation module
-                generated_at=datetime.now(),
-                analysis_date=(
-                    analysis_date.strftime("%Y-%m-%d")
-                    if analysis_date
-                    else datetime.now().strftime("%Y-%m-%d")
-                ),
+                generated_at=now,
+                analysis_date=(analysis_date or now).strftime("%Y-%m-%d"),
                 rationale=result.rationale,
                 caveats=result.caveats,
                 metadata=metadata,
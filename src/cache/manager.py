@@ -1,10 +1,16 @@
 """Cache manager for API responses and processed data."""
 
-import json
-from datetime import datetime, timedelta
+import os
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar
+from zoneinfo import ZoneInfo
 
+import numpy as np
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from src.config.schemas import CacheTTLConfig
 from src.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -12,6 +18,77 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Keep files indented for readability; numpy scalars/arrays and non-str keys are
+# serialized natively instead of going through the ``default`` fallback
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Marker stored in the JSON envelope when the payload lives in a sibling .npy file
+_NPY_REF_KEY = "__npy__"
+
+# US regular trading session, used to pick the price cache TTL
+_MARKET_TZ = ZoneInfo("America/New_York")
+_MARKET_OPEN = time(9, 30)
+_MARKET_CLOSE = time(16, 0)
+
+T = TypeVar("T")
+
+
+class _TypedEnvelope(BaseModel, Generic[T]):
+    """Fields of a cache file needed for a typed read; the rest are ignored."""
+
+    data: T
+    expires_at: datetime
+
+
+# Envelope validators keyed by payload type, built once per type so the schema is
+# compiled outside the read path
+_ADAPTERS: dict[Any, TypeAdapter] = {}
+
+
+def _envelope_adapter(tp: Any) -> TypeAdapter:
+    """Get the compiled envelope validator for a payload type.
+
+    Args:
+        tp: Payload type, e.g. ``list[NewsArticle]``
+
+    Returns:
+        TypeAdapter validating a whole cache file whose data is of type tp
+    """
+    adapter = _ADAPTERS.get(tp)
+    if adapter is None:
+        adapter = _ADAPTERS.setdefault(tp, TypeAdapter(_TypedEnvelope[tp]))
+    return adapter
+
+
+def price_ttl_hours(
+    ttl_config: Optional[CacheTTLConfig] = None,
+    now: Optional[datetime] = None,
+) -> int:
+    """Get the TTL for cached recent prices based on the US market session.
+
+    Prices can change while the market is open, so they expire quickly; outside
+    regular trading hours (nights and weekends) they are kept longer.
+
+    Args:
+        ttl_config: Cache TTL settings, defaults to CacheTTLConfig()
+        now: Time to check, defaults to now (naive values are taken as local time)
+
+    Returns:
+        price_data_market_hours during the regular session, else price_data_overnight
+    """
+    ttl_config = ttl_config or CacheTTLConfig()
+    market_now = (now or datetime.now()).astimezone(_MARKET_TZ)
+    is_open = market_now.weekday() < 5 and _MARKET_OPEN <= market_now.time() < _MARKET_CLOSE
+    return ttl_config.price_data_market_hours if is_open else ttl_config.price_data_overnight
+
+
+def _is_array_payload(data: Any) -> bool:
+    """Check whether data is a numeric (or structured) NumPy array.
+
+    Object arrays are excluded because they cannot be saved without pickling.
+    """
+    return isinstance(data, np.ndarray) and not data.dtype.hasobject
+
 
 class CacheEntry:
     """Single cache entry with metadata."""
@@ -50,7 +127,9 @@ class CacheEntry:
 class CacheManager:
     """File-based cache manager for structured data.
 
-    Uses JSON format for flexibility and human-readability.
+    Uses JSON format for flexibility and human-readability. Numeric NumPy arrays
+    (e.g. price series) are written to a sibling ``.npy`` file instead, referenced
+    from the JSON envelope, and memory-mapped on read.
     """
 
     def __init__(
@@ -101,16 +180,7 @@ class CacheManager:
         file_path = self._get_file_path(key)
         if file_path.exists():
             try:
-                with open(file_path, "r") as f:
-                    cached = json.load(f)
-
-                entry = CacheEntry(
-                    key=cached["key"],
-                    data=cached["data"],
-                    ttl_hours=cached["ttl_hours"],
-                )
-                entry.created_at = datetime.fromisoformat(cached["created_at"])
-                entry.expires_at = datetime.fromisoformat(cached["expires_at"])
+                entry = self._read_entry(file_path)
 
                 if not entry.is_expired():
                     logger.debug(f"Cache hit (disk): {key}")
@@ -119,17 +189,72 @@ class CacheManager:
                     return entry.data
                 else:
                     logger.debug(f"Disk cache expired: {key}")
-                    file_path.unlink()
+                    self._unlink(file_path)
                     return default
 
-            except (json.JSONDecodeError, KeyError) as e:
+            # orjson.JSONDecodeError is a ValueError, as are corrupt .npy headers
+            except (ValueError, KeyError, OSError) as e:
                 logger.warning(f"Failed to load cache file {key}: {e}")
-                file_path.unlink()
+                self._unlink(file_path)
                 return default
 
         logger.debug(f"Cache miss: {key}")
         return default
 
+    def get_typed(self, key: str, tp: Any, default: Optional[Any] = None) -> Optional[Any]:
+        """Get value from cache validated as the given type.
+
+        Disk entries are parsed and validated in a single ``validate_json`` call on
+        the raw file bytes. Typed reads do not populate the memory cache, which
+        keeps holding the plain data returned by get(). Array payloads stored as
+        .npy are not supported; use get() for those.
+
+        Args:
+            key: Cache key
+            tp: Type of the cached data, e.g. a Pydantic model or ``list[Model]``
+            default: Default value if not found or not valid for tp
+
+        Returns:
+            Cached value as an instance of tp, or default
+        """
+        adapter = _envelope_adapter(tp)
+
+        if key in self._memory_cache:
+            entry = self._memory_cache[key]
+            if not entry.is_expired():
+                logger.debug(f"Cache hit (memory): {key}")
+                try:
+                    return adapter.validate_python(
+                        {"data": entry.data, "expires_at": entry.expires_at}
+                    ).data
+                except ValueError as e:
+                    logger.warning(f"Cached value for {key} is not a valid {tp}: {e}")
+                    return default
+            del self._memory_cache[key]
+            logger.debug(f"Memory cache expired: {key}")
+
+        file_path = self._get_file_path(key)
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
+            logger.debug(f"Cache miss: {key}")
+            return default
+
+        try:
+            envelope = adapter.validate_json(raw)
+        except ValueError as e:
+            # The file may still be valid for untyped readers, so it is kept
+            logger.warning(f"Cache file {key} is not a valid {tp}: {e}")
+            return default
+
+        if datetime.now() > envelope.expires_at:
+            logger.debug(f"Disk cache expired: {key}")
+            self._unlink(file_path)
+            return default
+
+        logger.debug(f"Cache hit (disk): {key}")
+        return envelope.data
+
     def set(self, key: str, data: Any, ttl_hours: int) -> None:
         """Set value in cache.
 
@@ -148,15 +273,21 @@ class CacheManager:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
+            data_ref = entry.data
+            if _is_array_payload(entry.data):
+                # Binary dump skips the float -> text -> float round-trip of JSON
+                npy_path = file_path.with_suffix(".npy")
+                np.save(npy_path, entry.data, allow_pickle=False)
+                data_ref = {_NPY_REF_KEY: npy_path.name}
+
             cache_data = {
                 "key": entry.key,
-                "data": entry.data,
+                "data": data_ref,
                 "ttl_hours": entry.ttl_hours,
                 "created_at": entry.created_at.isoformat(),
                 "expires_at": entry.expires_at.isoformat(),
             }
-            with open(file_path, "w") as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            file_path.write_bytes(orjson.dumps(cache_data, option=_ORJSON_OPTIONS, default=str))
             logger.debug(f"Cache set (disk): {key} (TTL: {ttl_hours}h)")
         except Exception as e:
             logger.error(f"Failed to write cache file {key}: {e}")
@@ -181,7 +312,7 @@ class CacheManager:
         file_path = self._get_file_path(key)
         if file_path.exists():
             try:
-                file_path.unlink()
+                self._unlink(file_path)
                 deleted = True
                 logger.debug(f"Cache deleted: {key}")
             except Exception as e:
@@ -192,7 +323,7 @@ class CacheManager:
     def clear(self) -> None:
         """Clear all cache entries."""
         self._memory_cache.clear()
-        for file_path in self.cache_dir.glob("*.json"):
+        for file_path in [*self.cache_dir.glob("*.json"), *self.cache_dir.glob("*.npy")]:
             try:
                 file_path.unlink()
             except Exception as e:
@@ -216,18 +347,10 @@ class CacheManager:
         # Clean disk cache
         for file_path in self.cache_dir.glob("*.json"):
             try:
-                with open(file_path, "r") as f:
-                    cached = json.load(f)
-                entry = CacheEntry(
-                    key=cached["key"],
-                    data=cached["data"],
-                    ttl_hours=cached["ttl_hours"],
-                )
-                entry.created_at = datetime.fromisoformat(cached["created_at"])
-                entry.expires_at = datetime.fromisoformat(cached["expires_at"])
+                entry = self._read_entry(file_path)
 
                 if entry.is_expired():
-                    file_path.unlink()
+                    self._unlink(file_path)
                     removed += 1
             except Exception as e:
                 logger.warning(f"Error checking cache file {file_path}: {e}")
@@ -260,30 +383,29 @@ class CacheManager:
             # Load the most recent file (they should be sorted by name)
             latest_file = sorted(matching_files)[-1]
 
-            with open(latest_file, "r") as f:
-                cached = json.load(f)
-                data = cached.get("data", {})
+            cached = orjson.loads(latest_file.read_bytes())
+            data = cached.get("data", {})
 
-                # Extract the latest_price and construct a simple object
-                latest_price = data.get("latest_price")
-                if latest_price is None:
-                    logger.debug(f"No latest_price in cache for {ticker}")
-                    return None
+            # Extract the latest_price and construct a simple object
+            latest_price = data.get("latest_price")
+            if latest_price is None:
+                logger.debug(f"No latest_price in cache for {ticker}")
+                return None
 
-                # Get currency from the last price entry
-                prices = data.get("prices", [])
-                currency = "USD"
-                if prices:
-                    currency = prices[-1].get("currency", "USD")
+            # Get currency from the last price entry
+            prices = data.get("prices", [])
+            currency = "USD"
+            if prices:
+                currency = prices[-1].get("currency", "USD")
 
-                # Return a simple object with close_price and currency
-                class PriceData:
-                    def __init__(self, price, curr):
-                        self.close_price = price
-                        self.currency = curr
+            # Return a simple object with close_price and currency
+            class PriceData:
+                def __init__(self, price, curr):
+                    self.close_price = price
+                    self.currency = curr
 
-                logger.debug(f"Found cached price for {ticker}: {latest_price} {currency}")
-                return PriceData(latest_price, currency)
+            logger.debug(f"Found cached price for {ticker}: {latest_price} {currency}")
+            return PriceData(latest_price, currency)
 
         except Exception as e:
             logger.debug(f"Error fetching price cache for {ticker}: {e}")
@@ -327,6 +449,10 @@ class CacheManager:
                 filename = file_path.stem  # Remove .json extension
                 parts = filename.split("_")
 
+                # Whole historical contexts are read by exact key, never as a fallback
+                if "historical-context" in parts:
+                    continue
+
                 # Check if this is price data (has format: TICKER_prices_START_END)
                 if "prices" in parts:
                     # For price data, extract start and end dates
@@ -374,18 +500,112 @@ class CacheManager:
             valid_files.sort(key=lambda x: x[0], reverse=True)
             most_recent_date, most_recent_file = valid_files[0]
 
-            with open(most_recent_file, "r") as f:
-                cached = json.load(f)
-                logger.debug(
-                    f"Found historical cache for {ticker} as of {as_of_date}: "
-                    f"{most_recent_file.name}"
-                )
-                return cached.get("data")
+            cached = orjson.loads(most_recent_file.read_bytes())
+            logger.debug(
+                f"Found historical cache for {ticker} as of {as_of_date}: {most_recent_file.name}"
+            )
+            return self._load_data(most_recent_file, cached.get("data"))
 
         except Exception as e:
             logger.debug(f"Error fetching historical cache for {ticker}: {e}")
             return None
 
+    def index(self) -> dict[str, list[Path]]:
+        """Index all cache files by ticker with a single directory walk.
+
+        Covers the JSON/.npy cache files (``TICKER_type_params.json``) as well as the
+        unified price CSVs in subdirectories (``prices/TICKER.csv``). Build it once and
+        reuse it instead of globbing the cache directory per lookup.
+
+        Returns:
+            Dictionary mapping upper-cased ticker to its cache files, sorted by name
+        """
+        index: dict[str, list[Path]] = {}
+        pending = [self.cache_dir]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                        continue
+
+                    parts = Path(entry.name).stem.split("_")
+                    # Legacy price files are named prices_TICKER_START_END.json
+                    ticker = parts[1] if parts[0] == "prices" and len(parts) > 1 else parts[0]
+                    index.setdefault(ticker.upper(), []).append(Path(entry.path))
+
+        for files in index.values():
+            files.sort(key=lambda path: path.name)
+        return index
+
+    def _read_entry(self, file_path: Path) -> CacheEntry:
+        """Load a cache entry from its JSON envelope.
+
+        Args:
+            file_path: Path to the JSON cache file
+
+        Returns:
+            CacheEntry with original timestamps and resolved data
+        """
+        cached = orjson.loads(file_path.read_bytes())
+        entry = CacheEntry(
+            key=cached["key"],
+            data=self._load_data(file_path, cached["data"]),
+            ttl_hours=cached["ttl_hours"],
+        )
+        entry.created_at = datetime.fromisoformat(cached["created_at"])
+        entry.expires_at = datetime.fromisoformat(cached["expires_at"])
+        return entry
+
+    @staticmethod
+    def _load_data(file_path: Path, data: Any) -> Any:
+        """Resolve a .npy reference from a JSON envelope into its array.
+
+        Arrays are memory-mapped read-only, so opening an entry does not read the
+        whole file.
+
+        Args:
+            file_path: Path to the JSON cache file
+            data: The envelope's ``data`` value
+
+        Returns:
+            The referenced array, or data unchanged if it is not a reference
+        """
+        if isinstance(data, dict) and data.keys() == {_NPY_REF_KEY}:
+            return np.load(file_path.with_name(data[_NPY_REF_KEY]), mmap_mode="r")
+        return data
+
+    @staticmethod
+    def _unlink(file_path: Path) -> None:
+        """Delete a JSON cache file together with its .npy payload, if any.
+
+        Args:
+            file_path: Path to the JSON cache file
+        """
+        file_path.unlink(missing_ok=True)
+        file_path.with_suffix(".npy").unlink(missing_ok=True)
+
+    def path_for(self, namespace: str, ticker: str, *params: str) -> Path:
+        """Get the cache file path for a namespaced ticker entry.
+
+        Builds the key ``namespace:ticker:params...`` and maps it the same way
+        get() and set() do, so callers can open a known entry directly instead of
+        searching the cache directory for the ticker.
+
+        Example:
+            path_for("prices", "aapl", "2025-11-01", "2025-12-01")
+            -> AAPL_prices_2025-11-01_2025-12-01.json
+
+        Args:
+            namespace: Data type, e.g. "prices" or "news_sentiment"
+            ticker: Stock ticker symbol
+            *params: Additional key parts, e.g. start and end dates
+
+        Returns:
+            File path for the entry (it may not exist)
+        """
+        return self._get_file_path(":".join([namespace, ticker, *params]))
+
     def _get_file_path(self, key: str) -> Path:
         """Get file path for cache key.
 
@@ -581,16 +801,7 @@ class CacheManager:
         # Find matching files
         for file_path in self.cache_dir.glob(pattern):
             try:
-                with open(file_path, "r") as f:
-                    cached = json.load(f)
-
-                entry = CacheEntry(
-                    key=cached["key"],
-                    data=cached["data"],
-                    ttl_hours=cached["ttl_hours"],
-                )
-                entry.created_at = datetime.fromisoformat(cached["created_at"])
-                entry.expires_at = datetime.fromisoformat(cached["expires_at"])
+                entry = self._read_entry(file_path)
 
                 if not entry.is_expired():
                     matching_files.append((entry.created_at, entry.data, entry.key))
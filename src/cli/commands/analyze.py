@@ -3,6 +3,7 @@
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -29,6 +30,9 @@ from src.utils.scheduler import RunLog
 
 logger = get_logger(__name__)
 
+# Concurrent historical-context fetches; kept small to stay within provider rate limits
+_HISTORICAL_FETCH_WORKERS = 4
+
 
 @app.command()
 def analyze(
@@ -418,14 +422,22 @@ def analyze(
                 primary_provider, cache_manager=cache_manager
             )
 
-            # Fetch historical context for each ticker
+            # Fetch historical context for each ticker; the fetches overlap on a small pool
             typer.echo(f"  Fetching historical data as of {historical_date}...")
-            for tick in ticker_list:
-                try:
-                    context = historical_fetcher.fetch_as_of_date(
-                        tick, historical_date, lookback_days=365
+            with ThreadPoolExecutor(max_workers=_HISTORICAL_FETCH_WORKERS) as executor:
+                futures = {
+                    tick: executor.submit(
+                        historical_fetcher.fetch_as_of_date,
+                        tick,
+                        historical_date,
+                        lookback_days=365,
                     )
-                    historical_context_data[tick] = context
+                    for tick in ticker_list
+                }
+
+            for tick, future in futures.items():
+                try:
+                    historical_context_data[tick] = future.result()
                 except Exception as e:
                     typer.echo(f"  ⚠️  Error fetching historical data for {tick}: {e}")
                     historical_context_data[tick] = None
@@ -1,11 +1,14 @@
 """Download helper functions for CLI commands."""
 
 import time
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
 import typer
 
+from src.data.models import PriceSeries
 from src.data.price_manager import PriceDataManager
 from src.data.provider_manager import ProviderManager
 from src.utils.logging import get_logger
@@ -13,6 +16,96 @@ from src.utils.resilience import RateLimiter
 
 logger = get_logger(__name__)
 
+# Tickers fetched per batched provider request
+DOWNLOAD_BATCH_SIZE = 50
+
+
+def _price_frame(ticker: str, prices: PriceSeries) -> pd.DataFrame:
+    """Build a price CSV frame straight from the series' columns.
+
+    Args:
+        ticker: Ticker symbol the prices are stored under
+        prices: Price series returned by the provider
+
+    Returns:
+        DataFrame with PriceDataManager's column names
+    """
+    data = prices.data
+    return pd.DataFrame(
+        {
+            "date": data["date"],
+            "open": data["open"],
+            "high": data["high"],
+            "low": data["low"],
+            "close": data["close"],
+            "volume": data["volume"],
+            "adj_close": data["adjusted_close"],
+            "currency": prices.currency,
+            "ticker": ticker,
+            "name": prices.name,
+            "market": prices.market,
+            "instrument_type": prices.instrument_type,
+        }
+    )
+
+
+def _download_batch(
+    batch: list[str],
+    provider_manager: ProviderManager,
+    price_manager: PriceDataManager,
+    period: str,
+    force_refresh: bool,
+    rate_limiter: RateLimiter,
+) -> tuple[int, int]:
+    """Fetch prices for a batch of tickers in one request and store them to CSV.
+
+    Args:
+        batch: Ticker symbols to download
+        provider_manager: Provider manager used for the batched fetch
+        price_manager: Price manager the fetched prices are stored with
+        period: Period string passed to the provider (e.g. '730d')
+        force_refresh: Replace existing CSVs instead of appending
+        rate_limiter: Limiter charged for any per-ticker fallback fetches
+
+    Returns:
+        Tuple of (success_count, error_count) for the batch
+    """
+    try:
+        prices_by_ticker = provider_manager.get_stock_prices_batch(
+            batch, period=period, rate_limiter=rate_limiter
+        )
+    except Exception as e:
+        logger.error(f"Error downloading {', '.join(batch)}: {e}")
+        # Small delay on error to avoid hammering the API
+        time.sleep(0.5)
+        return 0, len(batch)
+
+    success_count = 0
+    error_count = 0
+    for ticker in batch:
+        prices = prices_by_ticker.get(ticker.upper())
+        if not prices:
+            logger.warning(f"No price data received for {ticker}")
+            error_count += 1
+            continue
+
+        try:
+            stored = price_manager.store_prices(
+                ticker,
+                _price_frame(ticker, prices),
+                append=not force_refresh,
+            )
+        except Exception as e:
+            logger.error(f"Error storing prices for {ticker}: {e}")
+            error_count += 1
+            continue
+
+        if stored > 0:
+            success_count += 1
+            logger.debug(f"Downloaded {len(prices)} prices for {ticker}")
+
+    return success_count, error_count
+
 
 def download_price_data(
     tickers: list[str],
@@ -47,93 +140,50 @@ def download_price_data(
     # Use period parameter for fetching
     period = f"{config_obj.analysis.historical_data_lookback_days}d"
 
-    # Download prices
+    # Skip tickers whose stored data is already current
     success_count = 0
     skipped_count = 0
     error_count = 0
+    to_download = []
+    for ticker in tickers:
+        if not force_refresh and price_manager.has_data(ticker):
+            # Check if data is relatively current (within last 2 days)
+            _, existing_end = price_manager.get_data_range(ticker)
+            if existing_end and (datetime.now().date() - existing_end).days <= 2:
+                logger.debug(f"Skipping {ticker} - data is current")
+                skipped_count += 1
+                continue
+        to_download.append(ticker)
+
+    # Download the rest in batched provider requests
+    progress_bar = (
+        typer.progressbar(
+            length=len(to_download),
+            label="Downloading prices",
+            show_pos=True,
+            show_percent=True,
+        )
+        if show_progress
+        else nullcontext()
+    )
+    with progress_bar as progress:
+        try:
+            for start in range(0, len(to_download), DOWNLOAD_BATCH_SIZE):
+                batch = to_download[start : start + DOWNLOAD_BATCH_SIZE]
 
-    if show_progress:
-        with typer.progressbar(
-            tickers, label="Downloading prices", show_pos=True, show_percent=True
-        ) as progress:
-            for ticker in progress:
-                try:
-                    # Check if we need to download
-                    if not force_refresh and price_manager.has_data(ticker):
-                        # Check if data is relatively current (within last 2 days)
-                        _, existing_end = price_manager.get_data_range(ticker)
-                        if existing_end and (datetime.now().date() - existing_end).days <= 2:
-                            logger.debug(f"Skipping {ticker} - data is current")
-                            skipped_count += 1
-                            continue
-
-                    # Wait for rate limiter
-                    rate_limiter.wait_if_needed(tokens=1)
-
-                    # Fetch prices using provider manager with period parameter
-                    prices = provider_manager.get_stock_prices(ticker, period=period)
-
-                    if prices:
-                        # Store to CSV
-                        stored = price_manager.store_prices(
-                            ticker,
-                            [p.model_dump() for p in prices],
-                            append=not force_refresh,
-                        )
-                        if stored > 0:
-                            success_count += 1
-                            logger.debug(f"Downloaded {len(prices)} prices for {ticker}")
-                    else:
-                        logger.warning(f"No price data received for {ticker}")
-                        error_count += 1
-
-                except KeyboardInterrupt:
-                    typer.echo("\n\n⚠️  Download interrupted by user")
-                    break
-                except Exception as e:
-                    logger.error(f"Error downloading {ticker}: {e}")
-                    error_count += 1
-                    # Small delay on error to avoid hammering the API
-                    time.sleep(0.5)
-    else:
-        for ticker in tickers:
-            try:
-                # Check if we need to download
-                if not force_refresh and price_manager.has_data(ticker):
-                    # Check if data is relatively current (within last 2 days)
-                    _, existing_end = price_manager.get_data_range(ticker)
-                    if existing_end and (datetime.now().date() - existing_end).days <= 2:
-                        logger.debug(f"Skipping {ticker} - data is current")
-                        skipped_count += 1
-                        continue
-
-                # Wait for rate limiter
+                # Wait for rate limiter (one token per batched request; per-ticker
+                # fallback fetches take their own tokens)
                 rate_limiter.wait_if_needed(tokens=1)
 
-                # Fetch prices using provider manager with period parameter
-                prices = provider_manager.get_stock_prices(ticker, period=period)
-
-                if prices:
-                    # Store to CSV
-                    stored = price_manager.store_prices(
-                        ticker,
-                        [p.model_dump() for p in prices],
-                        append=not force_refresh,
-                    )
-                    if stored > 0:
-                        success_count += 1
-                        logger.debug(f"Downloaded {len(prices)} prices for {ticker}")
-                else:
-                    logger.warning(f"No price data received for {ticker}")
-                    error_count += 1
-
-            except KeyboardInterrupt:
-                typer.echo("\n\n⚠️  Download interrupted by user")
-                break
-            except Exception as e:
-                logger.error(f"Error downloading {ticker}: {e}")
-                error_count += 1
-                # Small delay on error to avoid hammering the API
-                time.sleep(0.5)
+                batch_success, batch_errors = _download_batch(
+                    batch, provider_manager, price_manager, period, force_refresh, rate_limiter
+                )
+                success_count += batch_success
+                error_count += batch_errors
+
+                if progress is not None:
+                    progress.update(len(batch))
+        except KeyboardInterrupt:
+            typer.echo("\n\n⚠️  Download interrupted by user")
 
     return success_count, skipped_count, error_count, price_manager.prices_dir
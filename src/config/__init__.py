@@ -1,9 +1,9 @@
 """Configuration management system."""
 
-from .loader import ConfigLoader, load_config
+from .loader import ConfigLoader, clear_config_cache, load_config
 from .schemas import Config
 
-__all__ = ["Config", "ConfigLoader", "load_config", "get_config"]
+__all__ = ["Config", "ConfigLoader", "clear_config_cache", "load_config", "get_config"]
 
 # Singleton config instance
 _config_instance: Config | None = None
@@ -1,6 +1,7 @@
 """Configuration loading and management."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -124,9 +125,23 @@ class ConfigLoader:
         return self.config_path
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: Path, _mtime_ns: int, _size: int) -> Config:
+    """Parse and validate a config file, memoized per file version.
+
+    The file's mtime and size are only part of the cache key, so editing the file
+    invalidates the cached entry.
+    """
+    return ConfigLoader(config_path).load()
+
+
 def load_config(config_path: str | Path | None = None) -> Config:
     """Convenience function to load configuration.
 
+    The parsed and validated config is cached per file version, so repeated calls
+    skip YAML parsing and validation. Each call returns an independent copy that
+    callers may modify freely.
+
     Args:
         config_path: Path to config file. If None, tries config/local.yaml
                     then config/default.yaml.
@@ -138,5 +153,11 @@ def load_config(config_path: str | Path | None = None) -> Config:
         FileNotFoundError: If no config file is found
         ValueError: If configuration validation fails
     """
-    loader = ConfigLoader(config_path)
-    return loader.load()
+    path = ConfigLoader(config_path).get_config_path().resolve()
+    stat = path.stat()
+    return _load_config_cached(path, stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
+
+
+def clear_config_cache() -> None:
+    """Drop cached configs, e.g. after changing environment variables they reference."""
+    _load_config_cached.cache_clear()
@@ -7,6 +7,7 @@ from typing import Optional
 
 import requests
 
+from src.data.http import get_http_session
 from src.data.models import Market, NewsArticle, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
 from src.utils.logging import get_logger
@@ -105,7 +106,7 @@ class AlphaVantageProvider(DataProvider):
             try:
                 logger.debug(f"API call (attempt {attempt + 1}/{self.max_retries})")
 
-                response = requests.get(
+                response = get_http_session().get(
                     ALPHA_VANTAGE_BASE_URL,
                     params=params,
                     timeout=self.timeout,
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Generator
 
 from loguru import logger
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -15,6 +16,18 @@ from sqlmodel import Session, SQLModel, create_engine
 _initialized_databases = set()
 
 
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Configure each new SQLite connection for faster commits.
+
+    WAL lets readers run alongside a writer, and synchronous=NORMAL skips the
+    fsync on every commit (still safe against corruption in WAL mode).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class DatabaseManager:
     """Manages database connections and initialization."""
 
@@ -45,9 +58,14 @@ class DatabaseManager:
                 echo=False,  # Set to True for SQL debugging
                 connect_args={"check_same_thread": False},  # Required for SQLite
             )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
             # Create all tables
             SQLModel.metadata.create_all(self.engine)
+            # create_all() skips existing tables, so add indexes introduced since
+            for table in SQLModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(self.engine, checkfirst=True)
             self._initialized = True
 
             # Only log once per database path to avoid spam
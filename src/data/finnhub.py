@@ -6,6 +6,7 @@ from typing import Optional
 
 import requests
 
+from src.data.http import get_http_session
 from src.data.models import AnalystRating, Market, NewsArticle, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
 from src.utils.logging import get_logger
@@ -133,7 +134,7 @@ class FinnhubProvider(DataProvider):
                 to_date = datetime.now()
                 from_date = to_date - timedelta(days=30)
 
-            response = requests.get(
+            response = get_http_session().get(
                 f"{FINNHUB_BASE_URL}/company-news",
                 params={
                     "symbol": ticker,
@@ -206,7 +207,7 @@ class FinnhubProvider(DataProvider):
         try:
             logger.debug(f"Fetching company info for {ticker}")
 
-            response = requests.get(
+            response = get_http_session().get(
                 f"{FINNHUB_BASE_URL}/stock/profile2",
                 params={
                     "symbol": ticker,
@@ -259,7 +260,7 @@ class FinnhubProvider(DataProvider):
         try:
             logger.debug(f"Fetching recommendation trends for {ticker} (as_of_date={as_of_date})")
 
-            response = requests.get(
+            response = get_http_session().get(
                 f"{FINNHUB_BASE_URL}/stock/recommendation",
                 params={
                     "symbol": ticker,
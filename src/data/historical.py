@@ -9,12 +9,16 @@ from datetime import datetime
 from typing import Optional
 
 from src.cache.manager import CacheManager
-from src.data.models import HistoricalContext
+from src.data.models import HistoricalContext, StockPrice
 from src.data.providers import DataProvider
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Contexts for a past date don't change, so reruns reuse them for a week. The
+# current session is never cached because its prices and news are still moving.
+CONTEXT_CACHE_TTL_HOURS = 168
+
 
 class HistoricalDataFetcher:
     """Fetch historical data as of a specific date.
@@ -34,6 +38,21 @@ class HistoricalDataFetcher:
         self.provider = provider
         self.cache_manager = cache_manager
 
+    @staticmethod
+    def _price_from_cache(record: dict) -> StockPrice:
+        """Rebuild a StockPrice from a cached record without re-validating it.
+
+        Args:
+            record: Price dictionary as stored in the JSON cache
+
+        Returns:
+            StockPrice instance
+        """
+        price_date = record.get("date")
+        if isinstance(price_date, str):
+            record = {**record, "date": datetime.fromisoformat(price_date)}
+        return StockPrice.model_construct(**record)
+
     def fetch_as_of_date(
         self,
         ticker: str,
@@ -72,6 +91,21 @@ class HistoricalDataFetcher:
             f"({lookback_days} day lookback)"
         )
 
+        # Reruns for the same date are served from the context cache without provider calls
+        cache_key = (
+            f"historical_context:{ticker}:{as_of_date_only:%Y-%m-%d}:lookback{lookback_days}"
+        )
+        if self.cache_manager:
+            cached_context = self.cache_manager.get(cache_key)
+            if cached_context:
+                logger.debug(
+                    f"Using cached historical context for {ticker} as of {as_of_date_only}"
+                )
+                return HistoricalContext.model_validate(cached_context)
+
+        # Only contexts fetched without errors are cached
+        fetch_complete = True
+
         context = HistoricalContext(
             ticker=ticker,
             as_of_date=as_of_datetime,
@@ -95,14 +129,13 @@ class HistoricalDataFetcher:
                     logger.debug(
                         f"Using historical cached price data for {ticker} as of {as_of_date_only}"
                     )
-                    # Convert cached price dicts back to StockPrice objects if needed
+                    # Convert cached price dicts back to StockPrice objects if needed.
+                    # Cached records were validated when first fetched, so skip
+                    # re-validation and only restore the datetime field.
                     all_prices = cached_data["prices"]
                     if all_prices and isinstance(all_prices[0], dict):
-                        # Need to convert dicts to StockPrice objects
-                        from src.data.models import StockPrice
-
                         all_prices = [
-                            StockPrice(**price) if isinstance(price, dict) else price
+                            self._price_from_cache(price) if isinstance(price, dict) else price
                             for price in all_prices
                         ]
 
@@ -136,6 +169,7 @@ class HistoricalDataFetcher:
                 logger.debug(f"Fetched {len(filtered_prices)} price points for {ticker}")
 
         except Exception as e:
+            fetch_complete = False
             logger.error(f"Error fetching price data for {ticker}: {e}")
             context.data_available = False
             context.missing_data_warnings.append(f"Price data fetch error: {str(e)}")
@@ -162,6 +196,7 @@ class HistoricalDataFetcher:
         except NotImplementedError:
             logger.debug(f"Provider {self.provider.name} does not support financial statements")
         except Exception as e:
+            fetch_complete = False
             logger.warning(f"Error fetching financial statements for {ticker}: {e}")
             context.missing_data_warnings.append(f"Fundamentals fetch error: {str(e)}")
 
@@ -184,6 +219,7 @@ class HistoricalDataFetcher:
         except NotImplementedError:
             logger.debug(f"Provider {self.provider.name} does not support news fetching")
         except Exception as e:
+            fetch_complete = False
             logger.warning(f"Error fetching news for {ticker}: {e}")
             context.missing_data_warnings.append(f"News fetch error: {str(e)}")
 
@@ -197,6 +233,7 @@ class HistoricalDataFetcher:
         except NotImplementedError:
             logger.debug(f"Provider {self.provider.name} does not support analyst ratings")
         except Exception as e:
+            fetch_complete = False
             logger.warning(f"Error fetching analyst ratings for {ticker}: {e}")
 
         # Fetch metadata (if supported)
@@ -207,6 +244,7 @@ class HistoricalDataFetcher:
         except NotImplementedError:
             logger.debug(f"Provider {self.provider.name} does not support metadata fetching")
         except Exception as e:
+            fetch_complete = False
             logger.warning(f"Error fetching metadata for {ticker}: {e}")
 
         # Fetch earnings estimates (if supported)
@@ -224,6 +262,7 @@ class HistoricalDataFetcher:
         except NotImplementedError:
             logger.debug(f"Provider {self.provider.name} does not support earnings estimates")
         except Exception as e:
+            fetch_complete = False
             logger.warning(f"Error fetching earnings estimates for {ticker}: {e}")
 
         logger.debug(
@@ -232,6 +271,19 @@ class HistoricalDataFetcher:
             f"warnings={len(context.missing_data_warnings)}"
         )
 
+        if (
+            self.cache_manager
+            and fetch_complete
+            and context.data_available
+            and as_of_date_only < datetime.now().date()
+        ):
+            try:
+                self.cache_manager.set(
+                    cache_key, context.model_dump(mode="json"), ttl_hours=CONTEXT_CACHE_TTL_HOURS
+                )
+            except Exception as e:
+                logger.warning(f"Could not cache historical context for {ticker}: {e}")
+
         return context
 
     def validate_date(self, as_of_date: datetime) -> bool:
@@ -0,0 +1,26 @@
+"""Shared HTTP session for REST data providers."""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept alive per API host; covers the analysis modules fetching concurrently
+_POOL_SIZE = 16
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Get the process-wide HTTP session.
+
+    Reusing one session keeps connections to each API host open between calls instead
+    of paying a new TCP/TLS handshake per request.
+
+    Returns:
+        Shared requests session with a pooled adapter
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,8 +1,10 @@
 """Pydantic models for financial data standardization."""
 
+from collections.abc import Iterator, Sequence
 from datetime import date, datetime
 from enum import Enum
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field as SQLField
@@ -44,6 +46,142 @@ class StockPrice(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
 
+# Columnar layout for OHLCV histories (one contiguous buffer instead of N model objects)
+PRICE_DTYPE = np.dtype(
+    [
+        ("date", "datetime64[ns]"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("adjusted_close", "f8"),
+        ("volume", "i8"),
+    ]
+)
+
+
+class PriceSeries(Sequence[StockPrice]):
+    """Price history for a single ticker backed by a NumPy structured array.
+
+    Behaves like a read-only ``list[StockPrice]`` (len, iteration, indexing) so existing
+    callers keep working, while columns can be read directly for vectorized work
+    (``series["close"]``). StockPrice objects are only built when an element is accessed.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        ticker: str,
+        name: str,
+        market: Market | str,
+        instrument_type: InstrumentType | str = InstrumentType.STOCK,
+        currency: str = "EUR",
+    ):
+        """Initialize price series.
+
+        Args:
+            data: Structured array with PRICE_DTYPE, sorted by date
+            ticker: Stock ticker symbol
+            name: Company or instrument name
+            market: Market classification
+            instrument_type: Type of instrument
+            currency: Price currency (EUR, USD, etc.)
+        """
+        self.data = data
+        self.ticker = ticker
+        self.name = name
+        # Match StockPrice(use_enum_values=True), which stores plain values
+        self.market = Market(market).value
+        self.instrument_type = InstrumentType(instrument_type).value
+        self.currency = currency
+
+    @classmethod
+    def from_prices(cls, prices: list[StockPrice]) -> "PriceSeries":
+        """Build a series from StockPrice objects of a single ticker.
+
+        Args:
+            prices: Non-empty list of StockPrice objects
+
+        Returns:
+            PriceSeries with the same records
+        """
+        data = np.empty(len(prices), dtype=PRICE_DTYPE)
+        data["date"] = [np.datetime64(p.date, "ns") for p in prices]
+        data["open"] = [p.open_price for p in prices]
+        data["high"] = [p.high_price for p in prices]
+        data["low"] = [p.low_price for p in prices]
+        data["close"] = [p.close_price for p in prices]
+        data["adjusted_close"] = [
+            p.adjusted_close if p.adjusted_close is not None else p.close_price for p in prices
+        ]
+        data["volume"] = [p.volume for p in prices]
+        first = prices[0]
+        return cls(
+            data,
+            ticker=first.ticker,
+            name=first.name,
+            market=first.market,
+            instrument_type=first.instrument_type,
+            currency=first.currency,
+        )
+
+    def tail(self, n: int = 5) -> np.ndarray:
+        """Get the last n rows as structured records (e.g. ``row["close"]``).
+
+        Args:
+            n: Number of rows
+
+        Returns:
+            Structured array view of the last n rows
+        """
+        return self.data[-n:] if n > 0 else self.data[:0]
+
+    def _to_price(self, row: np.void) -> StockPrice:
+        """Materialize one row as a StockPrice without re-validating it."""
+        return StockPrice.model_construct(
+            ticker=self.ticker,
+            name=self.name,
+            market=self.market,
+            instrument_type=self.instrument_type,
+            date=row["date"].astype("datetime64[us]").item(),
+            open_price=float(row["open"]),
+            high_price=float(row["high"]),
+            low_price=float(row["low"]),
+            close_price=float(row["close"]),
+            volume=int(row["volume"]),
+            adjusted_close=float(row["adjusted_close"]),
+            currency=self.currency,
+        )
+
+    def __len__(self) -> int:
+        """Number of price records."""
+        return len(self.data)
+
+    def __getitem__(self, key):
+        """Index by position (StockPrice), slice (PriceSeries) or column name (ndarray)."""
+        if isinstance(key, str):
+            return self.data[key]
+        if isinstance(key, slice):
+            return PriceSeries(
+                self.data[key],
+                ticker=self.ticker,
+                name=self.name,
+                market=self.market,
+                instrument_type=self.instrument_type,
+                currency=self.currency,
+            )
+        return self._to_price(self.data[key])
+
+    def __iter__(self) -> Iterator[StockPrice]:
+        """Iterate over records as StockPrice objects."""
+        for row in self.data:
+            yield self._to_price(row)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<PriceSeries(ticker={self.ticker}, records={len(self.data)})>"
+
+
 class FinancialStatement(BaseModel):
     """Financial statement data."""
 
@@ -313,6 +451,10 @@ class Recommendation(SQLModel, table=True):
     """
 
     __tablename__ = "recommendations"
+    __table_args__ = (
+        # Date-range screens filtered by signal (e.g. BUY/STRONG_BUY in the last 90 days)
+        Index("idx_recommendations_date_signal", "analysis_date", "signal_type"),
+    )
 
     id: int | None = SQLField(default=None, primary_key=True, description="Auto-incrementing ID")
     ticker_id: int = SQLField(
@@ -7,6 +7,8 @@ source prioritization and article count targets.
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from pydantic import BaseModel
+
 from src.data.models import NewsArticle
 from src.data.providers import DataProvider, DataProviderFactory
 from src.utils.logging import get_logger
@@ -14,6 +16,12 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+class _CachedNews(BaseModel):
+    """Part of the cached news payload that is read back on a cache hit."""
+
+    articles: list[NewsArticle] = []
+
+
 class NewsSourceConfig:
     """Configuration for a news source."""
 
@@ -118,10 +126,10 @@ class UnifiedNewsAggregator:
         # Check cache first
         cache_key = self._make_cache_key(ticker, as_of_date)
         if self.cache_manager:
-            cached = self.cache_manager.get(cache_key)
-            if cached:
+            cached = self.cache_manager.get_typed(cache_key, _CachedNews)
+            if cached is not None:
                 logger.debug(f"Cache hit for news: {ticker}")
-                return [NewsArticle(**a) for a in cached.get("articles", [])]
+                return cached.articles
 
         # Fetch from sources in priority order
         all_articles: list[NewsArticle] = []
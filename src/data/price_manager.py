@@ -4,7 +4,14 @@ Provides a single source of truth for price data per ticker, stored in efficient
 CSV format for fast loading and compatibility with pandas-ta for technical analysis.
 """
 
+import io
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, timedelta
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +21,40 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent CSV reads when loading several tickers at once
+_CSV_READ_WORKERS = 8
+
+# Initial number of bytes read from the end of a CSV file to find its last row
+_TAIL_BLOCK_BYTES = 1024
+
+# (ticker, target timestamp, tolerance_days, fields) -> price dict or None
+_DateCacheKey = tuple[str, pd.Timestamp, int, Optional[tuple[str, ...]]]
+
+# (st_mtime_ns, st_size) of a ticker's CSV file, or None if it doesn't exist
+_FileVersion = Optional[tuple[int, int]]
+
+
+@dataclass
+class _PriceWindow:
+    """Prefetched price rows for one ticker.
+
+    Holds every row needed to answer lookups for target dates in [start, end)
+    with up to tolerance_days of look-back.
+    """
+
+    start: pd.Timestamp
+    end: pd.Timestamp
+    tolerance_days: int
+    prices: pd.DataFrame
+
+    def covers(self, targets: pd.DatetimeIndex, tolerance_days: int) -> bool:
+        """Check whether all targets can be answered from this window."""
+        return (
+            tolerance_days <= self.tolerance_days
+            and bool((targets >= self.start).all())
+            and bool((targets < self.end).all())
+        )
+
 
 class PriceDataManager:
     """Unified price data manager with CSV storage.
@@ -44,6 +85,9 @@ class PriceDataManager:
     # Minimal columns required for technical analysis
     REQUIRED_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
 
+    # Maximum number of date lookups remembered per instance
+    DATE_CACHE_SIZE = 4096
+
     def __init__(self, prices_dir: str | Path = "data/cache/prices"):
         """Initialize price data manager.
 
@@ -52,6 +96,10 @@ class PriceDataManager:
         """
         self.prices_dir = Path(prices_dir)
         self.prices_dir.mkdir(parents=True, exist_ok=True)
+        self._windows: dict[str, _PriceWindow] = {}
+        self._date_cache: OrderedDict[_DateCacheKey, Optional[dict]] = OrderedDict()
+        # CSV file version each ticker's windows and date lookups were read from
+        self._versions: dict[str, _FileVersion] = {}
         logger.debug(f"PriceDataManager initialized at {self.prices_dir}")
 
     def get_file_path(self, ticker: str) -> Path:
@@ -103,6 +151,7 @@ class PriceDataManager:
         ticker: str,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> pd.DataFrame:
         """Get price data for a ticker within date range.
 
@@ -110,6 +159,7 @@ class PriceDataManager:
             ticker: Stock ticker symbol
             start_date: Start date (inclusive), defaults to all data
             end_date: End date (inclusive), defaults to all data
+            fields: Columns to load (the date is always included), defaults to all
 
         Returns:
             DataFrame with price data sorted by date
@@ -118,7 +168,7 @@ class PriceDataManager:
             logger.debug(f"No price data found for {ticker}")
             return pd.DataFrame()
 
-        df = self._read_csv(ticker)
+        df = self._read_csv(ticker, fields)
         if df.empty:
             return df
 
@@ -139,24 +189,59 @@ class PriceDataManager:
         Returns:
             Dictionary with latest price data or None if no data
         """
-        if not self.has_data(ticker):
-            return None
+        return self.get_latest_prices([ticker])[ticker]
 
-        df = self._read_csv(ticker)
-        if df.empty:
-            return None
+    def get_latest_prices(
+        self,
+        tickers: Iterable[str],
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict[str, Optional[dict]]:
+        """Get the most recent price data for several tickers.
 
-        latest = df.loc[df["date"].idxmax()]
-        return {
-            "date": latest["date"],
-            "open": latest["open"],
-            "high": latest["high"],
-            "low": latest["low"],
-            "close": latest["close"],
-            "volume": latest["volume"],
-            "adj_close": latest.get("adj_close"),
-            "currency": latest.get("currency", "USD"),
-        }
+        Each ticker's CSV is read once, however often the ticker is repeated, and
+        the files are read concurrently. Only the last row of each file is parsed.
+
+        Args:
+            tickers: Stock ticker symbols
+            fields: Price fields to return, e.g. ("date", "close"); defaults to all.
+                Only these columns are parsed from the CSV files.
+
+        Returns:
+            Dictionary mapping each ticker, as passed in, to its latest price data or
+            None if no data
+        """
+        by_symbol: dict[str, list[str]] = {}
+        for ticker in tickers:
+            by_symbol.setdefault(ticker.upper(), []).append(ticker)
+
+        workers = max(1, min(_CSV_READ_WORKERS, len(by_symbol)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = executor.map(self._read_last_row, by_symbol, repeat(fields))
+
+        results: dict[str, Optional[dict]] = {}
+        for names, df in zip(by_symbol.values(), frames, strict=True):
+            if df.empty:
+                results.update(dict.fromkeys(names))
+                continue
+
+            latest = df.iloc[-1]
+            if fields is not None:
+                price = {field: latest.get(field) for field in fields}
+            else:
+                price = {
+                    "date": latest["date"],
+                    "open": latest["open"],
+                    "high": latest["high"],
+                    "low": latest["low"],
+                    "close": latest["close"],
+                    "volume": latest["volume"],
+                    "adj_close": latest.get("adj_close"),
+                    "currency": latest.get("currency", "USD"),
+                }
+            # Give each requested spelling its own copy
+            results.update({name: dict(price) for name in names})
+
+        return results
 
     def store_prices(
         self,
@@ -204,6 +289,7 @@ class PriceDataManager:
 
         # Store to CSV
         file_path = self.get_file_path(ticker)
+        self._invalidate(ticker)
         try:
             df_to_store.to_csv(file_path, index=False)
             logger.debug(f"Stored {len(df_to_store)} price records for {ticker}")
@@ -266,6 +352,7 @@ class PriceDataManager:
         ticker: str,
         target_date: date,
         tolerance_days: int = 5,
+        fields: Optional[Sequence[str]] = None,
     ) -> Optional[dict]:
         """Get price for a specific date with tolerance for non-trading days.
 
@@ -273,35 +360,131 @@ class PriceDataManager:
             ticker: Stock ticker symbol
             target_date: Target date
             tolerance_days: Number of days to look back if exact date not found
+            fields: Price fields to return, e.g. ("date", "close"); defaults to all
 
         Returns:
             Price data dictionary or None if not found
         """
-        df = self.get_prices(ticker)
-        if df.empty:
-            return None
+        return self.get_prices_at_dates([(ticker, target_date)], tolerance_days, fields)[
+            (ticker, target_date)
+        ]
 
-        target_ts = pd.Timestamp(target_date)
+    def get_prices_at_dates(
+        self,
+        lookups: Iterable[tuple[str, date]],
+        tolerance_days: int = 5,
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict[tuple[str, date], Optional[dict]]:
+        """Get prices for many (ticker, date) pairs, reading each ticker's CSV once.
 
-        # Try exact date first
-        exact = df[df["date"] == target_ts]
-        if not exact.empty:
-            row = exact.iloc[0]
-            return self._row_to_dict(row)
+        Each lookup follows the same rules as get_price_at_date: the exact date if
+        present, otherwise the closest previous date within tolerance. Results are
+        remembered per instance until the ticker's CSV file changes (including writes
+        by other instances), so repeated lookups only stat the files.
 
-        # Look for closest previous date within tolerance
-        before_target = df[df["date"] <= target_ts]
-        if before_target.empty:
-            return None
+        Args:
+            lookups: (ticker, target_date) pairs
+            tolerance_days: Number of days to look back if exact date not found
+            fields: Price fields to return, e.g. ("date", "close"); defaults to all.
+                Only these columns are parsed from the CSV files.
 
-        latest_before = before_target.loc[before_target["date"].idxmax()]
-        days_diff = (target_ts - latest_before["date"]).days
+        Returns:
+            Dictionary mapping each (ticker, target_date) pair, as passed in, to its
+            price data dictionary or None if not found
+        """
+        field_key = tuple(fields) if fields is not None else None
+        lookups = list(lookups)
+        for symbol in dict.fromkeys(ticker.upper() for ticker, _ in lookups):
+            self._sync_version(symbol)
+
+        results: dict[tuple[str, date], Optional[dict]] = {}
+        by_ticker: dict[str, list[tuple[str, date]]] = {}
+        for ticker, target_date in lookups:
+            key = (ticker.upper(), pd.Timestamp(target_date), tolerance_days, field_key)
+            if key in self._date_cache:
+                self._date_cache.move_to_end(key)
+                price = self._date_cache[key]
+                results[(ticker, target_date)] = dict(price) if price is not None else None
+            else:
+                by_ticker.setdefault(ticker.upper(), []).append((ticker, target_date))
 
-        if days_diff <= tolerance_days:
-            return self._row_to_dict(latest_before)
+        for symbol, pairs in by_ticker.items():
+            targets = pd.DatetimeIndex([pd.Timestamp(target_date) for _, target_date in pairs])
+            window = self._windows.get(symbol)
+            if window is not None and window.covers(targets, tolerance_days):
+                df = window.prices
+            else:
+                df = self.get_prices(symbol, fields=fields)
+            if df.empty:
+                results.update(dict.fromkeys(pairs))
+                continue
+
+            # Rows are sorted by date: locate the last row on or before each target
+            dates = df["date"]
+            positions = dates.searchsorted(targets, side="right") - 1
+
+            for pair, target_ts, pos in zip(pairs, targets, positions, strict=True):
+                if pos < 0:
+                    results[pair] = None
+                    continue
+
+                row = df.iloc[pos]
+                if (target_ts - row["date"]).days <= tolerance_days:
+                    results[pair] = self._row_to_dict(row, fields)
+                else:
+                    logger.debug(
+                        f"No price found for {pair[0]} within {tolerance_days} days of {pair[1]}"
+                    )
+                    results[pair] = None
+
+            for pair, target_ts in zip(pairs, targets, strict=True):
+                price = results[pair]
+                self._date_cache[(symbol, target_ts, tolerance_days, field_key)] = (
+                    dict(price) if price is not None else None
+                )
+        while len(self._date_cache) > self.DATE_CACHE_SIZE:
+            self._date_cache.popitem(last=False)
+
+        return results
+
+    def clear_price_cache(self) -> None:
+        """Forget all remembered date lookups."""
+        self._date_cache.clear()
+
+    def prefetch_window(
+        self,
+        tickers: Iterable[str],
+        start_date: date,
+        end_date: date,
+        tolerance_days: int = 5,
+    ) -> None:
+        """Load a date window of prices into memory for repeated date lookups.
+
+        Later get_price_at_date()/get_prices_at_dates() calls for these tickers with
+        target dates in [start_date, end_date] are answered from memory instead of
+        re-reading the CSV files. Any change to a ticker's CSV file drops its window.
 
-        logger.debug(f"No price found for {ticker} within {tolerance_days} days of {target_date}")
-        return None
+        Args:
+            tickers: Stock ticker symbols
+            start_date: First target date (inclusive)
+            end_date: Last target date (inclusive)
+            tolerance_days: Largest look-back the window must support
+        """
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)
+        # Look-back is measured in whole days, so a target late in the day accepts rows
+        # from up to tolerance_days + 1 calendar days earlier
+        first_row = start - pd.Timedelta(days=tolerance_days + 1)
+
+        for symbol in dict.fromkeys(ticker.upper() for ticker in tickers):
+            self._sync_version(symbol)
+            df = self.get_prices(symbol)
+            if not df.empty:
+                df = df[(df["date"] >= first_row) & (df["date"] < end)].reset_index(drop=True)
+            self._windows[symbol] = _PriceWindow(start, end, tolerance_days, df)
+            logger.debug(
+                f"Prefetched {len(df)} price rows for {symbol} ({start_date} to {end_date})"
+            )
 
     def cleanup_old_data(self, max_age_days: int = 730) -> int:
         """Remove price data older than specified age.
@@ -326,6 +509,7 @@ class PriceDataManager:
 
             if len(df) < original_len:
                 removed = original_len - len(df)
+                self._invalidate(ticker)
                 df.to_csv(file_path, index=False)
                 total_removed += removed
                 logger.info(f"Removed {removed} old records from {ticker}")
@@ -410,11 +594,43 @@ class PriceDataManager:
 
         return warnings
 
-    def _read_csv(self, ticker: str) -> pd.DataFrame:
+    def _invalidate(self, ticker: str) -> None:
+        """Drop in-memory prices for a ticker whose CSV file changed.
+
+        Args:
+            ticker: Stock ticker symbol
+        """
+        symbol = ticker.upper()
+        self._windows.pop(symbol, None)
+        self._versions.pop(symbol, None)
+        for key in [key for key in self._date_cache if key[0] == symbol]:
+            del self._date_cache[key]
+
+    def _sync_version(self, symbol: str) -> None:
+        """Drop in-memory prices for a ticker if its CSV file changed since they were read.
+
+        Catches writes made through other PriceDataManager instances, which
+        don't call this instance's _invalidate().
+
+        Args:
+            symbol: Upper-cased ticker symbol
+        """
+        try:
+            stat = self.get_file_path(symbol).stat()
+            version: _FileVersion = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            version = None
+
+        if symbol in self._versions and self._versions[symbol] != version:
+            self._invalidate(symbol)
+        self._versions[symbol] = version
+
+    def _read_csv(self, ticker: str, fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Read CSV file for a ticker.
 
         Args:
             ticker: Stock ticker symbol
+            fields: Columns to parse (the date is always included), defaults to all
 
         Returns:
             DataFrame with price data
@@ -423,13 +639,57 @@ class PriceDataManager:
         if not file_path.exists():
             return pd.DataFrame()
 
+        # A callable skips requested fields missing from older files instead of raising
+        usecols = None if fields is None else {"date", *fields}.__contains__
+
         try:
-            df = pd.read_csv(file_path, parse_dates=["date"])
+            df = pd.read_csv(file_path, parse_dates=["date"], usecols=usecols)
             return df
         except Exception as e:
             logger.error(f"Error reading CSV for {ticker}: {e}")
             return pd.DataFrame()
 
+    def _read_last_row(self, ticker: str, fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Read the last row of a ticker's CSV file.
+
+        Files are always written sorted by date, so the last row holds the latest
+        price. Only the header and the end of the file are read.
+
+        Args:
+            ticker: Stock ticker symbol
+            fields: Columns to parse (the date is always included), defaults to all
+
+        Returns:
+            DataFrame with at most one row of price data
+        """
+        file_path = self.get_file_path(ticker)
+        if not file_path.exists():
+            return pd.DataFrame()
+
+        usecols = None if fields is None else {"date", *fields}.__contains__
+
+        try:
+            with file_path.open("rb") as f:
+                header = f.readline()
+                end = f.seek(0, os.SEEK_END)
+                block = _TAIL_BLOCK_BYTES
+                # Grow the block until it holds a complete last line
+                while True:
+                    start = max(len(header), end - block)
+                    f.seek(start)
+                    tail = f.read().rstrip(b"\r\n")
+                    if start == len(header) or b"\n" in tail:
+                        break
+                    block *= 2
+
+            last_line = tail.rsplit(b"\n", 1)[-1]
+            return pd.read_csv(
+                io.BytesIO(header + last_line), parse_dates=["date"], usecols=usecols
+            )
+        except Exception as e:
+            logger.error(f"Error reading CSV for {ticker}: {e}")
+            return pd.DataFrame()
+
     def _normalize_prices(self, prices: list[dict], ticker: str) -> pd.DataFrame:
         """Normalize price data from various formats to standard DataFrame.
 
@@ -472,15 +732,19 @@ class PriceDataManager:
 
         return pd.DataFrame(normalized)
 
-    def _row_to_dict(self, row) -> dict:
+    def _row_to_dict(self, row, fields: Optional[Sequence[str]] = None) -> dict:
         """Convert DataFrame row to dictionary.
 
         Args:
             row: DataFrame row (Series)
+            fields: Keys to include, defaults to OHLCV plus optional fields
 
         Returns:
             Dictionary with price data
         """
+        if fields is not None:
+            return {field: row.get(field) for field in fields}
+
         result = {
             "date": row["date"],
             "open": row.get("open"),
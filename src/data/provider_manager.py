@@ -1,17 +1,23 @@
 """Provider manager with automatic fallback logic."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from src.cache.manager import CacheManager
-from src.data.models import AnalystRating, NewsArticle, StockPrice
+from src.data.models import AnalystRating, NewsArticle, PriceSeries, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
 from src.data.repository import AnalystRatingsRepository
 from src.utils.logging import get_logger
+from src.utils.resilience import RateLimiter
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent per-ticker fallback fetches (keeps provider rate limits in mind)
+_FALLBACK_FETCH_WORKERS = 4
+
 
 class ProviderManager:
     """Manages multiple data providers with automatic fallback.
@@ -94,15 +100,23 @@ class ProviderManager:
         self,
         ticker: str,
         period: str | None = None,
-    ) -> list[StockPrice]:
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        fetch_metadata: bool = True,
+    ) -> PriceSeries:
         """Fetch stock prices with automatic fallback.
 
         Args:
             ticker: Stock ticker symbol
             period: Period string (e.g., '730d', '60d'). If None, uses historical_data_lookback_days
+            start_date: Start of an explicit date range. Takes precedence over period, and lets
+                providers without period support act as fallbacks.
+            end_date: End of the date range (defaults to now when start_date is set)
+            fetch_metadata: Look up the company name. Pass False for price-only checks to
+                save a request per ticker; the ticker symbol is then used as the name.
 
         Returns:
-            List of StockPrice objects
+            PriceSeries (list-like of StockPrice) sorted by date
 
         Raises:
             RuntimeError: If all providers fail
@@ -110,8 +124,11 @@ class ProviderManager:
         providers_to_try = [self.primary_provider] + self.backup_providers
         errors = []
 
-        # Use configured lookback days if period not specified
-        if period is None:
+        if start_date is not None:
+            period = None
+            end_date = end_date or datetime.now()
+        elif period is None:
+            # Use configured lookback days if neither period nor range specified
             period = f"{self.historical_data_lookback_days}d"
 
         for provider in providers_to_try:
@@ -120,12 +137,25 @@ class ProviderManager:
                 continue
 
             try:
+                if start_date is not None:
+                    logger.debug(
+                        f"Fetching prices for {ticker} using {provider.name} "
+                        f"({start_date:%Y-%m-%d} to {end_date:%Y-%m-%d})"
+                    )
+                    if provider.name == "yahoo_finance":
+                        prices = provider.get_stock_prices(
+                            ticker, start_date, end_date, fetch_metadata=fetch_metadata
+                        )
+                    else:
+                        prices = provider.get_stock_prices(ticker, start_date, end_date)
                 # Use period parameter for Yahoo Finance
-                if provider.name == "yahoo_finance":
+                elif provider.name == "yahoo_finance":
                     logger.debug(
                         f"Fetching prices for {ticker} using {provider.name} (period={period})"
                     )
-                    prices = provider.get_stock_prices(ticker, period=period)
+                    prices = provider.get_stock_prices(
+                        ticker, period=period, fetch_metadata=fetch_metadata
+                    )
                 else:
                     # Other providers don't support period, skip them for price fetching
                     logger.debug(f"Provider {provider.name} doesn't support period-based fetching")
@@ -136,6 +166,8 @@ class ProviderManager:
                 if prices:
                     logger.debug(f"Successfully fetched {len(prices)} prices from {provider.name}")
                     self._record_success(provider.name)
+                    if not isinstance(prices, PriceSeries):
+                        prices = PriceSeries.from_prices(prices)
                     return prices
                 else:
                     logger.warning(f"No prices returned from {provider.name}")
@@ -155,6 +187,84 @@ class ProviderManager:
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
+    def get_stock_prices_batch(
+        self,
+        tickers: list[str],
+        period: str | None = None,
+        fetch_metadata: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> dict[str, PriceSeries]:
+        """Fetch stock prices for several tickers in one batched request.
+
+        Uses the primary provider's batch endpoint when available and falls back
+        to per-ticker get_stock_prices() for any ticker the batch didn't return.
+        Fallback fetches run on a small thread pool so their network waits overlap,
+        unless a rate limiter is given, in which case they run one by one and
+        each takes a token first.
+
+        Args:
+            tickers: Stock ticker symbols
+            period: Period string (e.g., '730d', '60d'). If None, uses historical_data_lookback_days
+            fetch_metadata: Look up company names (see get_stock_prices)
+            rate_limiter: Optional limiter throttling the per-ticker fallback fetches
+
+        Returns:
+            Dictionary mapping upper-cased ticker to PriceSeries. Tickers for which
+            all providers failed are omitted.
+        """
+        if period is None:
+            period = f"{self.historical_data_lookback_days}d"
+
+        results: dict[str, PriceSeries] = {}
+        provider = self.primary_provider
+        if provider.is_available and hasattr(provider, "get_stock_prices_batch"):
+            try:
+                logger.debug(
+                    f"Batch fetching prices for {len(tickers)} tickers using {provider.name} "
+                    f"(period={period})"
+                )
+                results = provider.get_stock_prices_batch(
+                    tickers, period=period, fetch_metadata=fetch_metadata
+                )
+                self._record_success(provider.name)
+            except Exception as e:
+                logger.warning(f"Batch price fetch failed with {provider.name}: {e}")
+                self._record_failure(provider.name)
+
+        # dict.fromkeys() de-duplicates while keeping the requested order
+        symbols = dict.fromkeys(ticker.upper() for ticker in tickers)
+        missing = [symbol for symbol in symbols if symbol not in results]
+        if not missing:
+            return results
+
+        if rate_limiter is not None:
+            for symbol in missing:
+                rate_limiter.wait_if_needed(tokens=1)
+                try:
+                    results[symbol] = self.get_stock_prices(
+                        symbol, period=period, fetch_metadata=fetch_metadata
+                    )
+                except RuntimeError as e:
+                    logger.warning(f"Skipping {symbol} in batch fetch: {e}")
+            return results
+
+        workers = min(_FALLBACK_FETCH_WORKERS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                symbol: executor.submit(
+                    self.get_stock_prices, symbol, period=period, fetch_metadata=fetch_metadata
+                )
+                for symbol in missing
+            }
+
+        for symbol, future in futures.items():
+            try:
+                results[symbol] = future.result()
+            except RuntimeError as e:
+                logger.warning(f"Skipping {symbol} in batch fetch: {e}")
+
+        return results
+
     def get_latest_price(self, ticker: str) -> StockPrice:
         """Fetch latest price with automatic fallback.
 
@@ -405,8 +515,8 @@ class ProviderManager:
         Args:
             provider_name: Provider name
         """
-        if provider_name in self.provider_failures:
-            del self.provider_failures[provider_name]
+        # pop() rather than check-then-del, batch fallbacks record from worker threads
+        self.provider_failures.pop(provider_name, None)
 
     def _record_failure(self, provider_name: str) -> None:
         """Record failed provider call.
@@ -501,3 +611,54 @@ class ProviderManager:
                 for provider in self.backup_providers
             ],
         }
+
+
+@lru_cache(maxsize=8)
+def _cached_provider_manager(
+    primary_provider: str,
+    backup_providers: tuple[str, ...] | None,
+    db_path: str | None,
+    historical_data_lookback_days: int,
+) -> ProviderManager:
+    """Build and memoize a ProviderManager for one set of (hashable) settings."""
+    return ProviderManager(
+        primary_provider=primary_provider,
+        backup_providers=list(backup_providers) if backup_providers is not None else None,
+        db_path=db_path,
+        historical_data_lookback_days=historical_data_lookback_days,
+    )
+
+
+def get_provider_manager(
+    primary_provider: str = "yahoo_finance",
+    backup_providers: list[str] | None = None,
+    db_path: Path | str | None = None,
+    historical_data_lookback_days: int = 730,
+) -> ProviderManager:
+    """Get a shared ProviderManager for the given settings.
+
+    Repeated calls with the same settings return the same instance, so re-running
+    a setup cell (e.g. in a notebook) does not rebuild the providers and the
+    analyst ratings repository. Use clear_provider_manager_cache() for a fresh
+    instance.
+
+    Args:
+        primary_provider: Primary provider name
+        backup_providers: List of backup provider names
+        db_path: Optional path to database for storing analyst ratings
+        historical_data_lookback_days: Default lookback period in days
+
+    Returns:
+        ProviderManager instance shared by callers with the same settings
+    """
+    return _cached_provider_manager(
+        primary_provider,
+        tuple(backup_providers) if backup_providers is not None else None,
+        str(db_path) if db_path is not None else None,
+        historical_data_lookback_days,
+    )
+
+
+def clear_provider_manager_cache() -> None:
+    """Drop the shared ProviderManager instances built by get_provider_manager()."""
+    _cached_provider_manager.cache_clear()
@@ -6,6 +6,7 @@ analyst ratings and other time-sensitive data from the SQLite database.
 
 import json
 import statistics
+from collections.abc import Collection, Iterator
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -836,6 +837,9 @@ class RecommendationsRepository:
     ) -> list:
         """Get all recommendations for a specific run session.
 
+        Loads and converts every row, so do not call this per session from display
+        loops; use get_recommendation_counts_by_session() when only counts are needed.
+
         Args:
             run_session_id: Integer ID of the run session.
             analysis_mode: Filter by analysis mode ('llm' or 'rule_based').
@@ -873,6 +877,52 @@ class RecommendationsRepository:
             logger.error(f"Error retrieving recommendations for session {run_session_id}: {e}")
             return []
 
+    def get_recommendation_counts_by_session(self, run_session_ids: list[int]) -> dict[int, int]:
+        """Count recommendations for several run sessions in a single query.
+
+        Counts distinct ticker+analysis_date pairs, matching the deduplicated length of
+        get_recommendations_by_session().
+
+        Args:
+            run_session_ids: Integer IDs of the run sessions.
+
+        Returns:
+            Dictionary mapping run session ID to number of recommendations. Sessions
+            without recommendations are omitted.
+        """
+        if not run_session_ids:
+            return {}
+
+        try:
+            session = self.db_manager.get_session()
+            try:
+                unique_recs = (
+                    select(
+                        Recommendation.run_session_id,
+                        Recommendation.ticker_id,
+                        Recommendation.analysis_date,
+                    )
+                    .where(Recommendation.run_session_id.in_(run_session_ids))
+                    .group_by(
+                        Recommendation.run_session_id,
+                        Recommendation.ticker_id,
+                        Recommendation.analysis_date,
+                    )
+                    .subquery()
+                )
+                stmt = select(unique_recs.c.run_session_id, func.count()).group_by(
+                    unique_recs.c.run_session_id
+                )
+
+                return dict(session.exec(stmt).all())
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error counting recommendations for sessions {run_session_ids}: {e}")
+            return {}
+
     def get_recommendations_by_date(
         self,
         report_date: date | str,
@@ -930,6 +980,7 @@ class RecommendationsRepository:
         signal_type: str | None = None,
         confidence_threshold: float | None = None,
         final_score_threshold: float | None = None,
+        signal_types: Collection[str] | None = None,
     ):
         """Apply common filters to a recommendation query.
 
@@ -939,6 +990,7 @@ class RecommendationsRepository:
             signal_type: Filter by signal type (e.g., 'strong_buy', 'buy', 'hold').
             confidence_threshold: Minimum confidence score (e.g., 70 means confidence > 70).
             final_score_threshold: Minimum final score (e.g., 70 means final_score > 70).
+            signal_types: Filter by any of several signal types (SQL IN).
 
         Returns:
             Filtered query.
@@ -947,6 +999,8 @@ class RecommendationsRepository:
             query = query.where(Recommendation.analysis_mode == analysis_mode)
         if signal_type:
             query = query.where(Recommendation.signal_type == signal_type)
+        if signal_types:
+            query = query.where(Recommendation.signal_type.in_(signal_types))
         if confidence_threshold is not None:
             query = query.where(Recommendation.confidence > confidence_threshold)
         if final_score_threshold is not None:
@@ -1208,6 +1262,175 @@ class RecommendationsRepository:
             logger.error(f"Error retrieving recent analysis dates: {e}")
             return []
 
+    def get_signal_counts(
+        self,
+        from_date: date,
+        to_date: date,
+        analysis_mode: str | None = None,
+    ) -> dict[str, int]:
+        """Count recommendations per signal type within an analysis date range.
+
+        The counting is done by the database (GROUP BY), so no rows are loaded.
+
+        Args:
+            from_date: First analysis date (inclusive).
+            to_date: Last analysis date (inclusive).
+            analysis_mode: Filter by analysis mode ('llm' or 'rule_based').
+
+        Returns:
+            Dictionary mapping signal type to number of recommendations.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                stmt = select(Recommendation.signal_type, func.count(Recommendation.id)).where(
+                    Recommendation.analysis_date.between(from_date, to_date)
+                )
+                stmt = self._apply_filters(stmt, analysis_mode)
+                stmt = stmt.group_by(Recommendation.signal_type)
+
+                return dict(session.exec(stmt).all())
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error counting signals from {from_date} to {to_date}: {e}")
+            return {}
+
+    def get_top_by_confidence(
+        self,
+        from_date: date,
+        to_date: date,
+        limit: int = 5,
+    ) -> list[dict]:
+        """Get the most confident recommendations within an analysis date range.
+
+        Sorting and limiting are done by the database.
+
+        Args:
+            from_date: First analysis date (inclusive).
+            to_date: Last analysis date (inclusive).
+            limit: Maximum number of recommendations to return.
+
+        Returns:
+            List of recommendation dictionaries, highest confidence first.
+        """
+        try:
+            session = self.db_manager.get_session()
+            try:
+                results = session.exec(
+                    select(Recommendation, Ticker)
+                    .join(Ticker, Recommendation.ticker_id == Ticker.id)
+                    .where(Recommendation.analysis_date.between(from_date, to_date))
+                    .order_by(Recommendation.confidence.desc())
+                    .limit(limit)
+                ).all()
+
+                return [self._to_summary_dict(rec, ticker) for rec, ticker in results]
+
+            finally:
+                session.close()
+
+        except Exception as e:
+            logger.error(f"Error retrieving top recommendations from {from_date} to {to_date}: {e}")
+            return []
+
+    def iter_recommendations_by_date_range(
+        self,
+        from_date: date,
+        to_date: date,
+        analysis_mode: str | None = None,
+        limit: int | None = None,
+        signal_types: Collection[str] | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[dict]:
+        """Stream recommendations within an analysis date range, oldest first.
+
+        Rows are fetched from the database in batches of batch_size and yielded one at
+        a time, so large ranges are never loaded into memory at once.
+
+        Args:
+            from_date: First analysis date (inclusive).
+            to_date: Last analysis date (inclusive).
+            analysis_mode: Filter by analysis mode ('llm' or 'rule_based').
+            limit: Maximum number of recommendations to yield (applied in SQL).
+            signal_types: Only yield these signal types (e.g., ('buy', 'strong_buy')).
+            batch_size: Number of rows fetched from the database per round trip.
+
+        Yields:
+            Recommendation dictionaries with the same keys as get_top_by_confidence().
+        """
+        session = self.db_manager.get_session()
+        try:
+            stmt = (
+                select(Recommendation, Ticker)
+                .join(Ticker, Recommendation.ticker_id == Ticker.id)
+                .where(Recommendation.analysis_date.between(from_date, to_date))
+            )
+            stmt = self._apply_filters(stmt, analysis_mode, signal_types=signal_types)
+            stmt = stmt.order_by(Recommendation.analysis_date, Recommendation.id)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
+            for rec, ticker in session.exec(stmt.execution_options(yield_per=batch_size)):
+                yield self._to_summary_dict(rec, ticker)
+
+        except Exception as e:
+            logger.error(f"Error streaming recommendations from {from_date} to {to_date}: {e}")
+
+        finally:
+            session.close()
+
+    def get_recommendations_by_date_range(
+        self,
+        from_date: date,
+        to_date: date,
+        analysis_mode: str | None = None,
+        limit: int | None = None,
+        signal_types: Collection[str] | None = None,
+    ) -> list[dict]:
+        """Get recommendations within an analysis date range, oldest first.
+
+        Pass limit when only the first few rows are shown; it is applied in SQL.
+        Use iter_recommendations_by_date_range() to process large ranges.
+
+        Args:
+            from_date: First analysis date (inclusive).
+            to_date: Last analysis date (inclusive).
+            analysis_mode: Filter by analysis mode ('llm' or 'rule_based').
+            limit: Maximum number of recommendations to return.
+            signal_types: Only return these signal types (e.g., ('buy', 'strong_buy')).
+
+        Returns:
+            List of recommendation dictionaries.
+        """
+        return list(
+            self.iter_recommendations_by_date_range(
+                from_date, to_date, analysis_mode, limit=limit, signal_types=signal_types
+            )
+        )
+
+    def _to_summary_dict(self, recommendation: Recommendation, ticker: Ticker) -> dict:
+        """Convert a recommendation and its ticker to a summary dictionary.
+
+        Args:
+            recommendation: Recommendation database record.
+            ticker: Ticker database record of the recommendation.
+
+        Returns:
+            Dictionary with the key recommendation fields.
+        """
+        return {
+            "id": recommendation.id,
+            "ticker": ticker.symbol,
+            "recommendation": recommendation.signal_type,
+            "confidence": recommendation.confidence,
+            "current_price": recommendation.current_price,
+            "analysis_date": recommendation.analysis_date.isoformat(),
+            "analysis_mode": recommendation.analysis_mode,
+        }
+
 
 class PerformanceRepository:
     """Repository for tracking recommendation performance.
@@ -2,10 +2,11 @@
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from src.data.models import InstrumentType, Market, StockPrice
+from src.data.models import PRICE_DTYPE, InstrumentType, Market, PriceSeries, StockPrice
 from src.data.providers import DataProvider, DataProviderFactory
 from src.utils.errors import RateLimitException
 from src.utils.logging import get_logger
@@ -13,6 +14,8 @@ from src.utils.resilience import retry
 
 logger = get_logger(__name__)
 
+_OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
 
 class YahooFinanceProvider(DataProvider):
     """Yahoo Finance data provider implementation.
@@ -39,7 +42,8 @@ class YahooFinanceProvider(DataProvider):
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         period: str | None = None,
-    ) -> list[StockPrice]:
+        fetch_metadata: bool = True,
+    ) -> PriceSeries:
         """Fetch historical stock price data from Yahoo Finance.
 
         Args:
@@ -49,9 +53,11 @@ class YahooFinanceProvider(DataProvider):
             period: Period string like '1d', '5d', '1mo', '3mo', '6mo', '1y', '2y',
                     '5y', '10y', 'ytd', 'max' or '100d' for 100 days.
                     If set, overrides start_date/end_date.
+            fetch_metadata: Look up the company name (an extra request per ticker).
+                    If False, the ticker symbol is used as the name.
 
         Returns:
-            List of StockPrice objects sorted by date
+            PriceSeries (list-like of StockPrice) sorted by date
 
         Raises:
             ValueError: If ticker is invalid
@@ -78,83 +84,7 @@ class YahooFinanceProvider(DataProvider):
             if data.empty:
                 raise ValueError(f"No data found for ticker: {ticker}")
 
-            prices = []
-            for index, row in data.iterrows():
-                # Handle different column formats from yfinance
-                # yf.Ticker().history() returns flat columns: Open, High, Low, Close, Volume, etc.
-                # yf.download() can return MultiIndex columns: (PriceLevel, Ticker)
-                def get_price_value(row, key):
-                    """Extract scalar price value, handling both flat and MultiIndex columns."""
-                    try:
-                        # Try flat column first (from Ticker().history())
-                        val = row[key]
-                    except (KeyError, TypeError):
-                        try:
-                            # Try MultiIndex (from yf.download())
-                            val = row[(key, ticker.upper())]
-                        except (KeyError, TypeError):
-                            return None
-
-                    # Ensure we have a scalar value (handle Series case)
-                    if isinstance(val, pd.Series):
-                        val = val.iloc[0] if len(val) > 0 else None
-
-                    # Type guard: check for None and NaN before converting to float
-                    if val is None or (hasattr(val, "__float__") and pd.isna(val)):
-                        return None
-                    return float(val)
-
-                # Extract price values
-                adjusted_close = get_price_value(row, "Adj Close")
-                if adjusted_close is None:
-                    adjusted_close = get_price_value(row, "Close")
-                if adjusted_close is None:
-                    logger.warning(f"No valid close price for {ticker} on {index}")
-                    continue
-
-                open_price = get_price_value(row, "Open")
-                high_price = get_price_value(row, "High")
-                low_price = get_price_value(row, "Low")
-                close_price = get_price_value(row, "Close")
-                volume = get_price_value(row, "Volume")
-
-                if any(v is None for v in [open_price, high_price, low_price, close_price, volume]):
-                    logger.warning(f"Missing price data for {ticker} on {index}")
-                    continue
-
-                # Type assertions for pyright (we've verified these are not None above)
-                assert open_price is not None
-                assert high_price is not None
-                assert low_price is not None
-                assert close_price is not None
-                assert volume is not None
-
-                market = self._infer_market(ticker)
-
-                # Convert index to naive datetime (remove timezone info)
-                if hasattr(index, "to_pydatetime"):
-                    dt = index.to_pydatetime()
-                    # Remove timezone if present
-                    if dt.tzinfo is not None:
-                        dt = dt.replace(tzinfo=None)
-                else:
-                    dt = index
-
-                price = StockPrice(
-                    ticker=ticker.upper(),
-                    name=self._get_ticker_name(ticker),
-                    market=market,
-                    instrument_type=InstrumentType.STOCK,
-                    date=dt,
-                    open_price=open_price,
-                    high_price=high_price,
-                    low_price=low_price,
-                    close_price=close_price,
-                    volume=int(volume),
-                    adjusted_close=adjusted_close,
-                    currency=self._get_currency_for_market(market),
-                )
-                prices.append(price)
+            prices = self._dataframe_to_prices(ticker, data, fetch_metadata)
 
             logger.debug(f"Retrieved {len(prices)} price records for {ticker}")
             return prices
@@ -175,6 +105,169 @@ class YahooFinanceProvider(DataProvider):
             logger.error(f"Error fetching prices for {ticker}: {e}")
             raise RuntimeError(f"Failed to fetch prices for {ticker}: {e}") from e
 
+    @retry(
+        max_attempts=5,
+        initial_delay=5.0,
+        max_delay=120.0,
+        exponential_base=2.5,
+    )
+    def get_stock_prices_batch(
+        self,
+        tickers: list[str],
+        period: str,
+        fetch_metadata: bool = True,
+    ) -> dict[str, PriceSeries]:
+        """Fetch historical prices for several tickers with a single yfinance request.
+
+        Uses ``yf.download`` with ``group_by="ticker"`` so all tickers are fetched in
+        one call (yfinance parallelizes internally), then slices the MultiIndex result
+        per ticker.
+
+        Args:
+            tickers: Stock ticker symbols
+            period: Period string like '30d', '1y' (see get_stock_prices)
+            fetch_metadata: Look up company names (an extra request per ticker)
+
+        Returns:
+            Dictionary mapping upper-cased ticker to PriceSeries. Tickers without data
+            are omitted.
+
+        Raises:
+            RuntimeError: If API call fails
+            RateLimitException: If rate limited by API
+        """
+        if not tickers:
+            return {}
+
+        try:
+            logger.debug(f"Batch fetching prices for {len(tickers)} tickers with period={period}")
+            data = yf.download(
+                tickers=" ".join(tickers),
+                period=period,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                auto_adjust=False,  # Keep original and adjusted close prices
+            )
+        except Exception as e:
+            error_msg = str(e)
+            if "rate limit" in error_msg.lower() or "too many requests" in error_msg.lower():
+                logger.warning("Rate limited by Yahoo Finance for batch fetch, will retry")
+                raise RateLimitException(
+                    f"Rate limited by Yahoo Finance: {error_msg}",
+                    provider="yahoo_finance",
+                ) from e
+            logger.error(f"Error batch fetching prices for {tickers}: {e}")
+            raise RuntimeError(f"Failed to batch fetch prices: {e}") from e
+
+        results: dict[str, PriceSeries] = {}
+        if data.empty:
+            return results
+
+        available = set(data.columns.get_level_values(0)) if data.columns.nlevels > 1 else None
+        if available is None and len(tickers) > 1:
+            # Flat columns can't be attributed to a specific ticker
+            logger.warning(f"Batch download returned ungrouped columns for {tickers}")
+            return results
+
+        for ticker in tickers:
+            # yfinance uppercases symbols in the ticker column level
+            symbol = ticker.upper()
+            if available is None:
+                # Single ticker downloads may come back with flat columns
+                ticker_data = data
+            elif symbol in available:
+                ticker_data = data.xs(symbol, axis=1, level=0)
+            else:
+                logger.warning(f"No batch data returned for {symbol}")
+                continue
+
+            ticker_data = ticker_data.dropna(how="all")
+            if ticker_data.empty:
+                logger.warning(f"No batch data returned for {symbol}")
+                continue
+
+            prices = self._dataframe_to_prices(symbol, ticker_data, fetch_metadata)
+            if prices:
+                results[symbol] = prices
+
+        logger.debug(f"Batch retrieved prices for {len(results)}/{len(tickers)} tickers")
+        return results
+
+    def _dataframe_to_prices(
+        self, ticker: str, data: pd.DataFrame, fetch_metadata: bool = True
+    ) -> PriceSeries:
+        """Convert a yfinance OHLCV DataFrame into a columnar PriceSeries.
+
+        Rows with missing or negative OHLCV values are dropped; a missing adjusted close
+        falls back to the close price.
+
+        Args:
+            ticker: Stock ticker symbol
+            data: DataFrame returned by yfinance for a single ticker
+            fetch_metadata: Look up the company name; otherwise use the ticker symbol
+
+        Returns:
+            PriceSeries sorted by date
+        """
+        # yf.download() can return MultiIndex columns (PriceLevel, Ticker) even for a
+        # single ticker; yf.Ticker().history() returns flat columns
+        if isinstance(data.columns, pd.MultiIndex):
+            data = data.copy()
+            data.columns = data.columns.get_level_values(0)
+
+        market = self._infer_market(ticker)
+        series_kwargs = {
+            "ticker": ticker.upper(),
+            "market": market,
+            "instrument_type": InstrumentType.STOCK,
+            "currency": self._get_currency_for_market(market),
+        }
+
+        missing_columns = [col for col in _OHLCV_COLUMNS if col not in data.columns]
+        if missing_columns:
+            logger.warning(f"Missing price columns for {ticker}: {missing_columns}")
+            empty = np.empty(0, dtype=PRICE_DTYPE)
+            return PriceSeries(empty, name=ticker.upper(), **series_kwargs)
+
+        close = data["Close"]
+        adjusted_close = data["Adj Close"].fillna(close) if "Adj Close" in data.columns else close
+
+        ohlcv = data[_OHLCV_COLUMNS]
+        complete = ohlcv.notna().all(axis=1).to_numpy()
+        missing = int((~complete).sum())
+        if missing:
+            logger.warning(f"Skipped {missing} rows with missing price data for {ticker}")
+
+        # Same constraints StockPrice enforces (ge=0), checked once for the whole frame
+        non_negative = (ohlcv.fillna(0) >= 0).all(axis=1) & (adjusted_close.fillna(0) >= 0)
+        non_negative = non_negative.to_numpy()
+        negative = int((complete & ~non_negative).sum())
+        if negative:
+            logger.warning(f"Skipped {negative} rows with negative price data for {ticker}")
+        valid = complete & non_negative
+
+        # Convert index to naive datetimes (drop timezone, keep exchange-local wall time)
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        prices = np.empty(int(valid.sum()), dtype=PRICE_DTYPE)
+        prices["date"] = index.to_numpy(dtype="datetime64[ns]")[valid]
+        prices["open"] = data["Open"].to_numpy(dtype="f8")[valid]
+        prices["high"] = data["High"].to_numpy(dtype="f8")[valid]
+        prices["low"] = data["Low"].to_numpy(dtype="f8")[valid]
+        prices["close"] = close.to_numpy(dtype="f8")[valid]
+        prices["adjusted_close"] = adjusted_close.to_numpy(dtype="f8")[valid]
+        prices["volume"] = data["Volume"].to_numpy(dtype="f8")[valid].astype("i8")
+
+        # The name lookup is a separate quote summary request, so skip it when unused
+        if fetch_metadata and len(prices):
+            name = self._get_ticker_name(ticker)
+        else:
+            name = ticker.upper()
+        return PriceSeries(prices, name=name, **series_kwargs)
+
     @retry(
         max_attempts=5,
         initial_delay=2.0,
@@ -180,11 +180,12 @@ class TokenTracker:
         Returns:
             Monthly statistics aggregated
         """
-        month_start = datetime.now().replace(day=1)
+        now = datetime.now()
+        month_start = now.replace(day=1)
         month_usage = [u for u in self._load_month_history() if u.timestamp >= month_start]
 
         return DailyStats(
-            date=datetime.now().strftime("%Y-%m"),
+            date=now.strftime("%Y-%m"),
             total_input_tokens=sum(u.input_tokens for u in month_usage),
             total_output_tokens=sum(u.output_tokens for u in month_usage),
             total_cost_eur=sum(u.cost_eur for u in month_usage),
@@ -2,10 +2,13 @@
 
 import json
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from pydantic import BaseModel
+
 from src.agents.llm import (
     CrewAIAgentFactory,
     CrewAITaskFactory,
@@ -195,6 +198,10 @@ class UnifiedAnalysisOrchestrator:
                 """JSON serializer for objects not serializable by default."""
                 if isinstance(obj, datetime):
                     return obj.isoformat()
+                if isinstance(obj, BaseModel):
+                    # Task outputs (output_pydantic models) dump straight to JSON-safe
+                    # values; unset optional fields are left out
+                    return obj.model_dump(mode="json", exclude_none=True)
                 if hasattr(obj, "__dict__"):
                     return obj.__dict__
                 return str(obj)
@@ -247,14 +254,26 @@ class UnifiedAnalysisOrchestrator:
 
             logger.debug(f"Starting comprehensive analysis for {ticker}")
 
-            # Execute parallel analyses
-            technical_result = self.technical_agent.execute("Analyze technical indicators", context)
+            # Execute parallel analyses; the modules are independent and mostly wait on
+            # network I/O, so their fetches overlap on a small thread pool
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                technical_future = executor.submit(
+                    self.technical_agent.execute, "Analyze technical indicators", context
+                )
+                fundamental_future = executor.submit(
+                    self.fundamental_agent.execute, "Analyze fundamentals", context
+                )
+                sentiment_future = executor.submit(
+                    self.sentiment_agent.execute, "Analyze sentiment", context
+                )
+
+            technical_result = technical_future.result()
             context["technical_score"] = technical_result.get("technical_score", 50)
 
-            fundamental_result = self.fundamental_agent.execute("Analyze fundamentals", context)
+            fundamental_result = fundamental_future.result()
             context["fundamental_score"] = fundamental_result.get("fundamental_score", 50)
 
-            sentiment_result = self.sentiment_agent.execute("Analyze sentiment", context)
+            sentiment_result = sentiment_future.result()
             context["sentiment_score"] = sentiment_result.get("sentiment_score", 50)
 
             # Execute signal synthesis
@@ -63,14 +63,10 @@ class AnalysisPipeline:
 
             self.recommendations_repo = RecommendationsRepository(db_path)
 
-        # Initialize components (rule-based mode by default)
-        self.crew = UnifiedAnalysisOrchestrator(
-            llm_mode=False,  # Rule-based mode by default in pipeline
-            llm_provider=llm_provider,
-            test_mode_config=test_mode_config,
-            db_path=db_path,
-            config=config,
-        )
+        # Rule-based orchestrator is created on first use; LLM runs build their own
+        self.llm_provider = llm_provider
+        self.db_path = db_path
+        self._crew = None
         self.risk_assessor = RiskAssessor(
             volatility_threshold_high=3.0,
             volatility_threshold_very_high=5.0,
@@ -96,6 +92,19 @@ class AnalysisPipeline:
 
         logger.debug("Analysis pipeline initialized")
 
+    @property
+    def crew(self) -> UnifiedAnalysisOrchestrator:
+        """Get or create the rule-based orchestrator (lazy initialization)."""
+        if self._crew is None:
+            self._crew = UnifiedAnalysisOrchestrator(
+                llm_mode=False,  # Rule-based mode by default in pipeline
+                llm_provider=self.llm_provider,
+                test_mode_config=self.test_mode_config,
+                db_path=self.db_path,
+                config=self.config,
+            )
+        return self._crew
+
     def run_analysis(
         self,
         tickers: list[str],
@@ -388,9 +397,10 @@ class AnalysisPipeline:
         except Exception as e:
             logger.error(f"Error generating report: {e}", exc_info=True)
             # Return minimal report on error
+            now = datetime.now()
             return DailyReport(
-                report_date=report_date or datetime.now().strftime("%Y-%m-%d"),
-                report_time=datetime.now(),
+                report_date=report_date or now.strftime("%Y-%m-%d"),
+                report_time=now,
                 market_overview="Report generation failed",
                 market_indices={},
                 strong_signals=[],
@@ -5,8 +5,9 @@ from typing import Any, Optional
 
 import pandas as pd
 
-from src.cache.manager import CacheManager
+from src.cache.manager import CacheManager, price_ttl_hours
 from src.config import get_config
+from src.config.schemas import CacheTTLConfig
 from src.data.news_aggregator import NewsSourceConfig, UnifiedNewsAggregator
 from src.data.price_manager import PriceDataManager
 from src.data.provider_manager import ProviderManager
@@ -17,6 +18,9 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Data fetched as of a past date doesn't change, so backtest replays reuse it for a week
+_HISTORICAL_CACHE_TTL_HOURS = 168
+
 
 class PriceFetcherTool(BaseTool):
     """Tool for fetching stock price data with unified CSV storage."""
@@ -452,10 +456,19 @@ class PriceFetcherTool(BaseTool):
             "latest_price": prices[-1].close_price,
             "storage": "legacy_json",
         }
-        self.cache_manager.set(cache_key, result, ttl_hours=24)
+        self.cache_manager.set(cache_key, result, ttl_hours=self._price_ttl_hours())
 
         return result
 
+    def _price_ttl_hours(self) -> int:
+        """Get the price cache TTL for the current market session.
+
+        Returns:
+            TTL in hours, using the configured cache_ttl settings when available
+        """
+        cache_ttl = getattr(getattr(self.config, "data", None), "cache_ttl", None)
+        return price_ttl_hours(cache_ttl if isinstance(cache_ttl, CacheTTLConfig) else None)
+
     def get_latest(self, ticker: str) -> dict[str, Any]:
         """Get latest price for ticker.
 
@@ -477,7 +490,7 @@ class PriceFetcherTool(BaseTool):
                 "price": price.model_dump(),
                 "timestamp": datetime.now().isoformat(),
             }
-            self.cache_manager.set(cache_key, result, ttl_hours=1)
+            self.cache_manager.set(cache_key, result, ttl_hours=self._price_ttl_hours())
 
             return result
 
@@ -691,8 +704,9 @@ class FinancialDataFetcherTool(BaseTool):
                 ),
             }
 
-            # Cache enriched data (24 hour TTL)
-            self.cache_manager.set(cache_key, result, ttl_hours=24)
+            # Cache enriched data (24 hour TTL, longer for historical dates)
+            ttl_hours = _HISTORICAL_CACHE_TTL_HOURS if self.historical_date else 24
+            self.cache_manager.set(cache_key, result, ttl_hours=ttl_hours)
 
             return result
 
@@ -1097,13 +1111,16 @@ class NewsFetcherTool(BaseTool):
                 as_of_date = datetime.combine(self.historical_date, datetime.max.time())
                 logger.debug(f"Fetching news as of {self.historical_date} for {ticker}")
 
-            # Try to find existing cache with matching date range
-            # Check for news cache files matching this ticker and date
+            # Historical news is cached per analysis date so backtest replays skip
+            # the fetch and FinBERT scoring. It has its own key type so the
+            # "news:" prefix lookup below never serves it to current analysis.
+            historical_cache_key = None
             if self.historical_date:
-                # Look for cache files with date range that includes our historical date
-                # The cache manager doesn't support pattern matching, so we'll fetch and check
-                # the date range after retrieval
-                pass
+                historical_cache_key = f"historical_news:{ticker}:{self.historical_date}"
+                cached = self.cache_manager.get(historical_cache_key)
+                if cached:
+                    logger.debug(f"Cache hit for {ticker} news as of {self.historical_date}")
+                    return cached
 
             # Check for existing cached news data
             # First try simple key for current requests, then look for any recent news cache
@@ -1211,8 +1228,13 @@ class NewsFetcherTool(BaseTool):
                 "timestamp": datetime.now().isoformat(),
             }
 
-            # Cache news for 4 hours
-            self.cache_manager.set(cache_key, result, ttl_hours=4)
+            # Cache news for 4 hours; as-of-date news is kept out of the live entries
+            if historical_cache_key:
+                self.cache_manager.set(
+                    historical_cache_key, result, ttl_hours=_HISTORICAL_CACHE_TTL_HOURS
+                )
+            else:
+                self.cache_manager.set(cache_key, result, ttl_hours=4)
 
             return result
 
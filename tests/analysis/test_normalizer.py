@@ -0,0 +1,120 @@
+"""Tests for AnalysisResultNormalizer structured-output extraction."""
+
+import pytest
+
+from src.agents.llm.output_models import (
+    FundamentalAnalysisOutput,
+    SentimentAnalysisOutput,
+    TechnicalAnalysisOutput,
+)
+from src.analysis.normalizer import AnalysisResultNormalizer
+
+
+@pytest.fixture
+def technical_output():
+    """Create a validated technical analysis output."""
+    return TechnicalAnalysisOutput(
+        rsi=62.5,
+        macd=1.8,
+        sma_20=180.0,
+        ema_12=182.4,
+        trend_direction="bullish",
+        trend_strength="moderate",
+        momentum_status="neutral",
+        technical_score=72,
+        key_findings=["Price above 20-day SMA"],
+        reasoning="Uptrend with room before overbought levels",
+    )
+
+
+class TestExtractTechnicalLLM:
+    """Test suite for _extract_technical_llm with Pydantic output."""
+
+    def _assert_component(self, component):
+        assert component.component == "technical"
+        assert component.score == 72.0
+        assert component.reasoning == "Uptrend with room before overbought levels"
+
+        indicators = component.technical_indicators
+        assert indicators.rsi == 62.5
+        assert indicators.macd == 1.8
+        assert indicators.sma_20 == 180.0
+        # Indicators without a declared field are kept as extras
+        assert indicators.ema_12 == 182.4
+        # Interpretation fields are not treated as indicators
+        assert not hasattr(indicators, "trend_direction")
+
+    def test_model_instance(self, technical_output):
+        """Test extraction from a TechnicalAnalysisOutput instance."""
+        component = AnalysisResultNormalizer._extract_technical_llm({"result": technical_output})
+
+        self._assert_component(component)
+
+    def test_pydantic_dict_is_validated(self, technical_output):
+        """Test extraction from a {"pydantic": dict} payload."""
+        result = {"result": {"pydantic": technical_output.model_dump()}}
+
+        component = AnalysisResultNormalizer._extract_technical_llm(result)
+
+        self._assert_component(component)
+
+    def test_invalid_pydantic_dict_raises(self, technical_output):
+        """Test that an invalid dict payload is rejected at the boundary."""
+        payload = technical_output.model_dump()
+        payload["technical_score"] = 150
+
+        with pytest.raises(ValueError):
+            AnalysisResultNormalizer._extract_technical_llm({"result": {"pydantic": payload}})
+
+
+class TestExtractFundamentalAndSentimentLLM:
+    """Test suite for fundamental/sentiment extraction from Pydantic output."""
+
+    def test_fundamental_pydantic_dict(self):
+        """Test fundamental extraction from a {"pydantic": dict} payload."""
+        payload = FundamentalAnalysisOutput(
+            total_analysts=10,
+            buy_count=7,
+            hold_count=3,
+            consensus_rating="Strong Buy",
+            pe_ratio=24.5,
+            competitive_position="strong",
+            growth_outlook="moderate",
+            valuation_assessment="fairly valued",
+            fundamental_score=68,
+            key_findings=["Solid margins"],
+            reasoning="Healthy balance sheet",
+        ).model_dump()
+
+        component = AnalysisResultNormalizer._extract_fundamental_llm(
+            {"result": {"pydantic": payload}}
+        )
+
+        assert component.component == "fundamental"
+        assert component.score == 68
+        assert component.reasoning == "Healthy balance sheet"
+        assert component.fundamental_metrics.pe_ratio == 24.5
+        assert component.analyst_info.num_analysts == 10
+        assert component.analyst_info.consensus_rating == "strong_buy"
+
+    def test_sentiment_model_instance(self):
+        """Test sentiment extraction from a SentimentAnalysisOutput instance."""
+        output = SentimentAnalysisOutput(
+            total_articles=12,
+            positive_count=8,
+            negative_count=1,
+            neutral_count=3,
+            overall_sentiment="positive",
+            sentiment_score=0.6,
+            major_themes=["Earnings beat"],
+            sentiment_strength_score=75,
+            key_findings=["Mostly positive coverage"],
+            reasoning="Coverage skews positive",
+        )
+
+        component = AnalysisResultNormalizer._extract_sentiment_llm({"result": output})
+
+        assert component.component == "sentiment"
+        assert component.score == 75
+        assert component.sentiment_info.news_count == 12
+        assert component.sentiment_info.sentiment_score == 0.6
@@ -2,10 +2,22 @@
 
 import json
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pytest
+from pydantic import BaseModel
 
-from src.cache.manager import CacheEntry, CacheManager
+from src.cache.manager import CacheEntry, CacheManager, price_ttl_hours
+from src.config.schemas import CacheTTLConfig
+
+
+class _Quote(BaseModel):
+    """Small payload model for typed cache reads."""
+
+    ticker: str
+    close: float
+    as_of: datetime
 
 
 @pytest.mark.unit
@@ -46,6 +58,33 @@ class TestCacheEntry:
         assert timedelta(hours=0.99) < time_to_expiry <= timedelta(hours=1)
 
 
+@pytest.mark.unit
+class TestPriceTTL:
+    """Test market-session dependent price TTLs."""
+
+    NEW_YORK = ZoneInfo("America/New_York")
+
+    def test_market_hours_use_short_ttl(self):
+        """Test prices expire quickly during the regular session."""
+        ttl = CacheTTLConfig(price_data_market_hours=2, price_data_overnight=12)
+
+        # Wednesday 10:00 and 15:59 in New York
+        assert price_ttl_hours(ttl, datetime(2025, 1, 8, 10, 0, tzinfo=self.NEW_YORK)) == 2
+        assert price_ttl_hours(ttl, datetime(2025, 1, 8, 15, 59, tzinfo=self.NEW_YORK)) == 2
+        # Same instant expressed in UTC
+        assert price_ttl_hours(ttl, datetime(2025, 1, 8, 15, 0, tzinfo=ZoneInfo("UTC"))) == 2
+
+    def test_closed_market_uses_overnight_ttl(self):
+        """Test prices are kept longer before the open, after the close and on weekends."""
+        ttl = CacheTTLConfig(price_data_market_hours=2, price_data_overnight=12)
+
+        assert price_ttl_hours(ttl, datetime(2025, 1, 8, 9, 29, tzinfo=self.NEW_YORK)) == 12
+        assert price_ttl_hours(ttl, datetime(2025, 1, 8, 16, 0, tzinfo=self.NEW_YORK)) == 12
+        assert price_ttl_hours(ttl, datetime(2025, 1, 11, 12, 0, tzinfo=self.NEW_YORK)) == 12
+        # Defaults come from CacheTTLConfig
+        assert price_ttl_hours(now=datetime(2025, 1, 11, 12, 0, tzinfo=self.NEW_YORK)) == 24
+
+
 @pytest.mark.unit
 class TestCacheManager:
     """Test CacheManager functionality."""
@@ -145,6 +184,132 @@ class TestCacheManager:
         assert cache_manager.get("long") == "data"
         assert cache_manager.get("short") is None
 
+    def test_disk_round_trip_serialization(self, cache_dir):
+        """Test values written to disk read back in their documented on-disk form."""
+        writer = CacheManager(str(cache_dir))
+        writer.set(
+            "roundtrip:AAPL",
+            {
+                "as_of": datetime(2025, 1, 2, 15, 30),
+                "pe_ratio": float("nan"),
+                "volume": np.int64(1500),
+                "close": np.float64(151.25),
+                "by_year": {2024: "a"},
+            },
+            ttl_hours=1,
+        )
+
+        # Fresh instance so the value comes from disk, not the memory cache
+        data = CacheManager(str(cache_dir)).get("roundtrip:AAPL")
+
+        assert data["as_of"] == "2025-01-02T15:30:00"  # ISO, naive (no UTC offset)
+        assert data["pe_ratio"] is None  # NaN is stored as null
+        assert data["volume"] == 1500
+        assert data["close"] == 151.25
+        assert data["by_year"] == {"2024": "a"}
+
+    def test_array_payload_stored_as_npy(self, cache_dir):
+        """Test numeric arrays are written to .npy and memory-mapped on read."""
+        prices = np.array(
+            [(np.datetime64("2025-01-02", "ns"), 151.25, 1500)],
+            dtype=[("date", "datetime64[ns]"), ("close", "f8"), ("volume", "i8")],
+        )
+        writer = CacheManager(str(cache_dir))
+        writer.set("prices:AAPL:2025-01-01:2025-01-02", prices, ttl_hours=1)
+
+        npy_path = cache_dir / "AAPL_prices_2025-01-01_2025-01-02.npy"
+        assert npy_path.exists()
+
+        data = CacheManager(str(cache_dir)).get("prices:AAPL:2025-01-01:2025-01-02")
+
+        assert isinstance(data, np.memmap)
+        assert data.dtype == prices.dtype
+        assert data["close"].tolist() == [151.25]
+
+        writer.delete("prices:AAPL:2025-01-01:2025-01-02")
+        assert not npy_path.exists()
+
+    def test_expired_array_payload_removed(self, cache_manager):
+        """Test cleanup removes the .npy payload along with its JSON envelope."""
+        cache_manager.set("prices:MSFT", np.arange(3, dtype="f8"), ttl_hours=0)
+        cache_manager._memory_cache.clear()
+
+        assert cache_manager.cleanup_expired() == 1
+        assert not list(cache_manager.cache_dir.glob("*.npy"))
+
+    def test_get_typed_from_disk(self, cache_dir):
+        """Test typed reads validate the raw cache file into the target type."""
+        CacheManager(str(cache_dir)).set(
+            "quotes:AAPL",
+            [{"ticker": "AAPL", "close": "151.25", "as_of": datetime(2025, 1, 2)}],
+            ttl_hours=1,
+        )
+
+        quotes = CacheManager(str(cache_dir)).get_typed("quotes:AAPL", list[_Quote])
+
+        assert quotes == [_Quote(ticker="AAPL", close=151.25, as_of=datetime(2025, 1, 2))]
+
+    def test_get_typed_from_memory(self, cache_manager):
+        """Test typed reads validate memory cache hits too."""
+        cache_manager.set(
+            "quote:MSFT", {"ticker": "MSFT", "close": 410.0, "as_of": "2025-01-02"}, 1
+        )
+
+        quote = cache_manager.get_typed("quote:MSFT", _Quote)
+
+        assert isinstance(quote, _Quote)
+        assert quote.as_of == datetime(2025, 1, 2)
+        # The memory cache keeps the plain data for untyped readers
+        assert isinstance(cache_manager.get("quote:MSFT"), dict)
+
+    def test_get_typed_invalid_keeps_file(self, cache_dir):
+        """Test a payload of the wrong shape returns the default without deleting it."""
+        CacheManager(str(cache_dir)).set("quote:BAD", {"ticker": "BAD"}, ttl_hours=1)
+        manager = CacheManager(str(cache_dir))
+
+        assert manager.get_typed("quote:BAD", _Quote, default="fallback") == "fallback"
+        assert manager.get("quote:BAD") == {"ticker": "BAD"}
+
+    def test_get_typed_missing_and_expired(self, cache_dir):
+        """Test typed reads return None for missing keys and drop expired files."""
+        writer = CacheManager(str(cache_dir))
+        writer.set("quote:OLD", {"ticker": "OLD", "close": 1.0, "as_of": "2025-01-02"}, 0)
+        manager = CacheManager(str(cache_dir))
+
+        assert manager.get_typed("quote:NONE", _Quote) is None
+        assert manager.get_typed("quote:OLD", _Quote) is None
+        assert not writer._get_file_path("quote:OLD").exists()
+
+    def test_path_for_matches_set(self, cache_manager):
+        """Test path_for returns the file written for the equivalent key."""
+        cache_manager.set("prices:AAPL:2025-01-01:2025-01-02", {"count": 1}, ttl_hours=1)
+
+        path = cache_manager.path_for("prices", "aapl", "2025-01-01", "2025-01-02")
+
+        assert path == cache_manager.cache_dir / "AAPL_prices_2025-01-01_2025-01-02.json"
+        assert path.exists()
+        assert cache_manager.path_for("prices", "AAPLE").name == "AAPLE_prices.json"
+
+    def test_index_groups_files_by_ticker(self, cache_manager):
+        """Test the cache index covers nested price CSVs and legacy file names."""
+        cache_manager.set("prices:AAPL:2025-01-01:2025-01-02", {"count": 1}, ttl_hours=1)
+        cache_manager.set("news_sentiment:aapl:2025-01-01:2025-01-02", {"count": 1}, ttl_hours=1)
+        cache_manager.set("prices:NOVO-B.CO", {"count": 1}, ttl_hours=1)
+        (cache_manager.cache_dir / "prices_MSFT_2024-01-01_2024-01-03.json").write_text("{}")
+        prices_dir = cache_manager.cache_dir / "prices"
+        prices_dir.mkdir()
+        (prices_dir / "AAPL.csv").write_text("date,close\n")
+
+        index = cache_manager.index()
+
+        assert set(index) == {"AAPL", "MSFT", "NOVO-B.CO"}
+        assert [path.name for path in index["AAPL"]] == [
+            "AAPL.csv",
+            "AAPL_news_2025-01-01_2025-01-02.json",
+            "AAPL_prices_2025-01-01_2025-01-02.json",
+        ]
+        assert index["MSFT"][0].name == "prices_MSFT_2024-01-01_2024-01-03.json"
+
     def test_get_latest_price(self, cache_manager):
         """Test getting latest price for a ticker."""
         # Create a price cache file directly (simulating real cache file)
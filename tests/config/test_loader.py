@@ -5,7 +5,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from src.config.loader import ConfigLoader
+from src.config.loader import ConfigLoader, clear_config_cache, load_config
 from src.config.schemas import Config
 
 
@@ -149,6 +149,27 @@ class TestConfigLoader:
         with pytest.raises(ValueError):
             loader.load()
 
+    def test_load_config_cached_per_file_version(self, tmp_path):
+        """Test load_config parses once per file version and returns copies."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"capital": {"starting_capital_eur": 2000}}))
+        clear_config_cache()
+
+        with patch.object(
+            ConfigLoader, "load", autospec=True, side_effect=ConfigLoader.load
+        ) as load:
+            first = load_config(config_file)
+            first.capital.starting_capital_eur = 1
+            second = load_config(config_file)
+
+            assert load.call_count == 1
+            assert second.capital.starting_capital_eur == 2000
+
+            # Editing the file invalidates the cached entry
+            config_file.write_text(yaml.dump({"capital": {"starting_capital_eur": 30000}}))
+            assert load_config(config_file).capital.starting_capital_eur == 30000
+            assert load.call_count == 2
+
 
 @pytest.mark.unit
 class TestConfigSchemas:
@@ -0,0 +1,29 @@
+"""Unit tests for the shared HTTP session."""
+
+from unittest.mock import MagicMock, patch
+
+from src.data.finnhub import FinnhubProvider
+from src.data.http import get_http_session
+
+
+class TestHttpSession:
+    """Test suite for the shared provider HTTP session."""
+
+    def test_session_is_shared_and_pooled(self):
+        """Test one pooled session is reused across calls."""
+        session = get_http_session()
+
+        assert get_http_session() is session
+        adapter = session.get_adapter("https://finnhub.io/api/v1")
+        assert adapter._pool_maxsize == 16
+
+    def test_provider_requests_use_shared_session(self):
+        """Test provider API calls go through the shared session."""
+        provider = FinnhubProvider(api_key="test-key")
+        response = MagicMock()
+        response.json.return_value = []
+
+        with patch.object(get_http_session(), "get", return_value=response) as mock_get:
+            provider.get_news("AAPL", limit=5)
+
+        mock_get.assert_called_once()
@@ -0,0 +1,93 @@
+"""Tests for data models."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.data.models import PRICE_DTYPE, InstrumentType, Market, PriceSeries, StockPrice
+
+
+class TestPriceSeries:
+    """Test suite for PriceSeries."""
+
+    @pytest.fixture
+    def prices(self):
+        """Create three daily StockPrice records."""
+        return [
+            StockPrice(
+                ticker="AAPL",
+                name="Apple Inc.",
+                market=Market.US,
+                instrument_type=InstrumentType.STOCK,
+                date=datetime(2025, 1, day),
+                open_price=100.0 + day,
+                high_price=102.0 + day,
+                low_price=99.0 + day,
+                close_price=101.0 + day,
+                volume=1000 * day,
+                adjusted_close=None if day == 3 else 100.5 + day,
+                currency="USD",
+            )
+            for day in (1, 2, 3)
+        ]
+
+    @pytest.fixture
+    def series(self, prices):
+        """Create a PriceSeries from the sample prices."""
+        return PriceSeries.from_prices(prices)
+
+    def test_from_prices(self, series):
+        """Test building a series keeps metadata and fills the structured array."""
+        assert series.data.dtype == PRICE_DTYPE
+        assert len(series) == 3
+        assert series.ticker == "AAPL"
+        assert series.market == "us"
+        assert series.instrument_type == "stock"
+        assert series.currency == "USD"
+        # Missing adjusted close is stored as the close price
+        assert series["adjusted_close"].tolist() == [101.5, 102.5, 104.0]
+
+    def test_column_access(self, series):
+        """Test string keys return column arrays."""
+        close = series["close"]
+
+        assert isinstance(close, np.ndarray)
+        assert close.tolist() == [102.0, 103.0, 104.0]
+        assert series["volume"].tolist() == [1000, 2000, 3000]
+
+    def test_index_returns_stock_price(self, series, prices):
+        """Test integer indexing materializes an equivalent StockPrice."""
+        first = series[0]
+        last = series[-1]
+
+        assert isinstance(first, StockPrice)
+        assert first.date == datetime(2025, 1, 1)
+        assert first.close_price == 102.0
+        assert last.volume == 3000
+        assert first.model_dump() == prices[0].model_dump()
+
+    def test_slice_returns_series(self, series):
+        """Test slicing keeps the columnar representation."""
+        window = series[-2:]
+
+        assert isinstance(window, PriceSeries)
+        assert len(window) == 2
+        assert window.ticker == "AAPL"
+        assert window[0].date == datetime(2025, 1, 2)
+
+    def test_tail(self, series):
+        """Test tail returns the last rows as structured records."""
+        rows = series.tail(2)
+
+        assert [float(row["close"]) for row in rows] == [103.0, 104.0]
+        assert len(series.tail(10)) == 3
+        assert len(series.tail(0)) == 0
+
+    def test_iteration_and_truthiness(self, series):
+        """Test the series behaves like a list of StockPrice objects."""
+        closes = [price.close_price for price in series]
+
+        assert closes == [102.0, 103.0, 104.0]
+        assert series
+        assert not series[:0]
@@ -0,0 +1,240 @@
+"""Tests for the unified CSV price data manager."""
+
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from src.data import price_manager as price_manager_module
+from src.data.price_manager import PriceDataManager
+
+
+class TestPriceDataManager:
+    """Test suite for PriceDataManager."""
+
+    @pytest.fixture
+    def price_manager(self, tmp_path):
+        """Create a price manager with weekday closes for AAPL and MSFT."""
+        manager = PriceDataManager(prices_dir=tmp_path / "prices")
+        for ticker, base in (("AAPL", 100.0), ("MSFT", 400.0)):
+            # 2025-01-06 (Mon) to 2025-01-10 (Fri), then 2025-01-20 (Mon)
+            days = [6, 7, 8, 9, 10, 20]
+            manager.store_prices(
+                ticker,
+                pd.DataFrame(
+                    {
+                        "date": [datetime(2025, 1, day) for day in days],
+                        "open": [base + day for day in days],
+                        "high": [base + day for day in days],
+                        "low": [base + day for day in days],
+                        "close": [base + day for day in days],
+                        "volume": [1000 * day for day in days],
+                    }
+                ),
+            )
+        return manager
+
+    def test_get_price_at_date(self, price_manager):
+        """Test exact dates, weekend fallback and the tolerance window."""
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 8))["close"] == 108.0
+        # Saturday falls back to Friday
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 11))["close"] == 110.0
+        # More than 5 days after the last earlier row
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 17)) is None
+        # Before the first row
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 1)) is None
+        assert price_manager.get_price_at_date("NONE", date(2025, 1, 8)) is None
+
+    def test_get_prices_at_dates_batch(self, price_manager, monkeypatch):
+        """Test batch lookups read each ticker once and key results by the input pairs."""
+        reads = []
+        original_read = price_manager._read_csv
+        monkeypatch.setattr(
+            price_manager,
+            "_read_csv",
+            lambda ticker, fields=None: reads.append(ticker) or original_read(ticker, fields),
+        )
+        lookups = [
+            ("AAPL", datetime(2025, 1, 7)),
+            ("msft", datetime(2025, 1, 12, 15, 30)),
+            ("AAPL", date(2025, 1, 20)),
+            ("AAPL", date(2025, 1, 17)),
+            ("NONE", date(2025, 1, 7)),
+        ]
+
+        prices = price_manager.get_prices_at_dates(lookups)
+
+        assert sorted(reads) == ["AAPL", "MSFT"]
+        assert set(prices) == set(lookups)
+        assert prices[("AAPL", datetime(2025, 1, 7))]["close"] == 107.0
+        assert prices[("msft", datetime(2025, 1, 12, 15, 30))]["date"] == pd.Timestamp("2025-01-10")
+        assert prices[("AAPL", date(2025, 1, 20))]["volume"] == 20000
+        assert prices[("AAPL", date(2025, 1, 17))] is None
+        assert prices[("NONE", date(2025, 1, 7))] is None
+
+    def test_get_price_at_date_fields(self, price_manager):
+        """Test a field projection only returns and parses the requested columns."""
+        price = price_manager.get_price_at_date("AAPL", date(2025, 1, 11), fields=("date", "close"))
+
+        assert price == {"date": pd.Timestamp("2025-01-10"), "close": 110.0}
+        assert list(price_manager.get_prices("AAPL", fields=("close",)).columns) == [
+            "date",
+            "close",
+        ]
+
+        # Prefetched windows hold every column but return the same projection
+        price_manager.prefetch_window(["AAPL"], date(2025, 1, 6), date(2025, 1, 20))
+        assert price_manager.get_price_at_date(
+            "AAPL", date(2025, 1, 11), fields=("date", "close")
+        ) == {"date": pd.Timestamp("2025-01-10"), "close": 110.0}
+
+    def test_get_latest_prices(self, price_manager, monkeypatch):
+        """Test latest prices are read once per ticker and keyed by the input names."""
+        reads = []
+        original_read = price_manager._read_last_row
+        monkeypatch.setattr(
+            price_manager,
+            "_read_last_row",
+            lambda ticker, fields=None: reads.append(ticker) or original_read(ticker, fields),
+        )
+
+        latest = price_manager.get_latest_prices(["AAPL", "msft", "aapl", "NONE"])
+
+        assert sorted(reads) == ["AAPL", "MSFT", "NONE"]
+        assert latest["AAPL"]["close"] == 120.0
+        assert latest["aapl"]["date"] == pd.Timestamp("2025-01-20")
+        assert latest["msft"]["currency"] == "USD"
+        assert latest["NONE"] is None
+        assert price_manager.get_latest_prices(["MSFT"], fields=("date", "close")) == {
+            "MSFT": {"date": pd.Timestamp("2025-01-20"), "close": 420.0}
+        }
+        assert price_manager.get_latest_price("MSFT")["volume"] == 20000
+
+    def test_get_latest_prices_reads_concurrently(self, price_manager, monkeypatch):
+        """Test the CSV files of several tickers are read in parallel."""
+        # Both reads must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+        original_read = price_manager._read_last_row
+
+        def read_last_row(ticker, fields=None):
+            barrier.wait()
+            return original_read(ticker, fields)
+
+        monkeypatch.setattr(price_manager, "_read_last_row", read_last_row)
+
+        latest = price_manager.get_latest_prices(["AAPL", "MSFT"], fields=("close",))
+
+        assert latest == {"AAPL": {"close": 120.0}, "MSFT": {"close": 420.0}}
+
+    def test_read_last_row(self, price_manager, monkeypatch):
+        """Test only the last CSV row is parsed, whatever the size of the tail block."""
+        monkeypatch.setattr(price_manager_module, "_TAIL_BLOCK_BYTES", 4)
+
+        last = price_manager._read_last_row("AAPL", fields=("close",))
+
+        assert last.to_dict("records") == [{"date": pd.Timestamp("2025-01-20"), "close": 120.0}]
+        assert price_manager._read_last_row("NONE").empty
+
+    def test_date_lookups_are_cached(self, price_manager, monkeypatch):
+        """Test repeated lookups skip the CSV until the ticker's prices change."""
+        first = price_manager.get_price_at_date("AAPL", date(2025, 1, 8))
+        first["close"] = 0.0
+        monkeypatch.setattr(
+            price_manager,
+            "_read_csv",
+            lambda ticker, _fields=None: pytest.fail(f"read {ticker} from disk"),
+        )
+
+        assert price_manager.get_price_at_date("aapl", datetime(2025, 1, 8))["close"] == 108.0
+        monkeypatch.undo()
+
+        price_manager.store_prices(
+            "AAPL",
+            pd.DataFrame(
+                {
+                    "date": [datetime(2025, 1, 8)],
+                    "open": [1.0],
+                    "high": [1.0],
+                    "low": [1.0],
+                    "close": [1.0],
+                    "volume": [1],
+                }
+            ),
+        )
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 8))["close"] == 1.0
+
+    def test_date_lookups_see_writes_from_other_instances(self, price_manager):
+        """Test cached hits and misses are dropped when another instance rewrites the CSV."""
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 8))["close"] == 108.0
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 17)) is None
+        assert price_manager.get_price_at_date("NVDA", date(2025, 1, 8)) is None
+
+        other = PriceDataManager(prices_dir=price_manager.prices_dir)
+        for ticker in ("AAPL", "NVDA"):
+            other.store_prices(
+                ticker,
+                pd.DataFrame(
+                    {
+                        "date": [datetime(2025, 1, 8), datetime(2025, 1, 16)],
+                        "open": [1.0, 2.0],
+                        "high": [1.0, 2.0],
+                        "low": [1.0, 2.0],
+                        "close": [1.0, 2.0],
+                        "volume": [1, 2],
+                    }
+                ),
+            )
+
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 8))["close"] == 1.0
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 17))["close"] == 2.0
+        assert price_manager.get_price_at_date("NVDA", date(2025, 1, 8))["close"] == 1.0
+
+    def test_clear_price_cache_and_size_limit(self, price_manager, monkeypatch):
+        """Test the date cache is bounded and can be cleared."""
+        monkeypatch.setattr(PriceDataManager, "DATE_CACHE_SIZE", 2)
+        price_manager.get_prices_at_dates(
+            [("AAPL", date(2025, 1, 6)), ("AAPL", date(2025, 1, 7)), ("MSFT", date(2025, 1, 8))]
+        )
+
+        assert len(price_manager._date_cache) == 2
+        price_manager.clear_price_cache()
+        assert not price_manager._date_cache
+
+    def test_prefetch_window_serves_lookups(self, price_manager, monkeypatch):
+        """Test lookups inside a prefetched window skip the CSV files."""
+        price_manager.prefetch_window(["aapl", "MSFT"], date(2025, 1, 8), date(2025, 1, 20))
+        monkeypatch.setattr(
+            price_manager,
+            "_read_csv",
+            lambda ticker, _fields=None: pytest.fail(f"read {ticker} from disk"),
+        )
+
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 8))["close"] == 108.0
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 17)) is None
+        assert price_manager.get_price_at_date("MSFT", datetime(2025, 1, 20, 16))["close"] == 420.0
+        # Earlier rows needed for the tolerance look-back are part of the window
+        assert price_manager.get_price_at_date("MSFT", date(2025, 1, 12))["close"] == 410.0
+
+    def test_prefetch_window_fallback_and_invalidation(self, price_manager):
+        """Test lookups outside the window read the CSV and new data drops the window."""
+        price_manager.prefetch_window(["AAPL"], date(2025, 1, 9), date(2025, 1, 10))
+
+        # Outside the window and with a larger tolerance: served from the CSV
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 6))["close"] == 106.0
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 17), 10)["close"] == 110.0
+
+        price_manager.store_prices(
+            "AAPL",
+            pd.DataFrame(
+                {
+                    "date": [datetime(2025, 1, 10)],
+                    "open": [1.0],
+                    "high": [1.0],
+                    "low": [1.0],
+                    "close": [1.0],
+                    "volume": [1],
+                }
+            ),
+        )
+        assert price_manager.get_price_at_date("AAPL", date(2025, 1, 10))["close"] == 1.0
@@ -0,0 +1,195 @@
+"""Tests for ProviderManager."""
+
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.data.models import InstrumentType, Market, PriceSeries, StockPrice
+from src.data.provider_manager import (
+    ProviderManager,
+    clear_provider_manager_cache,
+    get_provider_manager,
+)
+
+
+class TestProviderManagerBatchPrices:
+    """Test suite for ProviderManager.get_stock_prices_batch."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a ProviderManager with a mocked primary provider."""
+        manager = ProviderManager(backup_providers=[])
+        provider = MagicMock()
+        provider.name = "yahoo_finance"
+        provider.is_available = True
+        manager.primary_provider = provider
+        return manager
+
+    def test_batch_result_used_without_fallback(self, manager):
+        """Test that tickers returned by the batch call are not refetched."""
+        manager.primary_provider.get_stock_prices_batch.return_value = {
+            "AAPL": ["aapl-prices"],
+            "MSFT": ["msft-prices"],
+        }
+
+        with patch.object(manager, "get_stock_prices") as mock_single:
+            results = manager.get_stock_prices_batch(["aapl", "MSFT"], period="5d")
+
+        mock_single.assert_not_called()
+        assert results == {"AAPL": ["aapl-prices"], "MSFT": ["msft-prices"]}
+
+    def test_missing_ticker_falls_back_to_single_fetch(self, manager):
+        """Test that tickers omitted by the batch call are fetched individually."""
+        manager.primary_provider.get_stock_prices_batch.return_value = {"AAPL": ["aapl-prices"]}
+
+        with patch.object(
+            manager, "get_stock_prices", return_value=["googl-prices"]
+        ) as mock_single:
+            results = manager.get_stock_prices_batch(
+                ["AAPL", "googl"], period="5d", fetch_metadata=False
+            )
+
+        manager.primary_provider.get_stock_prices_batch.assert_called_once_with(
+            ["AAPL", "googl"], period="5d", fetch_metadata=False
+        )
+        mock_single.assert_called_once_with("GOOGL", period="5d", fetch_metadata=False)
+        assert results == {"AAPL": ["aapl-prices"], "GOOGL": ["googl-prices"]}
+
+    def test_batch_failure_falls_back_to_single_fetches(self, manager):
+        """Test that a failing batch call falls back and skips tickers that still fail."""
+        manager.primary_provider.get_stock_prices_batch.side_effect = RuntimeError("boom")
+
+        def single_fetch(ticker, **_kwargs):
+            if ticker == "BAD":
+                raise RuntimeError("All providers failed")
+            return [f"{ticker}-prices"]
+
+        with patch.object(manager, "get_stock_prices", side_effect=single_fetch) as mock_single:
+            results = manager.get_stock_prices_batch(["AAPL", "BAD"], period="5d")
+
+        assert mock_single.call_count == 2
+        assert results == {"AAPL": ["AAPL-prices"]}
+        assert manager.provider_failures["yahoo_finance"] == 1
+
+    def test_fallback_fetches_run_concurrently(self, manager):
+        """Test per-ticker fallback fetches overlap instead of running one by one."""
+        manager.primary_provider.get_stock_prices_batch.return_value = {}
+        # Both fetches must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+
+        def single_fetch(ticker, **_kwargs):
+            barrier.wait()
+            return [f"{ticker}-prices"]
+
+        with patch.object(manager, "get_stock_prices", side_effect=single_fetch):
+            results = manager.get_stock_prices_batch(["AAPL", "MSFT", "aapl"], period="5d")
+
+        assert results == {"AAPL": ["AAPL-prices"], "MSFT": ["MSFT-prices"]}
+
+    def test_fallback_fetches_throttled_by_rate_limiter(self, manager):
+        """Test a given rate limiter is charged once per sequential fallback fetch."""
+        manager.primary_provider.get_stock_prices_batch.side_effect = RuntimeError("boom")
+        rate_limiter = MagicMock()
+        calls = []
+
+        def single_fetch(ticker, **_kwargs):
+            calls.append((ticker, rate_limiter.wait_if_needed.call_count))
+            return [f"{ticker}-prices"]
+
+        with patch.object(manager, "get_stock_prices", side_effect=single_fetch):
+            results = manager.get_stock_prices_batch(
+                ["AAPL", "MSFT"], period="5d", rate_limiter=rate_limiter
+            )
+
+        # Each fetch runs only after its own token was taken
+        assert calls == [("AAPL", 1), ("MSFT", 2)]
+        assert results == {"AAPL": ["AAPL-prices"], "MSFT": ["MSFT-prices"]}
+
+
+def make_series(ticker: str) -> PriceSeries:
+    """Create a one-day PriceSeries for the given ticker."""
+    return PriceSeries.from_prices(
+        [
+            StockPrice(
+                ticker=ticker,
+                name=ticker,
+                market=Market.US,
+                instrument_type=InstrumentType.ETF,
+                date=datetime(2025, 9, 1),
+                open_price=100.0,
+                high_price=101.0,
+                low_price=99.0,
+                close_price=100.5,
+                volume=1000,
+                currency="USD",
+            )
+        ]
+    )
+
+
+class TestProviderManagerDateRange:
+    """Test suite for ProviderManager.get_stock_prices with explicit date ranges."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a ProviderManager with mocked primary and backup providers."""
+        manager = ProviderManager(backup_providers=[])
+        primary = MagicMock()
+        primary.name = "yahoo_finance"
+        primary.is_available = True
+        backup = MagicMock()
+        backup.name = "fixture"
+        backup.is_available = True
+        manager.primary_provider = primary
+        manager.backup_providers = [backup]
+        return manager
+
+    def test_date_range_forwarded_to_yahoo(self, manager):
+        """Test start/end dates are passed through instead of a period."""
+        start, end = datetime(2025, 9, 1), datetime(2025, 10, 1)
+        series = make_series("SPY")
+        manager.primary_provider.get_stock_prices.return_value = series
+
+        prices = manager.get_stock_prices(
+            "SPY", start_date=start, end_date=end, fetch_metadata=False
+        )
+
+        assert prices is series
+        manager.primary_provider.get_stock_prices.assert_called_once_with(
+            "SPY", start, end, fetch_metadata=False
+        )
+
+    def test_date_range_falls_back_to_backup(self, manager):
+        """Test backup providers are usable when an explicit range is given."""
+        start = datetime(2025, 9, 1)
+        manager.primary_provider.get_stock_prices.side_effect = RuntimeError("boom")
+        series = make_series("SPY")
+        manager.backup_providers[0].get_stock_prices.return_value = series
+
+        prices = manager.get_stock_prices("SPY", start_date=start)
+
+        assert prices is series
+        args = manager.backup_providers[0].get_stock_prices.call_args.args
+        assert args[:2] == ("SPY", start)
+        assert isinstance(args[2], datetime)
+
+
+class TestGetProviderManager:
+    """Test suite for the shared get_provider_manager() factory."""
+
+    def test_same_settings_share_instance(self):
+        """Test repeated calls reuse one instance until the cache is cleared."""
+        clear_provider_manager_cache()
+
+        first = get_provider_manager(backup_providers=["fixture"])
+        second = get_provider_manager(backup_providers=["fixture"])
+        other = get_provider_manager(backup_providers=[])
+
+        assert first is second
+        assert other is not first
+        assert first.backup_provider_names == ["fixture"]
+
+        clear_provider_manager_cache()
+        assert get_provider_manager(backup_providers=["fixture"]) is not first
@@ -3,10 +3,11 @@
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.data.models import StockPrice
+from src.data.models import PriceSeries, StockPrice
 from src.data.yahoo_finance import YahooFinanceProvider
 
 
@@ -187,6 +188,153 @@ class TestYahooFinanceProvider:
         assert isinstance(prices[0], StockPrice)
         mock_download.assert_called_once()
 
+    @patch("src.data.yahoo_finance.yf.Ticker")
+    @patch("src.data.yahoo_finance.yf.download")
+    def test_get_stock_prices_batch(self, mock_download, mock_ticker_class, provider):
+        """Test batched price fetching slices the grouped DataFrame per ticker."""
+        index = pd.DatetimeIndex(["2025-01-01", "2025-01-02"])
+        frames = {
+            "AAPL": pd.DataFrame(
+                {
+                    "Open": [150.0, 151.0],
+                    "High": [152.0, 153.0],
+                    "Low": [149.0, 150.0],
+                    "Close": [151.0, 152.0],
+                    "Adj Close": [151.0, 152.0],
+                    "Volume": [1000000, 1100000],
+                },
+                index=index,
+            ),
+            "MSFT": pd.DataFrame(
+                {
+                    "Open": [400.0, 401.0],
+                    "High": [402.0, 403.0],
+                    "Low": [399.0, 400.0],
+                    "Close": [401.0, 402.0],
+                    "Adj Close": [401.0, 402.0],
+                    "Volume": [2000000, 2100000],
+                },
+                index=index,
+            ),
+        }
+        mock_download.return_value = pd.concat(frames, axis=1)
+        mock_ticker_class.return_value.info = {"longName": "Test Inc."}
+
+        results = provider.get_stock_prices_batch(["AAPL", "MSFT", "GOOGL"], period="5d")
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args.kwargs["group_by"] == "ticker"
+        assert set(results) == {"AAPL", "MSFT"}
+        assert len(results["MSFT"]) == 2
+        assert results["MSFT"][1].close_price == 402.0
+        assert results["AAPL"][0].ticker == "AAPL"
+
+    @patch("src.data.yahoo_finance.yf.Ticker")
+    @patch("src.data.yahoo_finance.yf.download")
+    def test_get_stock_prices_batch_lowercase_tickers(
+        self, mock_download, mock_ticker_class, provider
+    ):
+        """Test batch lookup matches yfinance's upper-cased ticker columns."""
+        frame = pd.DataFrame(
+            {
+                "Open": [150.0],
+                "High": [152.0],
+                "Low": [149.0],
+                "Close": [151.0],
+                "Adj Close": [151.0],
+                "Volume": [1000000],
+            },
+            index=pd.DatetimeIndex(["2025-01-01"]),
+        )
+        mock_download.return_value = pd.concat({"AAPL": frame, "MSFT": frame}, axis=1)
+        mock_ticker_class.return_value.info = {"longName": "Test Inc."}
+
+        results = provider.get_stock_prices_batch(["aapl", "msft"], period="5d")
+
+        assert set(results) == {"AAPL", "MSFT"}
+
+    @patch("src.data.yahoo_finance.yf.download")
+    def test_get_stock_prices_batch_flat_columns_multiple_tickers(self, mock_download, provider):
+        """Test ungrouped columns are not attributed to several tickers."""
+        mock_download.return_value = pd.DataFrame(
+            {"Open": [150.0], "High": [152.0], "Low": [149.0], "Close": [151.0], "Volume": [1]},
+            index=pd.DatetimeIndex(["2025-01-01"]),
+        )
+
+        assert provider.get_stock_prices_batch(["AAPL", "MSFT"], period="5d") == {}
+
+    @patch("src.data.yahoo_finance.yf.Ticker")
+    def test_dataframe_to_prices_columnar(self, mock_ticker_class, provider):
+        """Test conversion fills the structured array and drops invalid rows."""
+        mock_ticker_class.return_value.info = {"longName": "Apple Inc."}
+        data = pd.DataFrame(
+            {
+                "Open": [150.0, None, 152.0, 153.0],
+                "High": [152.0, 153.0, 154.0, 155.0],
+                "Low": [149.0, 150.0, 151.0, 152.0],
+                "Close": [151.0, 152.0, -1.0, 154.0],
+                "Adj Close": [150.5, 151.5, 152.5, None],
+                "Volume": [1000000, 1100000, 1200000, 1300000],
+            },
+            index=pd.DatetimeIndex(
+                ["2025-01-01 09:30", "2025-01-02 09:30", "2025-01-03 09:30", "2025-01-06 09:30"],
+                tz="America/New_York",
+            ),
+        )
+
+        series = provider._dataframe_to_prices("aapl", data)
+
+        assert isinstance(series, PriceSeries)
+        assert series.ticker == "AAPL"
+        assert series.name == "Apple Inc."
+        assert series.currency == "USD"
+        # NaN open and negative close rows are dropped
+        assert len(series) == 2
+        assert series["close"].tolist() == [151.0, 154.0]
+        # Missing adjusted close falls back to close
+        assert series["adjusted_close"].tolist() == [150.5, 154.0]
+        assert series["volume"].dtype == np.int64
+        # Timezone is stripped, keeping exchange-local wall time
+        assert series[0].date == datetime(2025, 1, 1, 9, 30)
+        assert series[1].date.tzinfo is None
+
+    @patch("src.data.yahoo_finance.yf.Ticker")
+    def test_get_stock_prices_without_metadata(self, mock_ticker_class, provider):
+        """Test the company name lookup is skipped when metadata is not requested."""
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = pd.DataFrame(
+            {"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [10]},
+            index=pd.DatetimeIndex(["2025-01-01"]),
+        )
+        mock_ticker_class.return_value = mock_ticker
+
+        with patch.object(provider, "_get_ticker_name") as mock_name:
+            prices = provider.get_stock_prices("aapl", period="5d", fetch_metadata=False)
+
+        mock_name.assert_not_called()
+        assert prices.name == "AAPL"
+        assert prices[0].close_price == 1.5
+
+    def test_dataframe_to_prices_without_adj_close(self, provider):
+        """Test adjusted close defaults to close when the column is absent."""
+        data = pd.DataFrame(
+            {"Open": [1.0], "High": [2.0], "Low": [0.5], "Close": [1.5], "Volume": [10]},
+            index=pd.DatetimeIndex(["2025-01-01"]),
+        )
+
+        series = provider._dataframe_to_prices("AAPL", data)
+
+        assert series[0].adjusted_close == 1.5
+
+    def test_dataframe_to_prices_missing_columns(self, provider):
+        """Test a frame without OHLCV columns yields an empty series."""
+        data = pd.DataFrame({"Close": [1.0]}, index=pd.DatetimeIndex(["2025-01-01"]))
+
+        series = provider._dataframe_to_prices("AAPL", data)
+
+        assert len(series) == 0
+        assert not series
+
     @patch("src.data.yahoo_finance.yf.Ticker")
     def test_get_latest_price_success(self, mock_ticker_class, provider):
         """Test successful latest price fetching."""
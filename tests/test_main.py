@@ -11,6 +11,8 @@ from typer.testing import CliRunner
 from src.cli import app
 from src.cli.helpers.downloads import download_price_data
 from src.cli.helpers.filtering import filter_tickers
+from src.data.models import InstrumentType, Market, PriceSeries, StockPrice
+from src.data.price_manager import PriceDataManager
 
 
 @pytest.fixture
@@ -422,6 +424,28 @@ class TestFilterTickers:
         assert call_args[1]["historical_date"] == historical_date
 
 
+def make_series(ticker: str, days: int = 1) -> PriceSeries:
+    """Create a PriceSeries with one record per day from 2024-01-01."""
+    return PriceSeries.from_prices(
+        [
+            StockPrice(
+                ticker=ticker,
+                name=ticker,
+                market=Market.US,
+                instrument_type=InstrumentType.STOCK,
+                date=datetime(2024, 1, day + 1),
+                open_price=100.0,
+                high_price=101.0,
+                low_price=99.0,
+                close_price=100.0 + day,
+                volume=1000,
+                currency="USD",
+            )
+            for day in range(days)
+        ]
+    )
+
+
 @pytest.mark.unit
 class TestDownloadPriceData:
     """Test download_price_data helper function."""
@@ -449,20 +473,17 @@ class TestDownloadPriceData:
         mock_price_manager.prices_dir = Path("/tmp/prices")
         mock_price_manager.has_data.return_value = False
 
-        # Mock price objects
-        mock_price1 = MagicMock()
-        mock_price1.model_dump.return_value = {"date": "2024-01-01", "close": 100.0}
-        mock_price2 = MagicMock()
-        mock_price2.model_dump.return_value = {"date": "2024-01-02", "close": 101.0}
-
         mock_provider_manager = mock_provider_manager_class.return_value
-        mock_provider_manager.get_stock_prices.return_value = [mock_price1, mock_price2]
+        mock_provider_manager.get_stock_prices_batch.return_value = {
+            "AAPL": make_series("AAPL", days=2),
+            "MSFT": make_series("MSFT", days=2),
+        }
 
         mock_price_manager.store_prices.return_value = 2
 
         # Execute with show_progress=True so we use the progressbar context manager
         with patch("src.cli.helpers.downloads.typer.progressbar") as mock_progressbar:
-            mock_progressbar.return_value.__enter__ = Mock(return_value=["AAPL", "MSFT"])
+            mock_progressbar.return_value.__enter__ = Mock(return_value=MagicMock())
             mock_progressbar.return_value.__exit__ = Mock(return_value=False)
 
             success, skipped, errors, _ = download_price_data(
@@ -475,7 +496,11 @@ class TestDownloadPriceData:
         assert success == 2
         assert skipped == 0
         assert errors == 0
-        assert mock_provider_manager.get_stock_prices.call_count == 2
+        mock_provider_manager.get_stock_prices_batch.assert_called_once_with(
+            ["AAPL", "MSFT"],
+            period="365d",
+            rate_limiter=mock_rate_limiter_class.return_value,
+        )
 
     @patch("src.cli.helpers.downloads.time.sleep")
     @patch("src.cli.helpers.downloads.RateLimiter")
@@ -506,7 +531,7 @@ class TestDownloadPriceData:
 
         # Execute without force refresh
         with patch("src.cli.helpers.downloads.typer.progressbar") as mock_progressbar:
-            mock_progressbar.return_value.__enter__ = Mock(return_value=["AAPL"])
+            mock_progressbar.return_value.__enter__ = Mock(return_value=MagicMock())
             mock_progressbar.return_value.__exit__ = Mock(return_value=False)
 
             success, skipped, errors, _ = download_price_data(
@@ -544,18 +569,14 @@ class TestDownloadPriceData:
         mock_price_manager.prices_dir = Path("/tmp/prices")
         mock_price_manager.has_data.return_value = True
 
-        # Mock price objects
-        mock_price = MagicMock()
-        mock_price.model_dump.return_value = {"date": "2024-01-01", "close": 100.0}
-
         mock_provider_manager = mock_provider_manager_class.return_value
-        mock_provider_manager.get_stock_prices.return_value = [mock_price]
+        mock_provider_manager.get_stock_prices_batch.return_value = {"AAPL": make_series("AAPL")}
 
         mock_price_manager.store_prices.return_value = 1
 
         # Execute with force refresh
         with patch("src.cli.helpers.downloads.typer.progressbar") as mock_progressbar:
-            mock_progressbar.return_value.__enter__ = Mock(return_value=["AAPL"])
+            mock_progressbar.return_value.__enter__ = Mock(return_value=MagicMock())
             mock_progressbar.return_value.__exit__ = Mock(return_value=False)
 
             success, skipped, errors, _ = download_price_data(
@@ -568,7 +589,7 @@ class TestDownloadPriceData:
         # Assert - should download even with existing file
         assert success == 1
         assert skipped == 0
-        mock_provider_manager.get_stock_prices.assert_called_once()
+        mock_provider_manager.get_stock_prices_batch.assert_called_once()
 
     @patch("src.cli.helpers.downloads.time.sleep")
     @patch("src.cli.helpers.downloads.RateLimiter")
@@ -594,11 +615,11 @@ class TestDownloadPriceData:
         mock_price_manager.has_data.return_value = False
 
         mock_provider_manager = mock_provider_manager_class.return_value
-        mock_provider_manager.get_stock_prices.side_effect = Exception("API error")
+        mock_provider_manager.get_stock_prices_batch.side_effect = Exception("API error")
 
         # Execute
         with patch("src.cli.helpers.downloads.typer.progressbar") as mock_progressbar:
-            mock_progressbar.return_value.__enter__ = Mock(return_value=["AAPL", "MSFT"])
+            mock_progressbar.return_value.__enter__ = Mock(return_value=MagicMock())
             mock_progressbar.return_value.__exit__ = Mock(return_value=False)
 
             success, skipped, errors, _ = download_price_data(
@@ -611,3 +632,79 @@ class TestDownloadPriceData:
         assert success == 0
         assert skipped == 0
         assert errors == 2
+
+    @patch("src.cli.helpers.downloads.RateLimiter")
+    @patch("src.cli.helpers.downloads.ProviderManager")
+    def test_download_price_data_stores_series_columns(
+        self,
+        mock_provider_manager_class,
+        mock_rate_limiter_class,
+        tmp_path,
+    ):
+        """Test fetched series are written to the price CSV without per-row models."""
+        mock_config = MagicMock()
+        mock_config.database.enabled = False
+        mock_config.analysis.historical_data_lookback_days = 365
+
+        mock_provider_manager = mock_provider_manager_class.return_value
+        mock_provider_manager.get_stock_prices_batch.return_value = {
+            "AAPL": make_series("AAPL", days=2)
+        }
+
+        with patch(
+            "src.cli.helpers.downloads.PriceDataManager",
+            return_value=PriceDataManager(prices_dir=tmp_path),
+        ):
+            success, _, errors, prices_dir = download_price_data(
+                tickers=["AAPL"],
+                config_obj=mock_config,
+                show_progress=False,
+            )
+
+        assert (success, errors) == (1, 0)
+        df = PriceDataManager(prices_dir=prices_dir).get_prices("AAPL")
+        assert df["close"].tolist() == [100.0, 101.0]
+        assert df["adj_close"].tolist() == [100.0, 101.0]
+        assert df["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-01-01", "2024-01-02"]
+        assert set(df["market"]) == {"us"}
+
+    @patch("src.cli.helpers.downloads.DOWNLOAD_BATCH_SIZE", 2)
+    @patch("src.cli.helpers.downloads.RateLimiter")
+    @patch("src.cli.helpers.downloads.ProviderManager")
+    @patch("src.cli.helpers.downloads.PriceDataManager")
+    def test_download_price_data_batches(
+        self,
+        mock_price_manager_class,
+        mock_provider_manager_class,
+        mock_rate_limiter_class,
+    ):
+        """Test tickers are fetched in batches and missing tickers count as errors."""
+        # Setup mocks
+        mock_config = MagicMock()
+        mock_config.data.primary_provider = "yahoo_finance"
+        mock_config.data.backup_providers = []
+        mock_config.database.enabled = False
+        mock_config.analysis.historical_data_lookback_days = 365
+
+        mock_price_manager = mock_price_manager_class.return_value
+        mock_price_manager.prices_dir = Path("/tmp/prices")
+        mock_price_manager.has_data.return_value = False
+        mock_price_manager.store_prices.return_value = 1
+
+        # NVDA is missing from the first batch response
+        mock_provider_manager = mock_provider_manager_class.return_value
+        mock_provider_manager.get_stock_prices_batch.side_effect = [
+            {"AAPL": make_series("AAPL")},
+            {"MSFT": make_series("MSFT")},
+        ]
+
+        success, skipped, errors, _ = download_price_data(
+            tickers=["AAPL", "NVDA", "MSFT"],
+            config_obj=mock_config,
+            show_progress=False,
+        )
+
+        assert (success, skipped, errors) == (2, 0, 1)
+        batches = [c.args[0] for c in mock_provider_manager.get_stock_prices_batch.call_args_list]
+        assert batches == [["AAPL", "NVDA"], ["MSFT"]]
+        assert mock_rate_limiter_class.return_value.wait_if_needed.call_count == 2
@@ -574,6 +574,47 @@ class TestNewsFetcherTool:
         call_args = tool.news_aggregator.fetch_news.call_args
         assert call_args[1]["as_of_date"] is not None
 
+    def test_run_with_historical_date_cached(self, tool, mock_cache_manager, sample_articles):
+        """Test historical news is cached per analysis date and reused on replays."""
+        tool.set_historical_date(date(2024, 6, 15))
+        tool.news_aggregator.fetch_news = MagicMock(return_value=sample_articles)
+
+        result = tool.run("AAPL")
+
+        mock_cache_manager.set.assert_any_call(
+            "historical_news:AAPL:2024-06-15", result, ttl_hours=168
+        )
+
+        # A replay for the same date is served from the cache
+        mock_cache_manager.get.side_effect = lambda key: (
+            result if key == "historical_news:AAPL:2024-06-15" else None
+        )
+        assert tool.run("AAPL") is result
+        tool.news_aggregator.fetch_news.assert_called_once()
+
+    def test_historical_news_not_served_to_current_analysis(self, tmp_path, sample_articles):
+        """Test a cached historical entry is not returned by the current-mode lookup."""
+        cache_manager = CacheManager(cache_dir=tmp_path)
+        with patch("src.tools.fetchers.get_config") as mock_config:
+            mock_config.return_value.data.news.use_unified_aggregator = False
+            tool = NewsFetcherTool(cache_manager=cache_manager, use_local_sentiment=False)
+        tool.news_aggregator = MagicMock()
+        tool.news_aggregator.fetch_news.return_value = sample_articles[:1]
+
+        tool.set_historical_date(date.today())
+        historical = tool.run("AAPL", limit=10)
+
+        assert cache_manager.find_latest_by_prefix("news:AAPL") is None
+        assert cache_manager.get("news_sentiment:AAPL") is None
+        assert cache_manager.get(f"historical_news:AAPL:{date.today()}") == historical
+
+        tool.set_historical_date(None)
+        tool.news_aggregator.fetch_news.return_value = sample_articles
+        current = tool.run("AAPL", limit=10)
+
+        assert current["count"] == 3
+        assert tool.news_aggregator.fetch_news.call_count == 2
+
     def test_run_with_custom_limit(self, tool, sample_articles):
         """Test run with custom article limit."""
         tool.news_aggregator.fetch_news = MagicMock(return_value=sample_articles)
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.cache.manager import CacheManager
 from src.data.historical import HistoricalDataFetcher
 from src.data.models import (
     AnalystRating,
@@ -431,3 +432,71 @@ def test_historical_data_fetcher_earnings_estimates_error_handling():
     # Should have returned context with None estimates
     assert context.earnings_estimates is None
     assert context.data_available is False  # No price data
+
+
+@pytest.mark.parametrize(
+    "cached_date",
+    ["2024-06-01T00:00:00", "2024-06-01 00:00:00"],
+    ids=["iso_t_separator", "space_separator"],
+)
+def test_price_from_cache_restores_datetime(cached_date):
+    """Verify cached price records are rebuilt with a parsed datetime."""
+    record = {
+        "ticker": "AAPL",
+        "name": "Apple",
+        "market": "us",
+        "instrument_type": "stock",
+        "date": cached_date,
+        "open_price": 196.0,
+        "high_price": 198.0,
+        "low_price": 195.0,
+        "close_price": 197.0,
+        "adjusted_close": None,
+        "volume": 1100000,
+        "currency": "USD",
+    }
+
+    price = HistoricalDataFetcher._price_from_cache(record)
+
+    assert isinstance(price, StockPrice)
+    assert price.date == datetime(2024, 6, 1)
+    assert price.close_price == 197.0
+    assert price.volume == 1100000
+    # The cached record itself is left untouched
+    assert record["date"] == cached_date
+
+
+def test_historical_context_cached_per_date(mock_provider, tmp_path):
+    """Verify reruns for the same date reuse the cached context without provider calls."""
+    mock_provider.get_instrument_metadata.side_effect = NotImplementedError
+    mock_provider.get_earnings_estimates.return_value = None
+    cache_manager = CacheManager(str(tmp_path))
+    test_date = datetime(2024, 6, 1)
+
+    first = HistoricalDataFetcher(mock_provider, cache_manager=cache_manager).fetch_as_of_date(
+        "AAPL", test_date, lookback_days=365
+    )
+    # A fresh fetcher and cache instance read the context back from disk
+    second = HistoricalDataFetcher(
+        mock_provider, cache_manager=CacheManager(str(tmp_path))
+    ).fetch_as_of_date("AAPL", test_date, lookback_days=365)
+
+    assert mock_provider.get_stock_prices.call_count == 1
+    assert second.price_data == first.price_data
+    assert second.news == first.news
+    # The context file is never handed out as a price cache for later dates
+    assert cache_manager.get_historical_cache("AAPL", "2024-12-31") is None
+    assert (tmp_path / "AAPL_historical-context_2024-06-01_lookback365.json").exists()
+
+
+def test_historical_context_not_cached_for_today(mock_provider, tmp_path):
+    """Verify the still-moving current session is refetched instead of replayed."""
+    mock_provider.get_instrument_metadata.side_effect = NotImplementedError
+    mock_provider.get_earnings_estimates.return_value = None
+    fetcher = HistoricalDataFetcher(mock_provider, cache_manager=CacheManager(str(tmp_path)))
+
+    fetcher.fetch_as_of_date("AAPL", datetime.now(), lookback_days=365)
+    fetcher.fetch_as_of_date("AAPL", datetime.now(), lookback_days=365)
+
+    assert mock_provider.get_stock_prices.call_count == 2
+    assert not list(tmp_path.glob("AAPL_historical-context_*.json"))
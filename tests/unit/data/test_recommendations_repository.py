@@ -0,0 +1,129 @@
+"""Unit tests for RecommendationsRepository aggregate queries."""
+
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect
+
+from src.analysis import InvestmentSignal
+from src.analysis.models import ComponentScores, RiskAssessment
+from src.data.repository import RecommendationsRepository
+
+
+@pytest.fixture
+def rec_repo():
+    """Create a RecommendationsRepository instance with a temporary database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield RecommendationsRepository(Path(tmpdir) / "test.db")
+
+
+def make_signal(ticker: str, recommendation: str, confidence: float, analysis_date: date):
+    """Create a minimal InvestmentSignal for storage."""
+    return InvestmentSignal(
+        ticker=ticker,
+        name=f"{ticker} Inc.",
+        market="US",
+        current_price=100.0,
+        currency="USD",
+        scores=ComponentScores(technical=70.0, fundamental=70.0, sentiment=70.0),
+        final_score=70.0,
+        recommendation=recommendation,
+        confidence=confidence,
+        expected_return_min=5.0,
+        expected_return_max=15.0,
+        time_horizon="3M",
+        key_reasons=["Test reason"],
+        risk=RiskAssessment(
+            level="medium",
+            volatility="moderate",
+            volatility_pct=15.0,
+            liquidity="normal",
+            concentration_risk=False,
+        ),
+        generated_at=datetime.now(),
+        analysis_date=analysis_date.isoformat(),
+    )
+
+
+@pytest.fixture
+def stored_recommendations(rec_repo):
+    """Store recommendations across two sessions and several dates."""
+    rows = [
+        ("AAPL", "buy", 80.0, date(2025, 9, 1), 1),
+        ("MSFT", "buy", 65.0, date(2025, 9, 2), 1),
+        ("NVDA", "hold", 90.0, date(2025, 9, 3), 2),
+        ("GOOGL", "sell", 55.0, date(2025, 9, 3), 2),
+        ("TSLA", "buy", 99.0, date(2025, 10, 1), 2),  # Outside the September range
+    ]
+    for ticker, recommendation, confidence, analysis_date, session_id in rows:
+        rec_repo.store_recommendation(
+            make_signal(ticker, recommendation, confidence, analysis_date),
+            run_session_id=session_id,
+            analysis_mode="rule_based",
+        )
+    return rows
+
+
+@pytest.mark.usefixtures("stored_recommendations")
+class TestRecommendationAggregates:
+    """Test suite for counts and top-N queries computed in the database."""
+
+    def test_get_signal_counts(self, rec_repo):
+        """Test signals are counted per type within the inclusive date range."""
+        counts = rec_repo.get_signal_counts(date(2025, 9, 1), date(2025, 9, 3))
+
+        assert counts == {"buy": 2, "hold": 1, "sell": 1}
+        assert rec_repo.get_signal_counts(date(2025, 9, 1), date(2025, 9, 30), "llm") == {}
+
+    def test_get_top_by_confidence(self, rec_repo):
+        """Test the most confident recommendations are returned in order."""
+        top = rec_repo.get_top_by_confidence(date(2025, 9, 1), date(2025, 9, 30), limit=2)
+
+        assert [rec["ticker"] for rec in top] == ["NVDA", "AAPL"]
+        assert top[0]["recommendation"] == "hold"
+        assert top[0]["analysis_date"] == "2025-09-03"
+
+    def test_get_recommendation_counts_by_session(self, rec_repo):
+        """Test recommendations are counted per session in one query."""
+        counts = rec_repo.get_recommendation_counts_by_session([1, 2, 3])
+
+        assert counts == {1: 2, 2: 3}
+        assert len(rec_repo.get_recommendations_by_session(2)) == counts[2]
+        assert rec_repo.get_recommendation_counts_by_session([]) == {}
+
+    def test_get_recommendations_by_date_range(self, rec_repo):
+        """Test range queries are ordered by analysis date and limited in SQL."""
+        recs = rec_repo.get_recommendations_by_date_range(date(2025, 9, 1), date(2025, 9, 30))
+
+        assert [rec["ticker"] for rec in recs] == ["AAPL", "MSFT", "NVDA", "GOOGL"]
+        assert recs[0]["current_price"] == 100.0
+        limited = rec_repo.get_recommendations_by_date_range(
+            date(2025, 9, 1), date(2025, 12, 31), limit=2
+        )
+        assert [rec["ticker"] for rec in limited] == ["AAPL", "MSFT"]
+
+    def test_iter_recommendations_by_date_range(self, rec_repo):
+        """Test recommendations are streamed across several fetch batches."""
+        recs = rec_repo.iter_recommendations_by_date_range(
+            date(2025, 9, 1), date(2025, 12, 31), batch_size=2
+        )
+
+        assert next(recs)["ticker"] == "AAPL"
+        assert [rec["analysis_date"] for rec in recs] == [
+            "2025-09-02",
+            "2025-09-03",
+            "2025-09-03",
+            "2025-10-01",
+        ]
+
+    def test_signal_types_filter(self, rec_repo):
+        """Test several signal types are filtered in SQL on the indexed columns."""
+        recs = rec_repo.get_recommendations_by_date_range(
+            date(2025, 9, 1), date(2025, 12, 31), signal_types=("buy", "strong_buy")
+        )
+
+        assert [rec["ticker"] for rec in recs] == ["AAPL", "MSFT", "TSLA"]
+        indexes = inspect(rec_repo.db_manager.engine).get_indexes("recommendations")
+        assert "idx_recommendations_date_signal" in {index["name"] for index in indexes}
@@ -1,5 +1,6 @@
 """Unit tests for UnifiedAnalysisOrchestrator."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -96,6 +97,37 @@ class TestUnifiedAnalysisOrchestrator:
         assert "sentiment" in result["analysis"]
         assert "synthesis" in result["analysis"]
 
+    def test_analyze_instrument_rule_based_runs_modules_concurrently(self):
+        """Test the three analysis modules run at the same time before synthesis."""
+        orchestrator = UnifiedAnalysisOrchestrator(llm_mode=False)
+
+        # Each module waits for the other two; a serial run would break the barrier
+        barrier = threading.Barrier(3, timeout=5)
+
+        def execute(score_key):
+            def _execute(*_args):
+                barrier.wait()
+                return {score_key: 60}
+
+            return _execute
+
+        orchestrator.technical_agent = Mock()
+        orchestrator.technical_agent.execute = Mock(side_effect=execute("technical_score"))
+        orchestrator.fundamental_agent = Mock()
+        orchestrator.fundamental_agent.execute = Mock(side_effect=execute("fundamental_score"))
+        orchestrator.sentiment_agent = Mock()
+        orchestrator.sentiment_agent.execute = Mock(side_effect=execute("sentiment_score"))
+        orchestrator.signal_synthesizer = Mock()
+        orchestrator.signal_synthesizer.execute = Mock(return_value={"recommendation": "hold"})
+
+        result = orchestrator.analyze_instrument("AAPL")
+
+        assert result["status"] == "success"
+        context = orchestrator.signal_synthesizer.execute.call_args.args[1]
+        assert context["technical_score"] == 60
+        assert context["fundamental_score"] == 60
+        assert context["sentiment_score"] == 60
+
     def test_analyze_instrument_rule_based_error(self):
         """Test analyzing instrument handles errors gracefully."""
         orchestrator = UnifiedAnalysisOrchestrator(llm_mode=False)